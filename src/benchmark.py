@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import platform
+from datetime import datetime
+from typing import Dict, List
+
+import pandas as pd
+
+from benchmark_ingest import (benchmark_identification, benchmark_representation, benchmark_slot_parsing,
+                              benchmark_streaming)
+from benchmark_placement import benchmark_grouping, benchmark_multi_start, benchmark_occupancy, benchmark_roster
+from elimination import person_background_check, check_eligibility, rejection_reasons, apply_eligibility
+from group_manager import initial_grouping, remove_subset_groups, merge_groups_by_members, cluster_friendship_groups
+from identification import human_identification
+from placement import place_groups, optimize_placements
+from profiler import PipelineProfiler
+from solver import exact_placement
+from synthetic import generate_responses, synthetic_capacity
+from slot_config import SLOT_CONFIG
+
+# Constants
+DATA_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data',
+                              "Bounsailing Güz'24 _ 1_ ve 2_ Eğitim Başvuru Formu (Yanıtlar) - Form Yanıtları 1.csv")
+SLOT_CAPACITY = SLOT_CONFIG.capacity()
+
+
+def benchmark_pipeline(sizes=(1_000, 10_000, 100_000), legacy_limit: int = 2_000, seed: int = 0,
+                       time_budget: float = 2.0) -> List[Dict[str, object]]:
+    """
+    Measure every pipeline stage on synthetic response sheets of growing size.
+
+    The quadratic legacy grouping and optimize_placements are only measured up to legacy_limit.
+
+    Args:
+        sizes (Iterable[int]): Numbers of synthetic responses.
+        legacy_limit (int): Largest size the legacy stages are measured on.
+        seed (int): Seed of the synthetic generator.
+        time_budget (float): Time limit of the exact solver in seconds.
+
+    Returns:
+        List[Dict[str, object]]: One profiler report per size.
+    """
+    results = []
+    for size in sizes:
+        profiler = PipelineProfiler(trace_memory=True)
+        slot_capacity = synthetic_capacity(size)
+
+        with profiler.stage('generate_responses', rows=size):
+            data = generate_responses(size, seed=seed)
+        with profiler.stage('identification', rows=size) as record:
+            people = human_identification(data)
+            record['outputs']['people'] = len(people)
+        with profiler.stage('eligibility', rows=size) as record:
+            people = apply_eligibility(people, rejection_reasons(check_eligibility(data)))
+            record['outputs']['people'] = len(people)
+        with profiler.stage('person_background_check', people=len(people)) as record:
+            people = person_background_check(people)
+            record['outputs']['people'] = len(people)
+        with profiler.stage('cluster_friendship_groups', people=len(people)) as record:
+            groups = cluster_friendship_groups(people)
+            record['outputs']['groups'] = len(groups)
+
+        if size <= legacy_limit:
+            with profiler.stage('initial_grouping', people=len(people)) as record:
+                initial_groups = initial_grouping(people)
+                record['outputs']['groups'] = len(initial_groups)
+            with profiler.stage('remove_subset_groups', groups=len(initial_groups)) as record:
+                subset_free = remove_subset_groups(initial_groups)
+                record['outputs']['groups'] = len(subset_free)
+            with profiler.stage('merge_groups_by_members', groups=len(subset_free)) as record:
+                record['outputs']['groups'] = len(merge_groups_by_members(subset_free))
+            with profiler.stage('optimize_placements', groups=len(groups)) as record:
+                best_placement = optimize_placements(groups, {slot: 0 for slot in slot_capacity}, slot_capacity)
+                record['outputs']['placed_groups'] = len(best_placement)
+
+        with profiler.stage('place_groups', groups=len(groups)) as record:
+            df_first_round, df_second_round = place_groups(groups, {slot: 0 for slot in slot_capacity}, slot_capacity)
+            record['outputs']['placed_groups'] = len(df_first_round) + len(df_second_round)
+        with profiler.stage('exact_placement', groups=len(groups)) as record:
+            _, report = exact_placement(groups, {slot: 0 for slot in slot_capacity}, slot_capacity,
+                                        time_budget=time_budget)
+            record['outputs'].update(placed_people=report['placed_people'], gap=report['gap'])
+
+        results.append({'size': size, **profiler.report()})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the BounSailing pipeline.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help="Synthetic applicant counts to be measured.")
+    parser.add_argument('--legacy-limit', type=int, default=2_000,
+                        help="Largest size the quadratic legacy stages are measured on.")
+    parser.add_argument('--output', default='benchmark_results.json', help="Where the JSON results are written.")
+    parser.add_argument('--micro', action='store_true', help="Also run the single-stage micro benchmarks.")
+    args = parser.parse_args()
+
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'pipeline': benchmark_pipeline(args.sizes, args.legacy_limit)
+    }
+
+    if args.micro:
+        data = pd.read_csv(DATA_FILE_PATH)
+        groups = cluster_friendship_groups(person_background_check(human_identification(data)))
+        results['micro'] = {
+            'identification': [benchmark_identification(data, scale=scale) for scale in (1, 10, 100)],
+            'representation': benchmark_representation(),
+            'grouping': benchmark_grouping(),
+            'multi_start': benchmark_multi_start(groups, SLOT_CAPACITY),
+            'roster': benchmark_roster(),
+            'occupancy': benchmark_occupancy(),
+            'slot_parsing': benchmark_slot_parsing(),
+            'streaming': benchmark_streaming()
+        }
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, ensure_ascii=False)
+    print(f"Results written to {args.output}")
@@ -0,0 +1,205 @@
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List
+
+import pandas as pd
+
+from elimination import check_eligibility, rejection_reasons
+from identification import human_identification, human_identification_rowwise
+from loading import load_data
+from profiler import time_call
+from schemas import Group
+from slot_config import SlotConfig, DEFAULT_CONFIG_PATH
+from streaming import stream_applicants
+from synthetic import generate_responses, synthetic_people
+
+
+def benchmark_identification(data: pd.DataFrame, scale: int = 1, repeat: int = 3) -> Dict[str, float]:
+    """
+    Compare the vectorized identification against the row-wise loop.
+
+    Args:
+        data (pd.DataFrame): Raw application data.
+        scale (int): How many times the data is repeated to simulate larger archives.
+        repeat (int): How many times each implementation is run.
+
+    Returns:
+        Dict[str, float]: Timings of both implementations and the speedup.
+    """
+    if scale > 1:
+        data = pd.concat([data] * scale, ignore_index=True)
+        # Give every copy its own student numbers so that no entry is overwritten
+        data['Öğrenci Numarası'] = data['Öğrenci Numarası'] + data.index // (len(data) // scale) * 10 ** 10
+
+    rowwise = time_call(human_identification_rowwise, data, repeat=repeat)
+    vectorized = time_call(human_identification, data, repeat=repeat)
+
+    return {
+        'rows': len(data),
+        'rowwise_seconds': rowwise,
+        'vectorized_seconds': vectorized,
+        'speedup': rowwise / vectorized if vectorized else float('inf')
+    }
+
+
+def benchmark_representation(count: int = 100_000, group_size: int = 3) -> Dict[str, float]:
+    """
+    Measure construction time and memory of Human and Group objects.
+
+    Args:
+        count (int): Number of synthetic applicants.
+        group_size (int): Number of consecutive applicants put into one group.
+
+    Returns:
+        Dict[str, float]: Construction times and traced memory per object.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    people = synthetic_people(count)
+    people_seconds = time.perf_counter() - start
+    people_bytes = tracemalloc.get_traced_memory()[0]
+
+    members = list(people.values())
+    start = time.perf_counter()
+    groups = [Group(members=members[index:index + group_size]) for index in range(0, count, group_size)]
+    groups_seconds = time.perf_counter() - start
+    groups_bytes = tracemalloc.get_traced_memory()[0] - people_bytes
+    tracemalloc.stop()
+
+    return {
+        'applicants': count,
+        'groups': len(groups),
+        'people_seconds': people_seconds,
+        'groups_seconds': groups_seconds,
+        'bytes_per_applicant': people_bytes / count,
+        'bytes_per_group': groups_bytes / len(groups)
+    }
+
+
+def synthetic_slot_config(locations: int) -> SlotConfig:
+    """
+    Build a slot configuration with the configured days and periods at many locations.
+
+    Args:
+        locations (int): Number of locations, every one offers all day and period combinations.
+
+    Returns:
+        SlotConfig: The compiled configuration with locations x days x periods slots.
+    """
+    with open(DEFAULT_CONFIG_PATH, encoding='utf-8') as file:
+        config = json.load(file)
+    config['locations'] = [{'name': f"Iskele{location}", 'aliases': [f"Pier{location}"]} for location in range(locations)]
+    config['slots'] = [{'code': (location + 1) * 100 + day['number'] * 10 + period['number'], 'day': day['number'],
+                        'period': period['number'], 'location': f"Iskele{location}", 'capacity': 10}
+                       for location in range(locations) for day in config['days'] for period in config['periods']]
+    # The term and level quotas refer to the configured slot codes, which the catalogue replaces
+    config.pop('terms', None)
+    config.pop('levels', None)
+    return SlotConfig(config)
+
+
+def drifted_slot_labels(config: SlotConfig, count: int, seed: int = 0) -> List[str]:
+    """
+    Create slot labels in the canonical format and in drifted formats of other form versions.
+
+    Args:
+        config (SlotConfig): Configuration the labels refer to.
+        count (int): Number of labels.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        List[str]: Labels with upper case, English day names, 'Slot N' tokens and HH:MM times mixed in.
+    """
+    rng = random.Random(seed)
+    english = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    keys = list(config.codes)
+    labels = []
+    for _ in range(count):
+        day, period, location = rng.choice(keys)
+        start, end = config.periods[period]
+        variant = rng.randrange(4)
+        if variant == 0:
+            label = f"{config.days[day]} - {period}.Slot - {start} - {end}"
+        elif variant == 1:
+            label = f"{config.days[day].upper()} {period}. slot ({start.replace('.', ':')}-{end.replace('.', ':')})"
+        elif variant == 2:
+            label = f"{english[day - 1]} Slot {period}"
+        else:
+            label = f"{english[day - 1][:3]} {int(start.split('.')[0]):02d}:00"
+        labels.append(label if location is None else f"{label} - {location}")
+    return labels
+
+
+def benchmark_slot_parsing(location_counts=(1, 10, 100), count: int = 20_000) -> List[Dict[str, float]]:
+    """
+    Measure slot label parsing while the catalogue grows.
+
+    Args:
+        location_counts (Iterable[int]): Location counts of the synthetic catalogues.
+        count (int): Number of labels parsed per catalogue.
+
+    Returns:
+        List[Dict[str, float]]: Slot count, parse time per distinct label without the memo and per
+        label with it, and the share of labels that resolved to a slot.
+    """
+    results = []
+    for locations in location_counts:
+        config = synthetic_slot_config(locations)
+        labels = drifted_slot_labels(config, count)
+        distinct = list(dict.fromkeys(labels))
+
+        start = time.perf_counter()
+        parsed = [config._parse(label) for label in distinct]
+        cold_seconds = time.perf_counter() - start
+        config.parse_slots(','.join(labels))
+        warm_seconds = time_call(config.parse_slots, ','.join(labels))
+
+        results.append({
+            'slots': len(config.codes),
+            'distinct_labels': len(distinct),
+            'microseconds_per_distinct_label': cold_seconds / len(distinct) * 1e6,
+            'microseconds_per_label': warm_seconds / count * 1e6,
+            'resolved_share': sum(code is not None for code in parsed) / len(distinct)
+        })
+    return results
+
+
+def benchmark_streaming(sizes=(100_000, 400_000), chunksize: int = 10_000, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Compare the traced memory peak of streaming ingestion with reading the whole CSV at once.
+
+    The whole-file path is what 'main.py ingest' runs on a cache miss: read the CSV, identify the
+    applicants and evaluate the eligibility rules. The streaming path is 'main.py ingest --stream'.
+
+    Args:
+        sizes (Iterable[int]): Numbers of synthetic responses written to a temporary CSV.
+        chunksize (int): Rows per chunk of the streaming path.
+        seed (int): Seed of the response generator.
+
+    Returns:
+        List[Dict[str, float]]: Per size the CSV size and the peak and time of both paths.
+    """
+    def whole_file(file_path: str):
+        data = load_data(file_path)
+        return human_identification(data), rejection_reasons(check_eligibility(data))
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            csv_path = os.path.join(directory, f'responses_{size}.csv')
+            generate_responses(size, seed=seed).to_csv(csv_path, index=False)
+
+            row = {'responses': size, 'csv_megabytes': os.path.getsize(csv_path) / 1e6}
+            for name, load in (('whole_file', whole_file), ('streaming', lambda path: stream_applicants(path, chunksize))):
+                tracemalloc.start()
+                start = time.perf_counter()
+                load(csv_path)
+                row[f'{name}_seconds'] = time.perf_counter() - start
+                row[f'{name}_peak_megabytes'] = tracemalloc.get_traced_memory()[1] / 1e6
+                tracemalloc.stop()
+            results.append(row)
+    return results
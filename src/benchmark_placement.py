@@ -0,0 +1,221 @@
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from group_manager import initial_grouping, remove_subset_groups, merge_groups_by_members, cluster_friendship_groups
+from local_search import multi_start_placement
+from occupancy import eligibility_matrix, size_vector, capacity_vector, first_fit, evaluate_assignments, columns_to_slots
+from profiler import time_call
+from result import PlacementResult
+from schemas import Group, Human
+from slot_config import SLOT_CONFIG
+from synthetic import synthetic_people, synthetic_placement
+
+
+def legacy_grouping(people: Dict[int, Human]) -> List[Group]:
+    """
+    Run the original three-stage grouping pipeline.
+
+    Args:
+        people (Dict[int, Human]): Dictionary where keys are student numbers and values are Human objects.
+
+    Returns:
+        List[Group]: Groups after subset removal and merging.
+    """
+    return merge_groups_by_members(remove_subset_groups(initial_grouping(people)))
+
+
+def benchmark_grouping(sizes=(1_000, 10_000, 100_000, 1_000_000), legacy_limit: int = 5_000) -> List[Dict[str, float]]:
+    """
+    Measure the union-find clustering on growing synthetic applicant pools.
+
+    Args:
+        sizes (Iterable[int]): Applicant counts to be measured.
+        legacy_limit (int): Largest applicant count the quadratic pipeline is measured on.
+
+    Returns:
+        List[Dict[str, float]]: Timings per applicant count.
+    """
+    results = []
+    for size in sizes:
+        people = synthetic_people(size)
+        result = {'applicants': size, 'clustering_seconds': time_call(cluster_friendship_groups, people, repeat=1)}
+        if size <= legacy_limit:
+            result['legacy_seconds'] = time_call(legacy_grouping, people, repeat=1)
+        results.append(result)
+    return results
+
+
+def benchmark_multi_start(groups: List[Group], slot_capacity: Dict[int, int], worker_counts=(1, 2, 4),
+                          time_budget: float = 2.0) -> List[Dict[str, float]]:
+    """
+    Measure multi-start local search throughput and quality for growing worker counts.
+
+    Args:
+        groups (List[Group]): Groups to place.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        worker_counts (Iterable[int]): Worker counts to be measured.
+        time_budget (float): Search time per worker in seconds.
+
+    Returns:
+        List[Dict[str, float]]: The placement report per worker count.
+    """
+    results = []
+    for workers in worker_counts:
+        _, report = multi_start_placement(groups, {slot: 0 for slot in slot_capacity}, slot_capacity,
+                                          workers=workers, time_budget=time_budget)
+        results.append(report)
+    return results
+
+
+def dict_first_fit(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int]) -> List[Optional[int]]:
+    """
+    Run the first placement round the way place_groups did before the batched feasibility checks.
+
+    Args:
+        groups (List[Group]): Groups to place.
+        slots (Dict[int, int]): Current occupancy per slot, updated in place.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    assignment = []
+    for group in groups:
+        chosen = None
+        for preferred_slot in group.COURSE_SLOTS:
+            if slots[preferred_slot] + len(group.MEMBERS) <= slot_capacity[preferred_slot]:
+                slots[preferred_slot] += len(group.MEMBERS)
+                chosen = preferred_slot
+                break
+        assignment.append(chosen)
+    return assignment
+
+
+def dict_evaluate(assignments: List[List[Optional[int]]], groups: List[Group], slot_capacity: Dict[int, int]) -> List[int]:
+    """
+    Count the placed people of every candidate assignment with dictionaries, rejecting infeasible ones.
+
+    Args:
+        assignments (List[List[Optional[int]]]): Slot number per group for every candidate.
+        groups (List[Group]): Groups the candidates place.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+
+    Returns:
+        List[int]: Placed people per candidate, -1 for infeasible candidates.
+    """
+    results = []
+    for assignment in assignments:
+        load = {}
+        feasible = True
+        for group, slot in zip(groups, assignment):
+            if slot is not None:
+                feasible = feasible and slot in group.COURSE_SLOTS
+                load[slot] = load.get(slot, 0) + len(group.MEMBERS)
+        feasible = feasible and all(people <= slot_capacity.get(slot, 0) for slot, people in load.items())
+        results.append(sum(load.values()) if feasible else -1)
+    return results
+
+
+def benchmark_occupancy(sizes=(10_000, 100_000, 1_000_000), candidates: int = 32, seed: int = 0) -> List[Dict[str, float]]:
+    """
+    Measure the batched first-fit and candidate evaluation against the dictionary loops.
+
+    Capacities are scaled with the number of groups, so slots fill up during the run.
+
+    Args:
+        sizes (Iterable[int]): Applicant counts to be measured.
+        candidates (int): Number of candidate assignments evaluated at once.
+        seed (int): Seed of the candidate generator.
+
+    Returns:
+        List[Dict[str, float]]: Timings per applicant count.
+    """
+    rng = np.random.default_rng(seed)
+    results = []
+    for size in sizes:
+        groups = cluster_friendship_groups(synthetic_people(size))
+        slot_capacity = {slot: capacity * len(groups) // 200 for slot, capacity in SLOT_CONFIG.capacity().items()}
+
+        start = time.perf_counter()
+        dict_first_fit(groups, {slot: 0 for slot in slot_capacity}, slot_capacity)
+        dict_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        eligibility, group_sizes, remaining = eligibility_matrix(groups), size_vector(groups), capacity_vector(slot_capacity)
+        assignment = first_fit(eligibility, group_sizes, remaining)
+        batched_seconds = time.perf_counter() - start
+
+        # Candidates drop random groups from the first-fit assignment, one also moves a group to a slot it cannot attend
+        batch = np.where(rng.random((candidates, len(groups))) < 0.1, -1, assignment[None, :])
+        batch[0, int(np.argmax(~eligibility[:, 0]))] = 0
+        candidate_slots = [columns_to_slots(row) for row in batch]
+        start = time.perf_counter()
+        dict_evaluate(candidate_slots, groups, slot_capacity)
+        dict_evaluate_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        evaluate_assignments(batch, group_sizes, eligibility, remaining)
+        batched_evaluate_seconds = time.perf_counter() - start
+
+        results.append({
+            'applicants': size,
+            'groups': len(groups),
+            'dict_first_fit_seconds': dict_seconds,
+            'batched_first_fit_seconds': batched_seconds,
+            'dict_evaluate_seconds': dict_evaluate_seconds,
+            'batched_evaluate_seconds': batched_evaluate_seconds
+        })
+    return results
+
+
+def legacy_roster(placement: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the slot-by-group roster the way display_result did before PlacementResult.
+
+    Args:
+        placement (pd.DataFrame): Placement dataframe in the place_groups format.
+
+    Returns:
+        pd.DataFrame: One column per slot with the member name lists of its groups.
+    """
+    data = {}
+    for index, row in placement.iterrows():
+        if row['slot'] in data.keys():
+            data[row['slot']].append(row['group'])
+        else:
+            data[row['slot']] = [row['group']]
+
+    max_len = max(len(groups) for groups in data.values())
+    for slot in data:
+        while len(data[slot]) < max_len:
+            data[slot].append('')
+    return pd.DataFrame(data)
+
+
+def benchmark_roster(sizes=(1_000, 10_000, 100_000), legacy_limit: int = 10_000) -> List[Dict[str, float]]:
+    """
+    Compare the iterrows roster of the old display_result with the columnar PlacementResult pivot.
+
+    Args:
+        sizes (Iterable[int]): Numbers of placed groups to be measured.
+        legacy_limit (int): Largest size the iterrows roster is measured on.
+
+    Returns:
+        List[Dict[str, float]]: Timings per size.
+    """
+    results = []
+    for size in sizes:
+        placement = synthetic_placement(size)
+        result = PlacementResult.from_placements(placement)
+        row = {
+            'groups': size,
+            'applicants': len(result.frame),
+            'columnar_build_seconds': time_call(PlacementResult.from_placements, placement),
+            'columnar_roster_seconds': time_call(result.roster)
+        }
+        if size <= legacy_limit:
+            row['legacy_roster_seconds'] = time_call(legacy_roster, placement)
+        results.append(row)
+    return results
@@ -0,0 +1,218 @@
+import hashlib
+import os
+import pickle
+from typing import Dict, List, Tuple
+
+import elimination
+import group_manager
+from loading import load_data
+from schemas import Group, Human
+from slot_config import SLOT_CONFIG
+
+# Bump when the pickled layout of Human or Group changes
+CACHE_VERSION = 2
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.cache')
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Modules whose code shapes every stage, the cached Human and Group objects are built by them
+PARSING_SOURCES = ('loading.py', 'identification.py', 'schemas.py')
+
+
+def file_hash(file_path: str) -> str:
+    """
+    Hash the content of a file.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def combine_keys(*parts: str) -> str:
+    """
+    Combine several key parts into one short cache key.
+
+    Args:
+        *parts (str): Key parts such as content hashes.
+
+    Returns:
+        str: Hex digest identifying the combination.
+    """
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+
+def source_key(*file_names: str) -> str:
+    """
+    Hash the source files of the modules a cache stage depends on.
+
+    Args:
+        *file_names (str): File names of modules in the source directory.
+
+    Returns:
+        str: Cache key identifying the content of the modules.
+    """
+    return combine_keys(*(file_hash(os.path.join(SOURCE_DIR, file_name)) for file_name in file_names))
+
+
+class PipelineCache:
+    """
+    On-disk cache of parsed applicants and final groups keyed by the input CSV content.
+
+    Every stage depends on the CSV content and on the code that reads it and defines Human and Group.
+    The people stage additionally depends on the compiled slot configuration and the rejections stage
+    on the eligibility rules. The groups stage depends on both and on the grouping code, so changing
+    a rule never invalidates the parsed applicants. An entry that cannot be read is recomputed.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        """
+        Args:
+            cache_dir (str): Directory the cache files are written to.
+        """
+        self.cache_dir = cache_dir
+        self.stats: Dict[str, Dict[str, int]] = {'people': {'hits': 0, 'misses': 0},
+                                                 'rejections': {'hits': 0, 'misses': 0},
+                                                 'groups': {'hits': 0, 'misses': 0}}
+        self.slots_key = SLOT_CONFIG.fingerprint()
+        self.parsing_key = source_key(*PARSING_SOURCES)
+        self.eligibility_key = source_key('elimination.py')
+        self.rules_key = combine_keys(self.eligibility_key, source_key('group_manager.py'))
+
+    def people_key(self, file_path: str) -> str:
+        """
+        Build the key of the people stage.
+
+        Args:
+            file_path (str): Path to the responses CSV.
+
+        Returns:
+            str: Cache key of the parsed applicants.
+        """
+        return combine_keys(str(CACHE_VERSION), file_hash(file_path), self.parsing_key, self.slots_key)
+
+    def rejections_key(self, file_path: str) -> str:
+        """
+        Build the key of the rejections stage.
+
+        Args:
+            file_path (str): Path to the responses CSV.
+
+        Returns:
+            str: Cache key of the rejection reasons.
+        """
+        return combine_keys(str(CACHE_VERSION), file_hash(file_path), self.parsing_key, self.eligibility_key)
+
+    def load_people(self, file_path: str) -> Dict[int, Human]:
+        """
+        Load the parsed applicants of a CSV, parsing it only when the cache is stale.
+
+        Args:
+            file_path (str): Path to the responses CSV.
+
+        Returns:
+            Dict[int, Human]: Dictionary where keys are student numbers and values are Human objects.
+        """
+        return self._load_people(self.people_key(file_path), file_path)
+
+    def load_rejections(self, file_path: str) -> Dict[int, str]:
+        """
+        Load the rejection reasons of the eligibility rules, evaluating them only when the cache is stale.
+
+        Args:
+            file_path (str): Path to the responses CSV.
+
+        Returns:
+            Dict[int, str]: Rejection reason per ineligible student number.
+        """
+        return self._load_rejections(self.rejections_key(file_path), file_path)
+
+    def load_groups(self, file_path: str) -> Tuple[Dict[int, Human], List[Group]]:
+        """
+        Load the eligible applicants and final groups of a CSV, rebuilding only stale stages.
+
+        Args:
+            file_path (str): Path to the responses CSV.
+
+        Returns:
+            Tuple[Dict[int, Human], List[Group]]: Eligible applicants and their groups.
+        """
+        people_key = self.people_key(file_path)
+        groups_key = combine_keys(people_key, self.rules_key)
+
+        cached = self._read('groups', groups_key)
+        if cached is not None:
+            self.stats['groups']['hits'] += 1
+            return cached
+
+        self.stats['groups']['misses'] += 1
+        people = self._load_people(people_key, file_path)
+        people = elimination.apply_eligibility(people, self._load_rejections(self.rejections_key(file_path), file_path))
+        people = elimination.person_background_check(people)
+        groups = group_manager.cluster_friendship_groups(people)
+        self._write('groups', groups_key, (people, groups))
+        return people, groups
+
+    def clear(self) -> None:
+        """
+        Remove every cache file.
+        """
+        if os.path.isdir(self.cache_dir):
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, file_name))
+
+    def _load_people(self, people_key: str, file_path: str) -> Dict[int, Human]:
+        cached = self._read('people', people_key)
+        if cached is not None:
+            self.stats['people']['hits'] += 1
+            return cached
+
+        self.stats['people']['misses'] += 1
+        # pandas is only imported when the CSV really has to be parsed
+        from identification import human_identification
+        data = load_data(file_path)
+        people = human_identification(data)
+        self._write('people', people_key, people)
+        # The rules read the same table, so evaluate them while it is loaded
+        self._write('rejections', self.rejections_key(file_path),
+                    elimination.rejection_reasons(elimination.check_eligibility(data)))
+        return people
+
+    def _load_rejections(self, rejections_key: str, file_path: str) -> Dict[int, str]:
+        cached = self._read('rejections', rejections_key)
+        if cached is not None:
+            self.stats['rejections']['hits'] += 1
+            return cached
+
+        self.stats['rejections']['misses'] += 1
+        rejections = elimination.rejection_reasons(elimination.check_eligibility(load_data(file_path)))
+        self._write('rejections', rejections_key, rejections)
+        return rejections
+
+    def _path(self, stage: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{stage}-{key}.pkl")
+
+    def _read(self, stage: str, key: str):
+        # A truncated file or one pickled by older code can fail in many ways, any of them is a miss
+        try:
+            with open(self._path(stage, key), 'rb') as file:
+                payload = pickle.load(file)
+            if payload.get('version') != CACHE_VERSION or payload.get('key') != key:
+                return None
+            return payload['data']
+        except Exception:
+            return None
+
+    def _write(self, stage: str, key: str, data) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so that an interrupted run never leaves a broken entry
+        temporary_path = self._path(stage, key) + '.tmp'
+        with open(temporary_path, 'wb') as file:
+            pickle.dump({'version': CACHE_VERSION, 'key': key, 'data': data}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self._path(stage, key))
@@ -0,0 +1,132 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from schemas import Group
+
+REASONS = {
+    'empty_slot_intersection': "The members have no slot in common",
+    'closed_slots': "Every common slot has a capacity of 0",
+    'too_large': "The group is larger than the capacity of every common slot",
+    'slots_full': "Every common slot is already full",
+    'room_left': "A common slot still has room for the group, the placement engine left it out",
+}
+
+
+def slot_occupancy(groups: List[Group], assignment: List[Optional[int]]) -> Dict[int, int]:
+    """
+    Count the placed people per slot.
+
+    Args:
+        groups (List[Group]): Final groups.
+        assignment (List[Optional[int]]): Slot number per group, None for unplaced groups.
+
+    Returns:
+        Dict[int, int]: Placed people per slot number.
+    """
+    occupancy: Dict[int, int] = {}
+    for group, slot in zip(groups, assignment):
+        if slot is not None:
+            occupancy[slot] = occupancy.get(slot, 0) + len(group.MEMBERS)
+    return occupancy
+
+
+def explain_unplaced(groups: List[Group], assignment: List[Optional[int]],
+                     slot_capacity: Dict[int, int]) -> List[Dict[str, object]]:
+    """
+    Explain why every unplaced group has no slot and which capacity change would admit it.
+
+    Only the final occupancy and the groups' own slots are looked up, no placement is re-run,
+    so the cost is linear in the number of unplaced groups times their slot count.
+
+    Args:
+        groups (List[Group]): Final groups, sorted by APPLY_DATE.
+        assignment (List[Optional[int]]): Slot number per group, None for unplaced groups.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+
+    Returns:
+        List[Dict[str, object]]: One explanation per unplaced group with its members, size, reason
+        code (see REASONS), and the slot and capacity increase of the smallest change that admits
+        the group. The change is None for groups without a common slot and has an increase of 0
+        for groups that already fit into a common slot.
+    """
+    occupancy = slot_occupancy(groups, assignment)
+
+    explanations = []
+    for group, slot in zip(groups, assignment):
+        if slot is not None:
+            continue
+        size = len(group.MEMBERS)
+        explanation = {
+            'members': [member.FULLNAME for member in group.MEMBERS],
+            'size': size,
+            'apply_date': group.APPLY_DATE,
+            'reason': 'empty_slot_intersection',
+            'slot': None,
+            'capacity_increase': None
+        }
+
+        if group.COURSE_SLOTS:
+            largest = max(slot_capacity.get(course_slot, 0) for course_slot in group.COURSE_SLOTS)
+            # The smallest increase of a single slot's capacity that makes room for the whole group
+            increase, course_slot = min(
+                (occupancy.get(course_slot, 0) + size - slot_capacity.get(course_slot, 0), course_slot)
+                for course_slot in group.COURSE_SLOTS)
+            if largest == 0:
+                explanation['reason'] = 'closed_slots'
+            elif size > largest:
+                explanation['reason'] = 'too_large'
+            elif increase > 0:
+                explanation['reason'] = 'slots_full'
+            else:
+                # The group fits as is, e.g. after a heuristic engine left room or the occupancy changed
+                explanation['reason'] = 'room_left'
+            explanation['capacity_increase'], explanation['slot'] = max(increase, 0), course_slot
+
+        explanations.append(explanation)
+
+    return explanations
+
+
+def placement_assignment(groups: List[Group], placements: 'pd.DataFrame') -> List[Optional[int]]:
+    """
+    Recover the slot of every group from a placement dataframe in the place_groups format.
+
+    Groups are matched by their members' student numbers, see placement_log.group_key, so
+    applicants sharing a name cannot swap slots.
+
+    Args:
+        groups (List[Group]): Final groups the placement was made from.
+        placements (pd.DataFrame): One row per placed group with the student numbers of its members
+            in the std_numbers column, the slot and apply date.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    from placement_log import group_key
+
+    if placements is None or placements.empty:
+        return [None] * len(groups)
+    slot_of = dict(zip(map(tuple, placements['std_numbers']), placements['slot'].astype(int).tolist()))
+    return [slot_of.get(group_key(group)) for group in groups]
+
+
+def print_explanations(explanations: List[Dict[str, object]]) -> None:
+    """
+    Print the explanations of explain_unplaced with a summary per reason.
+
+    Args:
+        explanations (List[Dict[str, object]]): Result of explain_unplaced.
+    """
+    for explanation in explanations:
+        line = f"{', '.join(explanation['members'])}: {REASONS[explanation['reason']]}"
+        if explanation['slot'] is not None and explanation['capacity_increase'] > 0:
+            line += f"; raising slot {explanation['slot']} by {explanation['capacity_increase']} would admit it"
+        elif explanation['slot'] is not None:
+            line += f" (slot {explanation['slot']})"
+        print(line)
+
+    for reason, count in Counter(explanation['reason'] for explanation in explanations).most_common():
+        print(f"{count} groups: {REASONS[reason]}")
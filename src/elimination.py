@@ -1,3 +1,23 @@
+import warnings
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from loading import STD_NUMBER_COLUMN, TIMESTAMP_COLUMN, kept_submissions
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns of the application form export the eligibility rules read, see find_column
+COURSE_COLUMN = 'Başvurduğunuz Eğitim'
+SWIMMING_COLUMN = 'Yüzme biliyor musunuz?'
+# The rest of the header names the fee and the treasurer's bank account, which change between terms
+DEPOSIT_COLUMN = 'Lütfen kapora ödemenizin'
+THEORY_COLUMN = ('En son teorik eğitiminizi hangi dönem tamamladınız?\n'
+                 '(Lütfen 2 yıldız eğitimine başvuruyorsanız cevaplayın.)')
+PRACTICE_COLUMN = ('En son pratik eğitiminizi hangi dönem tamamladınız?\n'
+                   '(Lütfen 2 yıldız eğitimine başvuruyorsanız cevaplayın.)')
+ADVANCED_COURSE = '2* İleri Yelken Eğitimi'
+
+
 def person_background_check(people: dict) -> dict:
     """
     Filters out people from the dictionary based on membership status and course-related criteria.
@@ -24,3 +44,218 @@ def person_background_check(people: dict) -> dict:
         filtered_people[person_id] = person_data
 
     return filtered_people
+
+
+def is_latest_submission(data: 'pd.DataFrame', context: dict) -> 'pd.Series':
+    """
+    Only the latest submission of a student number counts, see loading.kept_submissions.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        context (dict): Rule context of check_eligibility, not used.
+
+    Returns:
+        pd.Series: True for the latest submission of every student number.
+    """
+    return kept_submissions(data)
+
+
+def is_on_membership_roster(data: 'pd.DataFrame', context: dict) -> 'pd.Series':
+    """
+    The applicant must be a club member. Skipped when no roster is given.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        context (dict): Rule context of check_eligibility with the 'roster' of member student numbers.
+
+    Returns:
+        pd.Series: True for submissions of members, None when there is no roster.
+    """
+    roster = context.get('roster')
+    if roster is None:
+        return None
+    return data[STD_NUMBER_COLUMN].isin(roster)
+
+
+def has_prerequisite(data: 'pd.DataFrame', context: dict) -> 'pd.Series':
+    """
+    2* applicants must have completed the 1* theory and practice courses, either answered in the
+    form or listed in the completed roster.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        context (dict): Rule context of check_eligibility with the optional 'completed' student numbers.
+
+    Returns:
+        pd.Series: True for 1* submissions and for 2* submissions with the prerequisite.
+    """
+    is_advanced = data[COURSE_COLUMN] == ADVANCED_COURSE
+    answered = column_filled(data, THEORY_COLUMN) & column_filled(data, PRACTICE_COLUMN)
+    completed = context.get('completed')
+    if completed is not None:
+        answered |= data[STD_NUMBER_COLUMN].isin(completed)
+    return ~is_advanced | answered
+
+
+def has_deposit(data: 'pd.DataFrame', context: dict) -> 'pd.Series':
+    """
+    The deposit receipt must be uploaded.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        context (dict): Rule context of check_eligibility, not used.
+
+    Returns:
+        pd.Series: True for submissions with a receipt.
+    """
+    return column_filled(data, DEPOSIT_COLUMN)
+
+
+def can_swim(data: 'pd.DataFrame', context: dict) -> 'pd.Series':
+    """
+    The applicant must be able to swim.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        context (dict): Rule context of check_eligibility, not used.
+
+    Returns:
+        pd.Series: True for submissions answering 'Evet'.
+    """
+    return data[SWIMMING_COLUMN].astype(str).str.strip().str.casefold() == 'evet'
+
+
+def find_column(columns: Iterable[str], column: str) -> Optional[str]:
+    """
+    Find a rule column in an export, by its exact name or else as the prefix of a longer header.
+
+    Args:
+        columns (Iterable[str]): Column names of the export.
+        column (str): Column name or header prefix of a rule.
+
+    Returns:
+        Optional[str]: The matching export column, None if there is none.
+    """
+    columns = list(columns)
+    if column in columns:
+        return column
+    return next((name for name in columns if isinstance(name, str) and name.startswith(column)), None)
+
+
+def column_filled(data: 'pd.DataFrame', column: str) -> 'pd.Series':
+    """
+    Check which rows have a non-blank value in a column.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        column (str): Column to check.
+
+    Returns:
+        pd.Series: True for rows with a value other than NaN or whitespace.
+    """
+    return data[column].notna() & (data[column].astype(str).str.strip() != '')
+
+
+# Evaluated in order, the first failing rule is the rejection reason. Columns are matched with
+# find_column. A rule whose columns are missing from the export is skipped with a warning, a rule
+# whose check returns None is skipped silently.
+ELIGIBILITY_RULES: List[Dict[str, object]] = [
+    {'name': 'duplicate', 'columns': [TIMESTAMP_COLUMN, STD_NUMBER_COLUMN], 'check': is_latest_submission,
+     'reason': 'Duplicate submission, only the latest one is used'},
+    {'name': 'membership', 'columns': [STD_NUMBER_COLUMN], 'check': is_on_membership_roster,
+     'reason': 'Not on the membership roster'},
+    {'name': 'prerequisite', 'columns': [COURSE_COLUMN, THEORY_COLUMN, PRACTICE_COLUMN], 'check': has_prerequisite,
+     'reason': 'The 2* course requires completed 1* theory and practice courses'},
+    {'name': 'deposit', 'columns': [DEPOSIT_COLUMN], 'check': has_deposit,
+     'reason': 'No deposit receipt uploaded'},
+    {'name': 'swimming', 'columns': [SWIMMING_COLUMN], 'check': can_swim,
+     'reason': 'Cannot swim'},
+]
+
+
+def check_eligibility(data: 'pd.DataFrame', roster: Optional[Iterable[int]] = None,
+                      completed: Optional[Iterable[int]] = None,
+                      rules: Optional[List[Dict[str, object]]] = None) -> 'pd.DataFrame':
+    """
+    Evaluate the eligibility rules as boolean masks over the whole responses table.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        roster (Iterable[int], optional): Student numbers of club members.
+        completed (Iterable[int], optional): Student numbers known to have completed the 1* course.
+        rules (List[Dict[str, object]], optional): Rules with a 'name', 'columns', 'check' and 'reason'.
+            Defaults to ELIGIBILITY_RULES.
+
+    Returns:
+        pd.DataFrame: One row per submission with the student number, one boolean column per
+        evaluated rule, 'eligible' and the 'reason' of the first failing rule (None if eligible).
+
+    Warns:
+        UserWarning: For every rule that is skipped because the export has no matching column.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rules = ELIGIBILITY_RULES if rules is None else rules
+    context = {'roster': None if roster is None else set(roster),
+               'completed': None if completed is None else set(completed)}
+
+    # Headers matched by prefix are renamed to the rule columns, so the checks can read them by name
+    found = {column: find_column(data.columns, column) for rule in rules for column in rule['columns']}
+    renamed = {name: column for column, name in found.items() if name is not None and name != column}
+    if renamed:
+        data = data.rename(columns=renamed)
+
+    result = pd.DataFrame({'std_number': data[STD_NUMBER_COLUMN]}, index=data.index)
+    masks, reasons = [], []
+    for rule in rules:
+        missing = [column for column in rule['columns'] if found[column] is None]
+        if missing:
+            warnings.warn(f"Eligibility rule {rule['name']!r} is skipped, the responses have no column "
+                          f"{missing[0]!r}")
+            continue
+        passed = rule['check'](data, context)
+        if passed is None:
+            continue
+        passed = passed.fillna(False).astype(bool)
+        result[rule['name']] = passed
+        masks.append(~passed.to_numpy())
+        reasons.append(rule['reason'])
+
+    result['eligible'] = ~np.logical_or.reduce(masks) if masks else True
+    result['reason'] = np.select(masks, reasons, default=None) if masks else None
+    result['reason'] = result['reason'].where(~result['eligible'], None)
+    return result
+
+
+def rejection_reasons(eligibility: 'pd.DataFrame') -> Dict[int, str]:
+    """
+    Collect the rejection reasons of the submissions that decide an applicant's eligibility.
+
+    Duplicate submissions are left out, so an applicant is only rejected by their last submission.
+
+    Args:
+        eligibility (pd.DataFrame): Result of check_eligibility.
+
+    Returns:
+        Dict[int, str]: Rejection reason per ineligible student number.
+    """
+    decisive = eligibility[eligibility['duplicate']] if 'duplicate' in eligibility else eligibility
+    rejected = decisive[~decisive['eligible']]
+    return dict(zip(rejected['std_number'].tolist(), rejected['reason'].tolist()))
+
+
+def apply_eligibility(people: dict, rejections: Dict[int, str]) -> dict:
+    """
+    Remove the applicants rejected by the eligibility rules.
+
+    Args:
+        people (dict): A dictionary where the key is the person's ID, and the value is their details.
+        rejections (Dict[int, str]): Rejection reason per student number, from rejection_reasons.
+
+    Returns:
+        dict: A dictionary containing only the eligible people.
+    """
+    if not rejections:
+        return people
+    return {person_id: person_data for person_id, person_data in people.items() if person_id not in rejections}
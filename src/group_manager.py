@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Dict
 from collections import defaultdict
-from src.schemas import Group, Human
+from schemas import Group, Human
 
 
 def initial_grouping(people: dict[int, Human]) -> List[Group]:
@@ -162,4 +162,224 @@ def merge_groups_by_members(groups: List[Group]) -> List[Group]:
     unique_groups.sort(key=lambda g: g.APPLY_DATE)
 
 
-    return unique_groups
\ No newline at end of file
+    return unique_groups
+
+class DisjointSet:
+    """
+    Disjoint-set forest over student numbers with union by size and path halving.
+    """
+
+    def __init__(self, items=()):
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: int):
+        """
+        Add an item as its own set if it is not known yet.
+
+        Args:
+            item (int): Student number to be added.
+        """
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item: int) -> int:
+        """
+        Find the representative of the set containing the item.
+
+        Args:
+            item (int): Student number to look up.
+
+        Returns:
+            int: Student number representing the set.
+        """
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int) -> int:
+        """
+        Merge the sets containing both items.
+
+        Args:
+            first (int): Student number of the first item.
+            second (int): Student number of the second item.
+
+        Returns:
+            int: Representative of the merged set.
+        """
+        first_root, second_root = self.find(first), self.find(second)
+        if first_root == second_root:
+            return first_root
+        if self.size[first_root] < self.size[second_root]:
+            first_root, second_root = second_root, first_root
+        self.parent[second_root] = first_root
+        self.size[first_root] += self.size[second_root]
+        return first_root
+
+    def components(self) -> Dict[int, List[int]]:
+        """
+        Collect the members of every set.
+
+        Returns:
+            Dict[int, List[int]]: Representatives mapped to their members in insertion order.
+        """
+        components = defaultdict(list)
+        for item in self.parent:
+            components[self.find(item)].append(item)
+        return components
+
+
+def friendship_components(people: dict[int, Human]) -> DisjointSet:
+    """
+    Build friendship components over student numbers.
+
+    A friendship only links two applicants when both applied to the same COURSE_LEVEL,
+    which is the same rule Group.check_course_level applies to the initial groups.
+
+    Args:
+        people (dict[int, Human]): Dictionary where keys are student numbers and values are Human objects.
+
+    Returns:
+        DisjointSet: Disjoint sets of student numbers connected by friendships.
+    """
+    components = DisjointSet(people)
+
+    for person_id, person in people.items():
+        for friend_id in person.FRIENDS:
+            friend = people.get(friend_id)
+            if friend is not None and friend.COURSE_LEVEL == person.COURSE_LEVEL:
+                components.union(person_id, friend_id)
+
+    return components
+
+
+def component_group(members: List[Human]) -> Group:
+    """
+    Create the group of one friendship component.
+
+    Args:
+        members (List[Human]): Members of the component in insertion order.
+
+    Returns:
+        Group: Group with the members sorted by APPLY_DATE and the component's COURSE_LEVEL.
+    """
+    # Sort members according to their apply date so that we can remove people if necessary in the future
+    members = sorted(members, key=lambda member: member.APPLY_DATE)
+    group = Group(members=members)
+    group.COURSE_LEVEL = members[0].COURSE_LEVEL
+    return group
+
+
+def cluster_friendship_groups(people: dict[int, Human]) -> List[Group]:
+    """
+    Creates the final groups directly from the friendship components in near-linear time.
+
+    Produces the same groups as initial_grouping -> remove_subset_groups -> merge_groups_by_members.
+
+    Args:
+        people (dict[int, Human]): Dictionary where keys are student numbers and values are Human objects.
+
+    Returns:
+        List[Group]: List of groups sorted by their earliest APPLY_DATE.
+    """
+    groups = [component_group([people[member_id] for member_id in member_ids])
+              for member_ids in friendship_components(people).components().values()]
+
+    # Sort the final groups by the earliest APPLY_DATE
+    groups.sort(key=lambda g: g.APPLY_DATE)
+
+    return groups
+
+
+def repair_groups(groups: List[Group], slot_capacity: Dict[int, int]) -> List[Group]:
+    """
+    Splits groups that can never be placed because they have no common slot or exceed its capacity.
+
+    For a slot s, the largest placeable part of a group is min(members who can attend s, capacity of s),
+    so keeping the earliest applicants of the slot that maximizes this detaches the minimum number
+    of members. The detached members are regrouped by the friendships among them, since a
+    detached member may only be linked to the group through someone who was kept, and every new
+    group is repaired the same way.
+    Every step costs O(members x slots) and shrinks the group, so the search is bounded.
+
+    Args:
+        groups (List[Group]): Final groups, e.g. from merge_groups_by_members.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+
+    Returns:
+        List[Group]: Groups that each have at least one slot they fit into, plus groups whose members
+        share no slot with capacity at all, sorted by the earliest APPLY_DATE.
+    """
+    open_slots = [slot for slot, capacity in slot_capacity.items() if capacity > 0]
+    repaired = []
+    pending = list(groups)
+
+    while pending:
+        group = pending.pop()
+        size = len(group.MEMBERS)
+        if any(slot_capacity.get(slot, 0) >= size for slot in group.COURSE_SLOTS):
+            repaired.append(group)
+            continue
+
+        # Members are sorted by APPLY_DATE, so the first holders of a slot are its earliest applicants
+        best_keep: List[Human] = []
+        for slot in open_slots:
+            holders = [member for member in group.MEMBERS if slot in member.COURSE_SLOTS]
+            keep = holders[:slot_capacity[slot]]
+            if len(keep) > len(best_keep):
+                best_keep = keep
+
+        if not best_keep:
+            # No member can attend any slot with capacity, splitting would not help
+            repaired.append(group)
+            continue
+
+        kept_ids = {member.STD_NUMBER for member in best_keep}
+        detached = [member for member in group.MEMBERS if member.STD_NUMBER not in kept_ids]
+        print(f"Detaching {[member.FULLNAME for member in detached]} from group with members "
+              f"{[member.FULLNAME for member in group.MEMBERS]} to find a feasible slot.")
+
+        kept_group = Group(members=best_keep)
+        kept_group.COURSE_LEVEL = group.COURSE_LEVEL
+        pending.append(kept_group)
+
+        detached_people = {member.STD_NUMBER: member for member in detached}
+        for member_ids in friendship_components(detached_people).components().values():
+            pending.append(component_group([detached_people[member_id] for member_id in member_ids]))
+
+    # Sort the final groups by the earliest APPLY_DATE
+    repaired.sort(key=lambda g: g.APPLY_DATE)
+
+    return repaired
+
+
+def repair_groups_by_level(groups: List[Group], level_capacity: Dict[str, Dict[int, int]]) -> List[Group]:
+    """
+    Repairs the groups of every COURSE_LEVEL against the capacity table of that level.
+
+    Args:
+        groups (List[Group]): Final groups, e.g. from merge_groups_by_members.
+        level_capacity (Dict[str, Dict[int, int]]): Capacity per course level and slot, e.g. from
+            SlotConfig.level_capacity. Groups of a level without a table are kept as they are.
+
+    Returns:
+        List[Group]: Repaired groups of all levels, sorted by the earliest APPLY_DATE.
+    """
+    groups_by_level = defaultdict(list)
+    for group in groups:
+        groups_by_level[group.COURSE_LEVEL].append(group)
+
+    repaired = []
+    for course_level, level_groups in groups_by_level.items():
+        repaired += repair_groups(level_groups, level_capacity.get(course_level, {}))
+
+    # Sort the final groups by the earliest APPLY_DATE
+    repaired.sort(key=lambda g: g.APPLY_DATE)
+
+    return repaired
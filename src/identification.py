@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
-from schemas import Human, slots
+from loading import kept_submissions
+from schemas import Human
+from slot_config import SLOT_CONFIG
 
 
 def parse_date(date_str: str) -> datetime:
@@ -23,9 +26,93 @@ def parse_date(date_str: str) -> datetime:
         return None  # Return None if parsing fails
 
 
+FRIEND_COLUMNS = [
+    '1. Arkadaşınızın Öğrenci Numarası',
+    '2. Arkadaşınızın Öğrenci Numarası',
+    '3. Arkadaşınızın Öğrenci Numarası',
+    '4. Arkadaşınızın Öğrenci Numarası'
+]
+
+
 def human_identification(data: pd.DataFrame) -> Dict[int, Human]:
     """
-    Identifies and processes human entries from the given data.
+    Identifies and processes human entries from the given data using column-wise operations.
+
+    The timestamp column is parsed in a single vectorized conversion, numeric friend columns are
+    converted as whole columns and the slot strings are exploded and every distinct label is
+    parsed once through the slot configuration. Only the final Human construction touches individual rows.
+    A student number with several submissions is built from its latest one, see loading.kept_submissions.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing information about people.
+
+    Returns:
+        Dict[int, Human]: Dictionary where keys are student numbers and values are Human objects.
+
+    Raises:
+        ValueError: If a friend column holds an entry that is not a number, as in the row-wise loop.
+    """
+    people = {}
+
+    if data.empty:
+        return people
+    data = data[kept_submissions(data)]
+
+    # Parse all application dates at once, invalid values become NaT
+    apply_dates = pd.to_datetime(data['Zaman damgası'], format="%d.%m.%Y %H:%M:%S", errors='coerce')
+    for date_str in data['Zaman damgası'][apply_dates.isna()]:
+        print(f"Invalid date format or value: {date_str}")
+    apply_dates = [None if pd.isna(date) else date.to_pydatetime() for date in apply_dates]
+
+    # Collect the friends column by column, empty cells are skipped like in the row-wise loop
+    friends = [[] for _ in range(len(data))]
+    for friend_column in FRIEND_COLUMNS:
+        values = data[friend_column]
+        filled = values.notna().to_numpy()
+        if values.dtype.kind in 'iuf':
+            converted = values[filled].astype('int64').tolist()
+        else:
+            # Text columns are converted one by one, so a non-numeric entry raises as it does in int()
+            converted = [int(value) for value in values[filled].tolist()]
+        for row, friend in zip(np.flatnonzero(filled).tolist(), converted):
+            friends[row].append(friend)
+
+    # Explode the slot strings into one row per slot and parse every distinct label once
+    raw_slots = pd.Series(data['Eğitime Katılabileceğiniz Slotlar'].fillna('').astype(str).to_numpy())
+    labels = raw_slots.str.split(',').explode()
+    exploded_slots = labels.map({label: SLOT_CONFIG.parse_slot(label) for label in labels.unique()})
+    valid_slots = exploded_slots.notna().to_numpy()
+    slot_codes = exploded_slots[valid_slots].astype('int64').tolist()
+    slot_offsets = np.cumsum(np.bincount(exploded_slots.index[valid_slots], minlength=len(data))).tolist()
+    course_slots = [slot_codes[start:end] for start, end in zip([0] + slot_offsets[:-1], slot_offsets)]
+
+    columns = zip(data['Öğrenci Numarası'].tolist(), data['Ad Soyad'].tolist(),
+                  data['Telefon Numarası'].tolist(), data['Başvurduğunuz Eğitim'].tolist(),
+                  apply_dates, friends, course_slots)
+
+    for std_number, fullname, phone_number, course_level, apply_date, friend_list, slot_list in columns:
+        person = Human()
+        person.STD_NUMBER = std_number
+        person.FULLNAME = fullname
+        person.PHONE_NUMBER = phone_number
+        person.isMember = True  # TODO: Dynamically check this in the future.
+        person.COURSE_LEVEL = course_level
+        person.APPLY_DATE = apply_date
+        person.FRIENDS = friend_list
+        person.COURSE_SLOTS = slot_list
+        person.isPlaced = False
+        person.LAST_COMPLETED_COURSE = '1* Temel Yelken Eğitimi'  # TODO: Check this info from the database in the future
+
+        people[person.STD_NUMBER] = person
+
+    return people
+
+
+def human_identification_rowwise(data: pd.DataFrame) -> Dict[int, Human]:
+    """
+    Identifies and processes human entries from the given data row by row.
+
+    Kept as the reference implementation for human_identification.
 
     Args:
         data (pd.DataFrame): DataFrame containing information about people.
@@ -35,6 +122,10 @@ def human_identification(data: pd.DataFrame) -> Dict[int, Human]:
     """
     people = {}
 
+    if data.empty:
+        return people
+    data = data[kept_submissions(data)]
+
     for idx, row in data.iterrows():
         person = Human()
 
@@ -47,24 +138,14 @@ def human_identification(data: pd.DataFrame) -> Dict[int, Human]:
         person.APPLY_DATE = parse_date(row['Zaman damgası'])
 
         # Collecting friends' student numbers into a list, if they are valid (not NaN)
-        friend_columns = [
-            '1. Arkadaşınızın Öğrenci Numarası',
-            '2. Arkadaşınızın Öğrenci Numarası',
-            '3. Arkadaşınızın Öğrenci Numarası',
-            '4. Arkadaşınızın Öğrenci Numarası'
-        ]
-
         person.FRIENDS = [
-            int(row[friend_col]) for friend_col in friend_columns
+            int(row[friend_col]) for friend_col in FRIEND_COLUMNS
             if pd.notna(row[friend_col])  # Only add valid, non-NaN student numbers
         ]
 
-        # Process course slots and map them to slot numbers using the slots dictionary
+        # Process course slots and map them to slot numbers using the slot configuration
         course_slots_raw = row['Eğitime Katılabileceğiniz Slotlar']
-        person.COURSE_SLOTS = [
-            slots[slot.strip()] for slot in course_slots_raw.split(',')
-            if slot.strip() in slots  # Only map valid slot names
-        ]
+        person.COURSE_SLOTS = SLOT_CONFIG.parse_slots(course_slots_raw)  # Only maps valid slot names
 
         person.isPlaced = False  # Initialize with False
         person.LAST_COMPLETED_COURSE = '1* Temel Yelken Eğitimi'  # TODO: Check this info from the database in the future
@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING
+
+# pandas is imported inside the functions so that importing this module stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns every submission of the application form export is identified by
+TIMESTAMP_COLUMN = 'Zaman damgası'
+TIMESTAMP_FORMAT = "%d.%m.%Y %H:%M:%S"
+STD_NUMBER_COLUMN = 'Öğrenci Numarası'
+
+
+def load_data(file_path: str) -> 'pd.DataFrame':
+    """
+    Load CSV data into a pandas DataFrame.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        pd.DataFrame: Loaded data from the CSV file.
+
+    Raises:
+        FileNotFoundError: If the file cannot be found.
+        pd.errors.EmptyDataError: If the file is empty.
+        pd.errors.ParserError: If the file has invalid format.
+    """
+    import pandas as pd
+
+    try:
+        return pd.read_csv(file_path)
+    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+        print(f"Error loading data: {e}")
+        raise
+
+
+def kept_submissions(data: 'pd.DataFrame', keep: str = 'latest') -> 'pd.Series':
+    """
+    Mark the submission that counts for every student number.
+
+    Submissions are ordered by their timestamp, ties keep the export order and unparsable timestamps
+    never win over a valid one. human_identification, the duplicate rule and the streaming ingestion
+    all keep these rows, so an applicant is built and checked from the same submission on every path.
+
+    Args:
+        data (pd.DataFrame): Raw responses, one row per submission.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Returns:
+        pd.Series: True for the kept submission of every student number.
+
+    Raises:
+        ValueError: If keep is neither 'latest' nor 'earliest'.
+    """
+    import pandas as pd
+
+    if keep not in ('latest', 'earliest'):
+        raise ValueError(f"keep must be 'latest' or 'earliest', not {keep!r}")
+
+    timestamps = pd.to_datetime(data[TIMESTAMP_COLUMN], format=TIMESTAMP_FORMAT, errors='coerce')
+    submissions = pd.DataFrame({'std_number': data[STD_NUMBER_COLUMN].to_numpy(), 'timestamp': timestamps.to_numpy()})
+    ordered = submissions.sort_values('timestamp', kind='stable', na_position='first' if keep == 'latest' else 'last')
+    kept = ~ordered['std_number'].duplicated(keep='last' if keep == 'latest' else 'first')
+    return pd.Series(kept.sort_index().to_numpy(), index=data.index)
@@ -0,0 +1,277 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from placement import indexed_assignment
+from schemas import Group
+from solver import build_problem, greedy_assignment, placed_people, better_assignment, assignment_to_frame
+
+
+def perturbed_order(group_count: int, rng: random.Random, noise: float) -> List[int]:
+    """
+    Shuffle the group order locally while keeping it close to APPLY_DATE order.
+
+    Args:
+        group_count (int): Number of groups.
+        rng (random.Random): Random generator of the worker.
+        noise (float): How many positions a group can drift on average.
+
+    Returns:
+        List[int]: Group indexes in the perturbed order.
+    """
+    return sorted(range(group_count), key=lambda index: index + rng.gauss(0.0, noise))
+
+
+def ordered_greedy(sizes: List[int], group_slots: List[List[int]], remaining: List[int],
+                   order: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    Run the first-fit greedy pass over the groups in the given order.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+        order (List[int]): Order in which groups are placed.
+
+    Returns:
+        Tuple[List[int], List[int]]: Slot index per group and the capacities left afterwards.
+    """
+    remaining = list(remaining)
+    assignment = [-1] * len(sizes)
+    for group_index in order:
+        size = sizes[group_index]
+        for slot_index in group_slots[group_index]:
+            if size <= remaining[slot_index]:
+                remaining[slot_index] -= size
+                assignment[group_index] = slot_index
+                break
+    return assignment, remaining
+
+
+def improve(sizes: List[int], group_slots: List[List[int]], assignment: List[int], remaining: List[int]) -> int:
+    """
+    Improve an assignment in place with relocate and swap moves until no move adds people.
+
+    For every unplaced group, a placed group blocking one of its slots is either relocated to
+    another slot with room (relocate) or replaced when the unplaced group is larger (swap).
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups. Updated in place.
+        remaining (List[int]): Capacities left by the assignment. Updated in place.
+
+    Returns:
+        int: Number of moves evaluated.
+    """
+    evaluated = 0
+    members: List[List[int]] = [[] for _ in remaining]
+    for group_index, slot_index in enumerate(assignment):
+        if slot_index >= 0:
+            members[slot_index].append(group_index)
+
+    improved = True
+    while improved:
+        improved = False
+        unplaced = [index for index, slot in enumerate(assignment) if slot < 0 and group_slots[index]]
+        unplaced.sort(key=lambda index: -sizes[index])
+
+        for group_index in unplaced:
+            size = sizes[group_index]
+            for slot_index in group_slots[group_index]:
+                evaluated += 1
+                if size <= remaining[slot_index]:
+                    assignment[group_index] = slot_index
+                    remaining[slot_index] -= size
+                    members[slot_index].append(group_index)
+                    improved = True
+                    break
+
+                moved = False
+                for other_index in members[slot_index]:
+                    evaluated += 1
+                    other_size = sizes[other_index]
+                    if size > remaining[slot_index] + other_size:
+                        continue
+
+                    # Relocate the blocking group to any other slot with room
+                    target = next((slot for slot in group_slots[other_index]
+                                   if slot != slot_index and other_size <= remaining[slot]), -1)
+                    if target >= 0:
+                        members[slot_index].remove(other_index)
+                        members[target].append(other_index)
+                        assignment[other_index] = target
+                        remaining[target] -= other_size
+                        remaining[slot_index] += other_size
+                    elif size > other_size:
+                        # Swap the blocking group out for the larger unplaced group
+                        members[slot_index].remove(other_index)
+                        assignment[other_index] = -1
+                        remaining[slot_index] += other_size
+                    else:
+                        continue
+
+                    assignment[group_index] = slot_index
+                    remaining[slot_index] -= size
+                    members[slot_index].append(group_index)
+                    moved = True
+                    break
+
+                if moved:
+                    improved = True
+                    break
+
+    return evaluated
+
+
+def search_worker(problem: Tuple[List[int], List[List[int]], List[int]], seed: int, time_budget: float,
+                  noise: float) -> Dict[str, object]:
+    """
+    Run randomized starts with local improvement until the time budget is used up.
+
+    Args:
+        problem (Tuple[List[int], List[List[int]], List[int]]): Group sizes, allowed slot indexes and remaining capacities.
+        seed (int): Seed of the worker's random generator.
+        time_budget (float): Wall time limit in seconds.
+        noise (float): Ordering perturbation strength passed to perturbed_order.
+
+    Returns:
+        Dict[str, object]: Best assignment, its headcount and the worker's throughput counters.
+    """
+    sizes, group_slots, remaining = problem
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    deadline = start + time_budget
+
+    # The search starts from the better of the greedy and indexed placements, so it never places fewer people
+    best = greedy_assignment(sizes, group_slots, remaining)
+    indexed = indexed_assignment(sizes, group_slots, remaining)
+    if better_assignment(sizes, indexed, best):
+        best = indexed
+    best_people = placed_people(sizes, best)
+    starts, moves = 0, 0
+
+    while time.perf_counter() < deadline:
+        order = perturbed_order(len(sizes), rng, noise if starts else 0.0)
+        assignment, left = ordered_greedy(sizes, group_slots, remaining, order)
+        moves += improve(sizes, group_slots, assignment, left)
+        starts += 1
+
+        people = placed_people(sizes, assignment)
+        if people > best_people:
+            best, best_people = assignment, people
+
+    return {
+        'assignment': best,
+        'placed_people': best_people,
+        'starts': starts,
+        'moves': moves,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def run_search(problem: Tuple[List[int], List[List[int]], List[int]], workers: Optional[int], time_budget: float,
+               seed: int, noise: float) -> Tuple[List[int], Dict[str, object]]:
+    """
+    Run search_worker on a process pool and keep the best assignment over all workers.
+
+    Ties are resolved in favour of the worker with the lowest index.
+
+    Args:
+        problem (Tuple[List[int], List[List[int]], List[int]]): Group sizes, allowed slot indexes and remaining capacities.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        time_budget (float): Wall time each worker spends searching, in seconds.
+        seed (int): Base seed, worker i uses seed + i.
+        noise (float): How many positions a group can drift from its APPLY_DATE position.
+
+    Returns:
+        Tuple[List[int], Dict[str, object]]: Slot index per group, -1 for unplaced groups, and a report
+        with the headcount and throughput per worker.
+    """
+    workers = workers or os.cpu_count() or 1
+    sizes, group_slots, remaining = problem
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(search_worker, problem, seed + worker, time_budget, noise)
+                   for worker in range(workers)]
+        results = [future.result() for future in futures]
+
+    best = max(results, key=lambda result: result['placed_people'])
+    starts = sum(result['starts'] for result in results)
+    seconds = max(result['seconds'] for result in results)
+
+    report = {
+        'workers': workers,
+        'greedy_people': placed_people(sizes, greedy_assignment(sizes, group_slots, remaining)),
+        'indexed_people': placed_people(sizes, indexed_assignment(sizes, group_slots, remaining)),
+        'placed_people': best['placed_people'],
+        'starts': starts,
+        'moves': sum(result['moves'] for result in results),
+        'starts_per_second_per_worker': starts / seconds / workers if seconds else 0.0
+    }
+
+    return best['assignment'], report
+
+
+def multi_start_placement(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int],
+                          workers: Optional[int] = None, time_budget: float = 5.0, seed: int = 0,
+                          noise: float = 3.0) -> Tuple['pd.DataFrame', Dict[str, object]]:
+    """
+    Place groups with randomized multi-start local search spread over a process pool.
+
+    Every worker perturbs the APPLY_DATE order of the groups, runs a first-fit greedy pass and
+    improves it with relocate and swap moves. The best assignment over all workers is kept;
+    ties are resolved in favour of the worker with the lowest index.
+
+    Args:
+        groups (List[Group]): List of groups to place, e.g. the merge_groups_by_members output.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        time_budget (float): Wall time each worker spends searching, in seconds.
+        seed (int): Base seed, worker i uses seed + i.
+        noise (float): How many positions a group can drift from its APPLY_DATE position.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, object]]: Placement dataframe in the place_groups format and a
+        report with the headcount and throughput per worker.
+    """
+    sizes, group_slots, slot_numbers, remaining = build_problem(groups, slots, slot_capacity)
+    best, report = run_search((sizes, group_slots, remaining), workers, time_budget, seed, noise)
+    return assignment_to_frame(groups, best, slot_numbers, slots), report
+
+
+def multi_start_assignment(sizes: List[int], group_slots: List[List[int]], slot_capacity: Dict[int, int],
+                           workers: Optional[int] = None, time_budget: float = 5.0, seed: int = 0,
+                           noise: float = 3.0) -> Tuple[List[Optional[int]], Dict[str, object]]:
+    """
+    Place groups given as plain sizes and slot numbers with the multi-start local search, see multi_start_placement.
+
+    The search starts from the better of the greedy and indexed placements, so it places at least as
+    many people as solve_assignment with the 'indexed' engine.
+
+    Args:
+        sizes (List[int]): Number of members per group, in APPLY_DATE order.
+        group_slots (List[List[int]]): COURSE_SLOTS per group.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and free capacity per slot.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        time_budget (float): Wall time each worker spends searching, in seconds.
+        seed (int): Base seed, worker i uses seed + i.
+        noise (float): How many positions a group can drift from its APPLY_DATE position.
+
+    Returns:
+        Tuple[List[Optional[int]], Dict[str, object]]: Slot number per group, None for unplaced groups,
+        and the report of multi_start_placement.
+    """
+    slot_numbers = [slot for slot, capacity in slot_capacity.items() if capacity > 0]
+    slot_index = {slot: index for index, slot in enumerate(slot_numbers)}
+    remaining = [slot_capacity[slot] for slot in slot_numbers]
+    indexed_slots = [[slot_index[slot] for slot in course_slots if slot in slot_index] for course_slots in group_slots]
+
+    best, report = run_search((sizes, indexed_slots, remaining), workers, time_budget, seed, noise)
+    return [slot_numbers[slot] if slot >= 0 else None for slot in best], report
@@ -1,108 +1,424 @@
-# Importing necessary modules
-from idlelib.search import find_again
-from typing import List
 
-import pandas as pd  # Use standard alias for pandas
-from pandas.core.interchange.dataframe_protocol import DataFrame
+# Importing necessary modules
+import argparse
+import os
+import sys
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 # Custom modules for various processing steps
-from identification import human_identification, course_slots_automate
-from elimination import person_background_check
-from group_manager import initial_grouping, remove_subset_groups, merge_groups_by_members
-from placement import place_groups, optimize_placements
+from cache import PipelineCache, CACHE_DIR
+from diagnostics import explain_unplaced, placement_assignment, print_explanations
+from elimination import person_background_check, check_eligibility, rejection_reasons, apply_eligibility
+from group_manager import cluster_friendship_groups, repair_groups, repair_groups_by_level
+from loading import load_data
+from placement import (place_groups, optimize_placements, solve_assignment, place_by_course_level, schedule_terms,
+                       course_slots_creating)
+from profiler import PipelineProfiler
 from schemas import slots
+from slot_config import SLOT_CONFIG
 
-# Constants
-DATA_FILE_PATH = r"/Users/cagataykenter/Desktop/cagataykenter/Career/Personal/BounSailing/data/Bounsailing Güz'24 _ 1_ ve 2_ Eğitim Başvuru Formu (Yanıtlar) - Form Yanıtları 1.csv"
-
-
-def load_data(file_path: str) -> pd.DataFrame:
-    """
-    Load CSV data into a pandas DataFrame.
-
-    Args:
-        file_path (str): Path to the CSV file.
-
-    Returns:
-        pd.DataFrame: Loaded data from the CSV file.
+# pandas is only needed to read the CSV and to build result dataframes, so it is imported lazily
+if TYPE_CHECKING:
+    import pandas as pd
 
-    Raises:
-        FileNotFoundError: If the file cannot be found.
-        pd.errors.EmptyDataError: If the file is empty.
-        pd.errors.ParserError: If the file has invalid format.
-    """
-    try:
-        return pd.read_csv(file_path)
-    except (FileNotFoundError, pd.errors.EmptyDataError, pd.errors.ParserError) as e:
-        print(f"Error loading data: {e}")
-        raise
+# Constants
+DATA_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data',
+                              "Bounsailing Güz'24 _ 1_ ve 2_ Eğitim Başvuru Formu (Yanıtlar) - Form Yanıtları 1.csv")
+SLOT_CAPACITY = SLOT_CONFIG.capacity()
 
 
-def execution(data: pd.DataFrame):
+def execution(data: 'pd.DataFrame', profiler: Optional[PipelineProfiler] = None):
     """
     Execute the process pipeline: identification, background check, grouping, and cleaning.
 
     Args:
         data (pd.DataFrame): Raw data to be processed.
+        profiler (PipelineProfiler, optional): Records time, memory and cardinalities of every stage.
 
     Returns:
         list: List of final grouped people after processing and cleaning.
     """
+    from identification import human_identification, course_slots_automate
+
+    profiler = profiler or PipelineProfiler(trace_memory=False)
+
     # Process data
-    people = human_identification(data)
-    chosen_course_slots = course_slots_automate(people)
-    people = person_background_check(people)
+    with profiler.stage('identification', rows=len(data)) as record:
+        people = human_identification(data)
+        record['outputs']['people'] = len(people)
+    with profiler.stage('eligibility', people=len(people)) as record:
+        people = apply_eligibility(people, rejection_reasons(check_eligibility(data)))
+        record['outputs']['people'] = len(people)
+    with profiler.stage('course_slots_automate', people=len(people)) as record:
+        chosen_course_slots = course_slots_automate(people)
+        record['outputs']['course_slots'] = len(chosen_course_slots)
+    with profiler.stage('person_background_check', people=len(people)) as record:
+        people = person_background_check(people)
+        record['outputs']['people'] = len(people)
+
+    # slot_capacity = course_slots_creating(slots.values())
+    slot_capacity = SLOT_CAPACITY
 
     # Grouping
-    groups = initial_grouping(people)
-    final_groups = remove_subset_groups(groups)
-    final_groups = merge_groups_by_members(final_groups)
+    with profiler.stage('grouping', people=len(people)) as record:
+        final_groups = cluster_friendship_groups(people)
+        record['outputs']['groups'] = len(final_groups)
+        record['outputs']['grouped_people'] = sum(len(group.MEMBERS) for group in final_groups)
+    with profiler.stage('repair_groups', groups=len(final_groups)) as record:
+        repaired_groups = repair_groups(final_groups, slot_capacity)
+        # repair_groups returns the groups it did not have to split unchanged
+        unchanged_ids = {id(group) for group in repaired_groups}
+        record['outputs']['split_groups'] = sum(id(group) not in unchanged_ids for group in final_groups)
+        final_groups = repaired_groups
+        record['outputs']['groups'] = len(final_groups)
 
     # Placement
-    # slot_capacity = course_slots_creating(slots.values())
-    df_first_round, df_second_round = place_groups(final_groups,  slots={11: 0, 12: 0, 13: 0, 21: 0, 22: 0, 23: 0, 31: 0, 32: 0, 33: 0, 41: 0, 42: 0, 43: 0, 51: 0, 52: 0, 53: 0, 61: 0, 62: 0, 63: 0, 71: 0, 72: 0, 73: 0} , slot_capacity={11: 0, 12: 11, 13: 12, 21: 0, 22: 0, 23: 0, 31: 0, 32: 11, 33: 12, 41: 0, 42: 13, 43: 12, 51: 11, 52: 16, 53: 17, 61: 20, 62: 20, 63: 20, 71: 20, 72: 20, 73: 20})
-    best_placement = optimize_placements(final_groups, slots={11: 0, 12: 0, 13: 0, 21: 0, 22: 0, 23: 0, 31: 0, 32: 0, 33: 0, 41: 0, 42: 0, 43: 0, 51: 0, 52: 0, 53: 0, 61: 0, 62: 0, 63: 0, 71: 0, 72: 0, 73: 0} , slot_capacity={11: 0, 12: 11, 13: 12, 21: 0, 22: 0, 23: 0, 31: 0, 32: 11, 33: 12, 41: 0, 42: 13, 43: 12, 51: 11, 52: 16, 53: 17, 61: 20, 62: 20, 63: 20, 71: 20, 72: 20, 73: 20})
+    with profiler.stage('place_groups', groups=len(final_groups)) as record:
+        df_first_round, df_second_round = place_groups(final_groups, slots={slot: 0 for slot in slots.values()}, slot_capacity=slot_capacity)
+        record['outputs']['first_round_groups'] = len(df_first_round)
+        record['outputs']['second_round_groups'] = len(df_second_round)
+    with profiler.stage('optimize_placements', groups=len(final_groups), attempts=len(slot_capacity)) as record:
+        best_placement = optimize_placements(final_groups, slots={slot: 0 for slot in slots.values()}, slot_capacity=slot_capacity)
+        record['outputs']['placed_groups'] = 0 if best_placement is None else len(best_placement)
+        record['outputs']['placed_people'] = 0 if best_placement is None else int(best_placement['group'].map(len).sum())
 
     return final_groups, best_placement
 
 
-def display_result(placement: DataFrame, final_groups: List) -> None:
+def display_result(placement: 'pd.DataFrame', final_groups: List) -> None:
     """
     Display the placement output.
 
     Args:
-        groups (list): Final result to be displayed.
+        placement (pd.DataFrame): Placement dataframe in the place_groups format.
+        final_groups (list): Final groups to be displayed.
     """
+    import pandas as pd
+    from result import PlacementResult
 
-    data = {}
+    with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', None,
+                           'display.max_colwidth', None):
+        print(PlacementResult.from_placements(placement).roster())
 
-    for index, row in placement.iterrows():
-        if row['slot'] in data.keys():
-            data[row['slot']].append(row['group'])
-        else:
-            data[row['slot']] = [row['group']]
+    for group in final_groups:
+        print(group)
 
-    # Find the maximum length of the slot lists
-    max_len = max(len(groups) for groups in data.values())
 
-    # Normalize the length of each slot's group list by padding with empty lists
-    for slot in data:
-        while len(data[slot]) < max_len:
-            data[slot].append('')
+def print_roster(groups: List, assignment: List[Optional[int]]) -> None:
+    """
+    Print the groups of every slot without building a dataframe.
 
-    df = pd.DataFrame(data)
-    print(df)
+    Args:
+        groups (List[Group]): Final groups, sorted by APPLY_DATE.
+        assignment (List[Optional[int]]): Slot number per group, None for unplaced groups.
+    """
+    slot_names = {number: name for name, number in slots.items()}
+    roster = defaultdict(list)
+    for group, slot in zip(groups, assignment):
+        roster[slot].append(group)
 
-    for group in final_groups:
-        print(group)
+    for slot in sorted(slot for slot in roster if slot is not None):
+        people_count = sum(len(group.MEMBERS) for group in roster[slot])
+        print(f"{slot_names.get(slot, slot)} ({people_count} people)")
+        for group in roster[slot]:
+            print(f"    {', '.join(member.FULLNAME for member in group.MEMBERS)}")
 
 
-if __name__ == "__main__":
-    # Load data and process it
-    data = load_data(DATA_FILE_PATH)
+def command_ingest(args: argparse.Namespace) -> None:
+    """
+    Parse the responses into applicants and cache them, or stream them chunk by chunk without caching.
+    """
+    if args.stream:
+        from streaming import stream_applicants
+        people, rejections = stream_applicants(args.data, args.chunksize)
+        source = f"streamed in chunks of {args.chunksize} rows, not cached"
+    else:
+        cache = PipelineCache(args.cache_dir)
+        people = cache.load_people(args.data)
+        rejections = cache.load_rejections(args.data)
+        source = f"cache {'hit' if cache.stats['people']['hits'] else 'miss'}"
+    eligible = person_background_check(apply_eligibility(people, rejections))
+    print(f"{len(people)} applicants parsed, {len(eligible)} eligible ({source})")
+    for std_number, reason in rejections.items():
+        print(f"    {std_number} {people[std_number].FULLNAME}: {reason}")
+
+
+def load_final_groups(args: argparse.Namespace) -> List:
+    """
+    Load the cached groups and repair the ones without a feasible slot.
+
+    With --by-level every course level is repaired against its own capacity table.
+    """
+    _, groups = PipelineCache(args.cache_dir).load_groups(args.data)
+    if getattr(args, 'by_level', False):
+        return repair_groups_by_level(groups, SLOT_CONFIG.level_capacity())
+    return repair_groups(groups, SLOT_CAPACITY)
+
+
+def command_group(args: argparse.Namespace) -> None:
+    """
+    Build the friendship groups and repair groups without a feasible slot.
+    """
+    groups = load_final_groups(args)
+    print(f"{len(groups)} groups, {sum(len(group.MEMBERS) for group in groups)} people")
+    if args.show:
+        for group in groups:
+            print(group)
+
+
+def command_place(args: argparse.Namespace) -> None:
+    """
+    Place the final groups into the slots.
+    """
+    groups = load_final_groups(args)
+    sizes = [len(group.MEMBERS) for group in groups]
+    group_terms = None
+    if args.terms is not None:
+        term_capacity = course_slots_creating(list(SLOT_CAPACITY), args.terms)
+        group_terms, assignment = schedule_terms(groups, {}, term_capacity, args.engine, args.time_budget)
+        # Groups placed in an earlier term are not competing for the last term's slots
+        last_indexes = [index for index, term in enumerate(group_terms) if term in (None, args.terms)]
+        explanations = explain_unplaced([groups[index] for index in last_indexes],
+                                        [assignment[index] for index in last_indexes],
+                                        {slot: term_capacity[(args.terms, slot)] for slot in SLOT_CAPACITY})
+    elif args.by_level:
+        level_capacity = SLOT_CONFIG.level_capacity()
+        assignment = place_by_course_level(groups, {}, level_capacity, args.engine, args.time_budget)
+        explanations = []
+        for level in sorted({group.COURSE_LEVEL for group in groups}):
+            level_indexes = [index for index, group in enumerate(groups) if group.COURSE_LEVEL == level]
+            explanations += explain_unplaced([groups[index] for index in level_indexes],
+                                             [assignment[index] for index in level_indexes],
+                                             level_capacity.get(level, {}))
+    elif args.engine == 'weighted':
+        from objective import solve_weighted
+        slot_indexes, slot_numbers, report = solve_weighted(groups, {}, SLOT_CAPACITY, dict(args.weight),
+                                                            time_budget=args.time_budget)
+        assignment = [slot_numbers[slot_index] if slot_index >= 0 else None for slot_index in slot_indexes]
+    elif args.engine == 'multistart':
+        from local_search import multi_start_assignment
+        assignment, report = multi_start_assignment(sizes, [group.COURSE_SLOTS for group in groups], SLOT_CAPACITY,
+                                                    args.workers, args.time_budget, args.seed)
+    else:
+        assignment = solve_assignment(sizes, [group.COURSE_SLOTS for group in groups], SLOT_CAPACITY,
+                                      args.time_budget, args.engine)
+    if args.terms is None and not args.by_level:
+        explanations = explain_unplaced(groups, assignment, SLOT_CAPACITY)
+    if group_terms is None:
+        print_roster(groups, assignment)
+    else:
+        term_names = {entry['number']: entry['name'] for entry in SLOT_CONFIG.terms}
+        for term in range(1, args.terms + 1):
+            print(f"Term {term} ({term_names.get(term, 'default capacities')})")
+            print_roster(groups, [slot if group_term == term else None for group_term, slot in zip(group_terms, assignment)])
+    print_explanations(explanations)
+    placed = sum(size for size, slot in zip(sizes, assignment) if slot is not None)
+    print(f"{placed} of {sum(sizes)} people placed with the {args.engine} engine"
+          + (" per course level" if args.by_level else "")
+          + (f" over {args.terms} term{'s' if args.terms > 1 else ''}" if group_terms is not None else ""))
+    if args.engine == 'weighted':
+        for name in ('objective', 'upper_bound', 'priority', 'kept_friendships', 'imbalance', 'utilization_range'):
+            print(f"{name}: {report[name]:.3f}")
+    elif args.engine == 'multistart':
+        print(f"{report['starts']} starts on {report['workers']} workers; greedy placed {report['greedy_people']}, "
+              f"indexed {report['indexed_people']}")
+
+    if args.output is not None:
+        from result import PlacementResult
+        PlacementResult.from_assignment(groups, assignment, group_terms).write(args.output, include_roster=True)
+        print(f"Placement written to {args.output}")
+    if args.log is not None:
+        from diagnostics import slot_occupancy
+        from placement_log import PlacementLog, assignment_placement
+        log = PlacementLog(args.log)
+        log.snapshot(SLOT_CAPACITY, slot_occupancy(groups, assignment), assignment_placement(groups, assignment))
+        log.close()
+        print(f"Placement logged to {args.log}")
+
+
+def command_replay(args: argparse.Namespace) -> None:
+    """
+    Rebuild a logged placement without solving and print its roster.
+    """
+    from placement_log import replay, replayed_assignment
+
+    state = replay(args.log)
+    groups = load_final_groups(args)
+    assignment = replayed_assignment(groups, state)
+    print_roster(groups, assignment)
+    placed = sum(len(group.MEMBERS) for group, slot in zip(groups, assignment) if slot is not None)
+    print(f"{placed} people placed after {state.events} events, occupancy {state.slots}")
 
-    # Process and group people
-    final_groups, best_placement = execution(data)
 
-    # Display the results
+def command_run(args: argparse.Namespace) -> None:
+    """
+    Run the whole pipeline from the CSV and display the placement.
+    """
+    final_groups, best_placement = execution(load_data(args.data))
     display_result(best_placement, final_groups)
+
+
+def command_report(args: argparse.Namespace) -> None:
+    """
+    Run the whole pipeline from the CSV, display the placement and report every stage.
+    """
+    profiler = PipelineProfiler(trace_memory=True, cprofile=args.cprofile)
+    final_groups, best_placement = execution(load_data(args.data), profiler)
+    if best_placement is not None:
+        display_result(best_placement, final_groups)
+    print_explanations(explain_unplaced(final_groups, placement_assignment(final_groups, best_placement),
+                                        SLOT_CAPACITY))
+
+    report = profiler.to_json(args.profile)
+    if args.profile is None:
+        print(report)
+    if args.cprofile:
+        print(profiler.format_profile())
+
+
+def command_scenarios(args: argparse.Namespace) -> None:
+    """
+    Place the final groups under several capacity scenarios and print the comparison table.
+    """
+    from scenarios import capacity_grid, load_scenarios, run_scenarios
+
+    groups = load_final_groups(args)
+    scenarios = [{'name': 'baseline', 'slot_capacity': SLOT_CAPACITY}]
+    if args.file is not None:
+        scenarios += load_scenarios(args.file)
+    if args.vary or args.terms:
+        scenarios += capacity_grid(SLOT_CAPACITY, dict(args.vary), tuple(args.terms or (1,)))
+
+    table = run_scenarios(groups, scenarios, args.workers, args.engine, args.time_budget)
+    print(table.to_string(index=False))
+    if args.output is not None:
+        table.to_csv(args.output, index=False)
+        print(f"Comparison written to {args.output}")
+
+
+def parse_weight(text: str) -> Tuple[str, float]:
+    """
+    Parse a NAME=VALUE objective weight given on the command line.
+    """
+    name, _, value = text.partition('=')
+    if name not in ('headcount', 'priority', 'integrity', 'balance'):
+        raise argparse.ArgumentTypeError(f"Unknown weight {name!r}")
+    try:
+        return name, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Weight {name!r} needs a number, not {value!r}")
+
+
+def parse_variation(text: str) -> Tuple[object, List[int]]:
+    """
+    Parse a SLOTS=VALUES capacity variation given on the command line, e.g. 61,62,63=10,20.
+    """
+    slots_text, _, values_text = text.partition('=')
+    try:
+        slot_numbers = tuple(int(slot) for slot in slots_text.split(','))
+        values = [int(value) for value in values_text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Variation {text!r} needs slot numbers and capacities, e.g. 61,62=10,20")
+    unknown = [slot for slot in slot_numbers if slot not in SLOT_CAPACITY]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown slot {unknown[0]} in variation {text!r}")
+    return slot_numbers if len(slot_numbers) > 1 else slot_numbers[0], values
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line interface.
+
+    Returns:
+        argparse.ArgumentParser: Parser with the run, ingest, group, place, scenarios, replay and report subcommands.
+    """
+    parser = argparse.ArgumentParser(description="BounSailing group placement.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--data', default=DATA_FILE_PATH, help="Path to the responses CSV.")
+    common.add_argument('--cache-dir', default=CACHE_DIR, help="Directory of the parsed applicants and groups cache.")
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    run = subparsers.add_parser('run', parents=[common], help="Run the whole pipeline and display the placement.")
+    run.set_defaults(handler=command_run)
+
+    ingest = subparsers.add_parser('ingest', parents=[common], help="Parse and cache the applicants.")
+    ingest.add_argument('--stream', action='store_true',
+                        help="Read --data chunk by chunk with bounded memory; it may also be a directory or glob of "
+                             "CSV archives. The applicants are reported but not cached.")
+    ingest.add_argument('--chunksize', type=int, default=10_000, help="Rows per chunk of --stream.")
+    ingest.set_defaults(handler=command_ingest)
+
+    group = subparsers.add_parser('group', parents=[common], help="Build the friendship groups.")
+    group.add_argument('--show', action='store_true', help="Print every group.")
+    group.set_defaults(handler=command_group)
+
+    place = subparsers.add_parser('place', parents=[common], help="Place the groups into the slots.")
+    place.add_argument('--engine', choices=['greedy', 'indexed', 'exact', 'weighted', 'multistart'], default='indexed')
+    place.add_argument('--weight', type=parse_weight, action='append', default=[], metavar='NAME=VALUE',
+                       help="Objective weight of the weighted engine: headcount, priority, integrity or balance.")
+    place.add_argument('--time-budget', type=float, default=2.0,
+                       help="Time limit of the exact engine, or search time per worker of the multistart engine, "
+                            "in seconds.")
+    place.add_argument('--seed', type=int, default=0, help="Base seed of the multistart engine, worker i uses seed + i.")
+    place.add_argument('--workers', type=int, default=None,
+                       help="Worker processes of the multistart engine, defaults to the CPU count.")
+    place.add_argument('--output', default=None, help="Export the placement to a .csv, .parquet or .xlsx file.")
+    place.add_argument('--log', default=None, help="Append a snapshot of the placement to this placement log.")
+    place.add_argument('--by-level', action='store_true',
+                       help="Place every course level into its own capacities from the slot configuration.")
+    place.add_argument('--terms', type=int, nargs='?', const=len(SLOT_CONFIG.terms), default=None, metavar='N',
+                       help="Schedule N terms, rolling unplaced groups forward; defaults to the configured terms. "
+                            "Terms beyond the configured ones use the default capacities.")
+    place.set_defaults(handler=command_place)
+
+    scenarios = subparsers.add_parser('scenarios', parents=[common],
+                                      help="Compare placements under several capacity scenarios.")
+    scenarios.add_argument('--file', default=None, help="JSON file of scenarios, see scenarios.load_scenarios.")
+    scenarios.add_argument('--vary', type=parse_variation, action='append', default=[], metavar='SLOTS=VALUES',
+                           help="Capacities to try for one or more slots, e.g. 61,62,63=10,20; every combination is run.")
+    scenarios.add_argument('--terms', type=int, nargs='+', default=None, metavar='N', help="Term counts to try.")
+    scenarios.add_argument('--engine', choices=['greedy', 'indexed', 'exact'], default='indexed')
+    scenarios.add_argument('--time-budget', type=float, default=2.0, help="Time limit of the exact engine per term.")
+    scenarios.add_argument('--workers', type=int, default=None, help="Worker processes, defaults to the CPU count.")
+    scenarios.add_argument('--output', default=None, help="Write the comparison table to this CSV file.")
+    scenarios.set_defaults(handler=command_scenarios)
+
+    replay = subparsers.add_parser('replay', parents=[common], help="Rebuild a placement from a placement log.")
+    replay.add_argument('--log', required=True, help="Placement log written by place --log or the service.")
+    replay.set_defaults(handler=command_replay)
+
+    report = subparsers.add_parser('report', parents=[common], help="Run the whole pipeline and report every stage.")
+    report.add_argument('--profile', default=None, help="Write the stage report as JSON to this file.")
+    report.add_argument('--cprofile', action='store_true', help="Print cProfile statistics of all stages.")
+    report.set_defaults(handler=command_report)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run one subcommand, the whole pipeline when none is given.
+
+    Args:
+        argv (List[str], optional): Command-line arguments, defaults to sys.argv.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    parser = build_parser()
+    if not argv or argv[0] not in ('run', 'ingest', 'group', 'place', 'scenarios', 'replay', 'report', '-h', '--help'):
+        argv = ['run'] + argv
+    args = parser.parse_args(argv)
+    if args.command == 'place':
+        if args.terms is not None and args.terms < 1:
+            parser.error("--terms needs at least one term")
+        if args.by_level and args.terms is not None:
+            parser.error("--by-level and --terms cannot be combined")
+        if (args.by_level or args.terms is not None) and (args.engine in ('weighted', 'multistart')
+                                                          or args.log is not None):
+            parser.error("--by-level and --terms work with the greedy, indexed and exact engines and without --log")
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from placement import indexed_assignment
+from schemas import Group
+from solver import build_problem, greedy_assignment, assignment_to_frame
+
+# Headcount counts people, priority counts people weighted by how early their group applied,
+# integrity counts friendships kept inside placed groups and balance penalizes uneven slot utilization
+DEFAULT_WEIGHTS = {'headcount': 1.0, 'priority': 0.2, 'integrity': 0.1, 'balance': 0.05}
+
+
+def group_terms(groups: List[Group]) -> Tuple[List[float], List[int]]:
+    """
+    Compute the per-group priority and friendship terms of the objective.
+
+    Args:
+        groups (List[Group]): Groups to place, sorted by APPLY_DATE.
+
+    Returns:
+        Tuple[List[float], List[int]]: Priority per group (1 for the earliest group, approaching 0
+        for the latest) and the number of friendships between members of the same group.
+    """
+    group_count = len(groups)
+    priorities = [1.0 - group_index / group_count for group_index in range(group_count)]
+
+    friendships = []
+    for group in groups:
+        member_ids = {member.STD_NUMBER for member in group.MEMBERS}
+        pairs = {frozenset((member.STD_NUMBER, friend)) for member in group.MEMBERS for friend in member.FRIENDS
+                 if friend in member_ids and friend != member.STD_NUMBER}
+        friendships.append(len(pairs))
+
+    return priorities, friendships
+
+
+def group_values(sizes: List[int], priorities: List[float], friendships: List[int],
+                 weights: Dict[str, float]) -> List[float]:
+    """
+    Combine the linear objective terms into one value per placed group.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        priorities (List[float]): Priority per group from group_terms.
+        friendships (List[int]): Friendships inside every group from group_terms.
+        weights (Dict[str, float]): Objective weights, see DEFAULT_WEIGHTS.
+
+    Returns:
+        List[float]: Objective gained by placing each group.
+    """
+    return [weights['headcount'] * size + weights['priority'] * size * priority + weights['integrity'] * links
+            for size, priority, links in zip(sizes, priorities, friendships)]
+
+
+def imbalance(load: List[int], capacities: List[int]) -> float:
+    """
+    Measure how unevenly the placed people are spread over the slots.
+
+    Args:
+        load (List[int]): Placed people per slot index.
+        capacities (List[int]): Capacity per slot index.
+
+    Returns:
+        float: Number of people that would have to move for every slot to reach the same utilization.
+    """
+    total_capacity = sum(capacities)
+    if not total_capacity:
+        return 0.0
+    utilization = sum(load) / total_capacity
+    return 0.5 * sum(abs(people - utilization * capacity) for people, capacity in zip(load, capacities))
+
+
+def objective_components(sizes: List[int], assignment: List[int], capacities: List[int], priorities: List[float],
+                         friendships: List[int], weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Evaluate every objective component of an assignment.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups.
+        capacities (List[int]): Capacity per slot index.
+        priorities (List[float]): Priority per group from group_terms.
+        friendships (List[int]): Friendships inside every group from group_terms.
+        weights (Dict[str, float]): Objective weights, see DEFAULT_WEIGHTS.
+
+    Returns:
+        Dict[str, float]: Placed people and groups, the priority score, kept friendships, the
+        slot imbalance, the utilization range and the weighted objective.
+    """
+    load = [0] * len(capacities)
+    placed, placed_groups, priority, kept = 0, 0, 0.0, 0
+    for group_index, slot_index in enumerate(assignment):
+        if slot_index >= 0:
+            size = sizes[group_index]
+            load[slot_index] += size
+            placed += size
+            placed_groups += 1
+            priority += size * priorities[group_index]
+            kept += friendships[group_index]
+
+    slot_imbalance = imbalance(load, capacities)
+    utilization = [people / capacity for people, capacity in zip(load, capacities) if capacity > 0]
+
+    return {
+        'placed_people': placed,
+        'placed_groups': placed_groups,
+        'priority': priority,
+        'kept_friendships': kept,
+        'imbalance': slot_imbalance,
+        'utilization_range': max(utilization) - min(utilization) if utilization else 0.0,
+        'objective': (weights['headcount'] * placed + weights['priority'] * priority +
+                      weights['integrity'] * kept - weights['balance'] * slot_imbalance)
+    }
+
+
+def objective_value(values: List[float], assignment: List[int], sizes: List[int], capacities: List[int],
+                    balance_weight: float) -> float:
+    """
+    Evaluate the weighted objective from precomputed group values.
+
+    Args:
+        values (List[float]): Objective gained by placing each group, from group_values.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups.
+        sizes (List[int]): Number of members per group.
+        capacities (List[int]): Capacity per slot index.
+        balance_weight (float): Weight of the slot imbalance penalty.
+
+    Returns:
+        float: The weighted objective.
+    """
+    load = [0] * len(capacities)
+    total = 0.0
+    for group_index, slot_index in enumerate(assignment):
+        if slot_index >= 0:
+            load[slot_index] += sizes[group_index]
+            total += values[group_index]
+    return total - balance_weight * imbalance(load, capacities) if balance_weight else total
+
+
+def lagrangian_primal(sizes: List[int], group_slots: List[List[int]], capacities: List[int],
+                      values: List[float], multipliers: List[float]) -> List[int]:
+    """
+    Turn the multipliers of the relaxation into a feasible assignment.
+
+    Groups are placed in decreasing order of their reduced value per person, each into its
+    cheapest slot (lowest multiplier) that still has room.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        capacities (List[int]): Capacity per slot index.
+        values (List[float]): Objective gained by placing each group.
+        multipliers (List[float]): Price per person of every slot.
+
+    Returns:
+        List[int]: Slot index per group, -1 for unplaced groups.
+    """
+    def reduced_value(group_index: int) -> float:
+        cheapest = min(multipliers[slot_index] for slot_index in group_slots[group_index])
+        return values[group_index] / sizes[group_index] - cheapest
+
+    order = sorted((group_index for group_index in range(len(sizes)) if group_slots[group_index]),
+                   key=reduced_value, reverse=True)
+
+    remaining = list(capacities)
+    assignment = [-1] * len(sizes)
+    for group_index in order:
+        size = sizes[group_index]
+        for slot_index in sorted(group_slots[group_index], key=multipliers.__getitem__):
+            if size <= remaining[slot_index]:
+                remaining[slot_index] -= size
+                assignment[group_index] = slot_index
+                break
+    return assignment
+
+
+def improve_weighted(sizes: List[int], group_slots: List[List[int]], capacities: List[int], values: List[float],
+                     assignment: List[int], balance_weight: float) -> int:
+    """
+    Improve an assignment in place with insert, replace and relocate moves that raise the objective.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        capacities (List[int]): Capacity per slot index.
+        values (List[float]): Objective gained by placing each group.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups. Updated in place.
+        balance_weight (float): Weight of the slot imbalance penalty.
+
+    Returns:
+        int: Number of accepted moves.
+    """
+    load = [0] * len(capacities)
+    members: List[List[int]] = [[] for _ in capacities]
+    for group_index, slot_index in enumerate(assignment):
+        if slot_index >= 0:
+            load[slot_index] += sizes[group_index]
+            members[slot_index].append(group_index)
+
+    def penalty() -> float:
+        return balance_weight * imbalance(load, capacities) if balance_weight else 0.0
+
+    moves = 0
+    improved = True
+    while improved:
+        improved = False
+        current_penalty = penalty()
+
+        # Insert an unplaced group, replacing one placed group of lower value if the slot is full
+        for group_index in sorted((index for index, slot in enumerate(assignment) if slot < 0 and group_slots[index]),
+                                  key=lambda index: -values[index]):
+            size = sizes[group_index]
+            best_gain, best_move = 1e-9, None
+            for slot_index in group_slots[group_index]:
+                free = capacities[slot_index] - load[slot_index]
+                candidates = [None] if size <= free else [other for other in members[slot_index]
+                                                           if size <= free + sizes[other]]
+                for other_index in candidates:
+                    removed = 0 if other_index is None else sizes[other_index]
+                    load[slot_index] += size - removed
+                    gain = (values[group_index] - (0.0 if other_index is None else values[other_index])
+                            - penalty() + current_penalty)
+                    load[slot_index] -= size - removed
+                    if gain > best_gain:
+                        best_gain, best_move = gain, (slot_index, other_index)
+
+            if best_move is not None:
+                slot_index, other_index = best_move
+                if other_index is not None:
+                    members[slot_index].remove(other_index)
+                    assignment[other_index] = -1
+                    load[slot_index] -= sizes[other_index]
+                members[slot_index].append(group_index)
+                assignment[group_index] = slot_index
+                load[slot_index] += size
+                current_penalty = penalty()
+                moves += 1
+                improved = True
+
+        # Relocate placed groups to spread the load more evenly
+        if balance_weight:
+            for group_index, slot_index in enumerate(assignment):
+                if slot_index < 0:
+                    continue
+                size = sizes[group_index]
+                for target in group_slots[group_index]:
+                    if target == slot_index or load[target] + size > capacities[target]:
+                        continue
+                    load[slot_index] -= size
+                    load[target] += size
+                    if penalty() < current_penalty - 1e-9:
+                        members[slot_index].remove(group_index)
+                        members[target].append(group_index)
+                        assignment[group_index] = target
+                        current_penalty = penalty()
+                        moves += 1
+                        improved = True
+                        break
+                    load[slot_index] += size
+                    load[target] -= size
+
+    return moves
+
+
+def weighted_assignment(sizes: List[int], group_slots: List[List[int]], capacities: List[int], values: List[float],
+                        balance_weight: float, incumbent: Optional[List[int]] = None, iterations: int = 300,
+                        time_budget: float = 2.0) -> Tuple[List[int], float, int]:
+    """
+    Maximize the weighted objective with a Lagrangian relaxation of the slot capacities.
+
+    Relaxing the capacities splits the problem into one independent choice per group, whose
+    optimum is an upper bound of the linear objective terms. The slot prices are adjusted with
+    subgradient steps; every iteration turns the prices into a feasible assignment and the best
+    one, improved with local moves, is returned.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        capacities (List[int]): Capacity per slot index.
+        values (List[float]): Objective gained by placing each group, from group_values.
+        balance_weight (float): Weight of the slot imbalance penalty.
+        incumbent (List[int], optional): Warm start assignment, e.g. the greedy result.
+        iterations (int): Maximum number of subgradient iterations.
+        time_budget (float): Wall time limit in seconds.
+
+    Returns:
+        Tuple[List[int], float, int]: The best assignment, the upper bound of the objective and the
+        number of iterations run.
+    """
+    start = time.perf_counter()
+    slot_count = len(capacities)
+
+    best = list(incumbent) if incumbent is not None else [-1] * len(sizes)
+    best_value = objective_value(values, best, sizes, capacities, balance_weight)
+    upper_bound = float('inf')
+    multipliers = [0.0] * slot_count
+    step_scale = 2.0
+    stalled = 0
+
+    iteration = 0
+    for iteration in range(1, iterations + 1):
+        # Relaxed problem: every group takes its best slot at the current prices, if that pays off
+        load = [0] * slot_count
+        bound = sum(price * capacity for price, capacity in zip(multipliers, capacities))
+        for group_index, allowed in enumerate(group_slots):
+            if not allowed:
+                continue
+            size = sizes[group_index]
+            slot_index = min(allowed, key=multipliers.__getitem__)
+            reduced = values[group_index] - multipliers[slot_index] * size
+            if reduced > 0:
+                bound += reduced
+                load[slot_index] += size
+
+        if bound < upper_bound - 1e-9:
+            upper_bound = bound
+            stalled = 0
+        else:
+            stalled += 1
+            if stalled >= 10:
+                step_scale /= 2
+                stalled = 0
+
+        candidate = lagrangian_primal(sizes, group_slots, capacities, values, multipliers)
+        candidate_value = objective_value(values, candidate, sizes, capacities, balance_weight)
+        if candidate_value > best_value:
+            best, best_value = candidate, candidate_value
+
+        if upper_bound - best_value <= 1e-6 or step_scale < 1e-4 or time.perf_counter() - start > time_budget:
+            break
+
+        subgradient = [people - capacity for people, capacity in zip(load, capacities)]
+        norm = sum(value * value for value in subgradient)
+        if not norm:
+            break
+        step = step_scale * (bound - best_value) / norm
+        multipliers = [max(0.0, price + step * value) for price, value in zip(multipliers, subgradient)]
+
+    improve_weighted(sizes, group_slots, capacities, values, best, balance_weight)
+    return best, upper_bound, iteration
+
+
+def solve_weighted(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int],
+                   weights: Optional[Dict[str, float]] = None, iterations: int = 300,
+                   time_budget: float = 2.0) -> Tuple[List[int], List[int], Dict[str, object]]:
+    """
+    Place groups maximizing a weighted objective of headcount, priority, group integrity and slot balance.
+
+    The greedy and the indexed placements are evaluated first and the better one warm starts the
+    Lagrangian search, so the objective never drops below them.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        weights (Dict[str, float], optional): Objective weights, missing ones default to DEFAULT_WEIGHTS.
+        iterations (int): Maximum number of subgradient iterations.
+        time_budget (float): Wall time limit of the search in seconds.
+
+    Returns:
+        Tuple[List[int], List[int], Dict[str, object]]: Slot index per group (-1 for unplaced groups),
+        slot number per slot index and a report with every objective component, the upper bound and the gap.
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    start = time.perf_counter()
+
+    sizes, group_slots, slot_numbers, remaining = build_problem(groups, slots, slot_capacity)
+    priorities, friendships = group_terms(groups)
+    values = group_values(sizes, priorities, friendships, weights)
+
+    warm_starts = [greedy_assignment(sizes, group_slots, remaining), indexed_assignment(sizes, group_slots, remaining)]
+    incumbent = max(warm_starts, key=lambda assignment: objective_value(values, assignment, sizes, remaining,
+                                                                        weights['balance']))
+    greedy_objective = objective_value(values, warm_starts[0], sizes, remaining, weights['balance'])
+
+    assignment, upper_bound, iterations_run = weighted_assignment(sizes, group_slots, remaining, values,
+                                                                  weights['balance'], incumbent, iterations,
+                                                                  time_budget)
+    report = objective_components(sizes, assignment, remaining, priorities, friendships, weights)
+    report.update({
+        'weights': weights,
+        'greedy_objective': greedy_objective,
+        'upper_bound': upper_bound,
+        'gap': (upper_bound - report['objective']) / upper_bound if upper_bound > 0 else 0.0,
+        'iterations': iterations_run,
+        'seconds': time.perf_counter() - start
+    })
+
+    return assignment, slot_numbers, report
+
+
+def weighted_placement(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int],
+                       weights: Optional[Dict[str, float]] = None, iterations: int = 300,
+                       time_budget: float = 2.0) -> Tuple['pd.DataFrame', Dict[str, object]]:
+    """
+    Place groups with solve_weighted and return the result in the place_groups format.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        weights (Dict[str, float], optional): Objective weights, missing ones default to DEFAULT_WEIGHTS.
+        iterations (int): Maximum number of subgradient iterations.
+        time_budget (float): Wall time limit of the search in seconds.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, object]]: Placement dataframe in the place_groups format and the
+        report of solve_weighted.
+    """
+    assignment, slot_numbers, report = solve_weighted(groups, slots, slot_capacity, weights, iterations, time_budget)
+    return assignment_to_frame(groups, assignment, slot_numbers, slots), report
+
+
+def sweep_weights(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int],
+                  weight_sets: List[Dict[str, float]], iterations: int = 300,
+                  time_budget: float = 0.5) -> 'pd.DataFrame':
+    """
+    Solve the same groups under many weight sets to compare the objective components.
+
+    The groups are converted into the solver representation once, so each weight set only costs
+    one search.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        weight_sets (List[Dict[str, float]]): Weights to try, missing ones default to DEFAULT_WEIGHTS.
+        iterations (int): Maximum number of subgradient iterations per weight set.
+        time_budget (float): Wall time limit per weight set in seconds.
+
+    Returns:
+        pd.DataFrame: One row per weight set with the weights and every objective component.
+    """
+    import pandas as pd
+
+    sizes, group_slots, _, remaining = build_problem(groups, slots, slot_capacity)
+    priorities, friendships = group_terms(groups)
+    warm_starts = [greedy_assignment(sizes, group_slots, remaining), indexed_assignment(sizes, group_slots, remaining)]
+
+    rows = []
+    for weight_set in weight_sets:
+        weights = {**DEFAULT_WEIGHTS, **weight_set}
+        values = group_values(sizes, priorities, friendships, weights)
+        incumbent = max(warm_starts, key=lambda assignment: objective_value(values, assignment, sizes, remaining,
+                                                                            weights['balance']))
+        assignment, upper_bound, _ = weighted_assignment(sizes, group_slots, remaining, values, weights['balance'],
+                                                         incumbent, iterations, time_budget)
+        row = {f"{name}_weight": value for name, value in weights.items()}
+        row.update(objective_components(sizes, assignment, remaining, priorities, friendships, weights))
+        row['upper_bound'] = upper_bound
+        rows.append(row)
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,166 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from schemas import Group, BIT_SLOTS
+
+# Column j of every array below is the slot BIT_SLOTS[j], the order Group.COURSE_SLOTS lists slots in
+SLOT_COLUMNS = np.array(BIT_SLOTS, dtype=np.int64)
+
+
+def eligibility_matrix(groups: List[Group]) -> np.ndarray:
+    """
+    Build the groups x slots eligibility matrix from the groups' slot masks.
+
+    Args:
+        groups (List[Group]): Groups to place.
+
+    Returns:
+        np.ndarray: Boolean matrix, True where all members of the group can attend the slot.
+    """
+    # Slot masks grow with the catalogue, so they are unpacked byte-wise instead of cast to a fixed-width integer
+    byte_count = (len(BIT_SLOTS) + 7) // 8
+    buffer = b''.join(group.SLOT_MASK.to_bytes(byte_count, 'little') for group in groups)
+    masks = np.frombuffer(buffer, dtype=np.uint8).reshape(len(groups), byte_count)
+    return np.unpackbits(masks, axis=1, count=len(BIT_SLOTS), bitorder='little').astype(bool)
+
+
+def size_vector(groups: List[Group]) -> np.ndarray:
+    """
+    Build the group size vector.
+
+    Args:
+        groups (List[Group]): Groups to place.
+
+    Returns:
+        np.ndarray: Number of members per group.
+    """
+    return np.fromiter((len(group.MEMBERS) for group in groups), dtype=np.int64, count=len(groups))
+
+
+def capacity_vector(slot_capacity: Dict[int, int], slots: Optional[Dict[int, int]] = None) -> np.ndarray:
+    """
+    Build the remaining capacity vector over the slot columns.
+
+    Args:
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        slots (Dict[int, int], optional): Current occupancy per slot, empty slots if not provided.
+
+    Returns:
+        np.ndarray: Remaining capacity per slot column, 0 for slots without capacity.
+    """
+    slots = slots or {}
+    return np.array([max(slot_capacity.get(slot, 0) - slots.get(slot, 0), 0) for slot in BIT_SLOTS], dtype=np.int64)
+
+
+def feasibility(eligibility: np.ndarray, sizes: np.ndarray, remaining: np.ndarray) -> np.ndarray:
+    """
+    Check every group against every slot in one operation.
+
+    Args:
+        eligibility (np.ndarray): Groups x slots eligibility matrix.
+        sizes (np.ndarray): Number of members per group.
+        remaining (np.ndarray): Remaining capacity per slot column.
+
+    Returns:
+        np.ndarray: Boolean matrix, True where the group can attend the slot and still fits into it.
+    """
+    return eligibility & (sizes[:, None] <= remaining[None, :])
+
+
+def first_fit(eligibility: np.ndarray, sizes: np.ndarray, remaining: np.ndarray) -> np.ndarray:
+    """
+    Place every group into its first slot with enough room, in group order, with batched feasibility checks.
+
+    Every round checks all pending groups against the current capacities at once and lets each
+    feasible group take its first feasible slot. Capacities only shrink, so a group that does not
+    fit anywhere now never will, and a group keeps its choice as long as the groups before it in
+    the same slot leave room for it. The round therefore accepts every group up to the first one
+    whose slot overflows, and the next round continues from that group. The result equals the
+    sequential loop of place_groups and greedy_assignment.
+
+    Args:
+        eligibility (np.ndarray): Groups x slots eligibility matrix.
+        sizes (np.ndarray): Number of members per group.
+        remaining (np.ndarray): Remaining capacity per slot column.
+
+    Returns:
+        np.ndarray: Slot column per group, -1 for unplaced groups.
+    """
+    remaining = remaining.copy()
+    assignment = np.full(len(sizes), -1, dtype=np.intp)
+    # Smallest unsigned type that holds every slot column, a stable sort of 8- or 16-bit keys is a radix sort
+    key_type = np.min_scalar_type(max(len(remaining) - 1, 0))
+    pending = np.arange(len(sizes))
+
+    while pending.size:
+        feasible = feasibility(eligibility[pending], sizes[pending], remaining)
+        placeable = feasible.any(axis=1)
+        pending, feasible = pending[placeable], feasible[placeable]
+        if not pending.size:
+            break
+        choice = feasible.argmax(axis=1)
+        pending_sizes = sizes[pending]
+
+        # Running demand of every slot in group order, computed per slot after a stable sort by slot
+        order = np.argsort(choice.astype(key_type), kind='stable')
+        sorted_choice = choice[order]
+        running = np.cumsum(pending_sizes[order])
+        starts = np.flatnonzero(np.r_[True, sorted_choice[1:] != sorted_choice[:-1]])
+        running -= np.repeat(np.r_[0, running[starts[1:] - 1]], np.diff(np.r_[starts, len(order)]))
+        overflow = order[running > remaining[sorted_choice]]
+        accepted = overflow.min() if overflow.size else len(pending)
+
+        assignment[pending[:accepted]] = choice[:accepted]
+        remaining -= np.bincount(choice[:accepted], weights=pending_sizes[:accepted],
+                                 minlength=len(remaining)).astype(np.int64)
+        pending = pending[accepted:]
+
+    return assignment
+
+
+def evaluate_assignments(assignments: np.ndarray, sizes: np.ndarray, eligibility: np.ndarray,
+                         remaining: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Evaluate many candidate assignments at once.
+
+    Args:
+        assignments (np.ndarray): Candidates x groups matrix of slot columns, -1 for unplaced groups.
+        sizes (np.ndarray): Number of members per group.
+        eligibility (np.ndarray): Groups x slots eligibility matrix.
+        remaining (np.ndarray): Remaining capacity per slot column.
+
+    Returns:
+        Dict[str, np.ndarray]: Per candidate the placed people ('placed_people'), the people per slot
+        column ('load'), and whether every group is in a slot it can attend and no slot is over
+        capacity ('feasible').
+    """
+    assignments = np.atleast_2d(assignments)
+    candidates, group_count = assignments.shape
+    placed = assignments >= 0
+    columns = np.where(placed, assignments, 0)
+
+    # One bincount over (candidate, column) pairs gives the load of every slot in every candidate
+    flat = (np.arange(candidates)[:, None] * len(remaining) + columns)[placed]
+    load = np.bincount(flat, weights=np.broadcast_to(sizes, assignments.shape)[placed],
+                       minlength=candidates * len(remaining)).astype(np.int64).reshape(candidates, len(remaining))
+
+    eligible = eligibility[np.arange(group_count)[None, :], columns] | ~placed
+    return {
+        'placed_people': load.sum(axis=1),
+        'load': load,
+        'feasible': eligible.all(axis=1) & (load <= remaining[None, :]).all(axis=1)
+    }
+
+
+def columns_to_slots(assignment: np.ndarray) -> List[Optional[int]]:
+    """
+    Convert slot columns into slot numbers.
+
+    Args:
+        assignment (np.ndarray): Slot column per group, -1 for unplaced groups.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    return [int(SLOT_COLUMNS[column]) if column >= 0 else None for column in assignment.tolist()]
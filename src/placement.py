@@ -1,44 +1,43 @@
-import pandas as pd
+import heapq
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from slot_config import SLOT_CONFIG
+from solver import greedy_assignment, placed_people, max_flow_bound, branch_and_bound
+
 
-# TODO: Seperate the slots according to course level
 def course_slots_creating(course_slots, term_count=None, quotas=None):
     """
-    Create slot quotas for multiple course terms based on user input or provided arguments.
+    Create slot quotas for multiple course terms from the slot configuration or provided arguments.
 
     Args:
         course_slots (list[int]): List of slot identifiers.
-        term_count (int, optional): Number of terms to create slots for. Will prompt if not provided.
-        quotas (dict, optional): A dictionary of pre-set quotas for each slot. Will prompt if not provided.
+        term_count (int, optional): Number of terms to create slots for. Defaults to the configured terms.
+        quotas (dict, optional): A dictionary of pre-set quotas that override the configured capacities.
 
     Returns:
-        dict: A dictionary where keys are slot-term combinations (e.g., "11_1") and values are quotas.
+        dict: A dictionary where keys are (term, slot) combinations (e.g., (1, 11)) and values are quotas.
+            Terms are numbered from 1. A quota keyed by a plain slot applies to every term, a quota keyed
+            by (term, slot) only to that term. Quotas that are neither provided nor configured are 0.
     """
-    # If term count is not provided, prompt the user
+    configured = SLOT_CONFIG.term_capacity()
     if term_count is None:
-        term_count = int(input("Please write how many terms do you want for creating slots? "
-                               "(e.g. 2 for October and November course terms): "))
+        term_count = len(SLOT_CONFIG.terms)
 
     # Initialize an empty dictionary for slot quotas
     slot_quotas = {}
 
-    # If quotas aren't provided, prompt the user for each slot-term combination
-    if quotas is None:
-        for term in range(term_count):
-            print(f"\nEntering quotas for term {term + 1}:")
-            for slot in course_slots:
-                slot_quotas[slot] = int(
-                    input(f"Please write the quota for the slot {slot} in term {term + 1}: "))
-    else:
-        # If pre-set quotas are provided, use them directly
-        for term in range(term_count):
-            for slot in course_slots:
-                slot_key = slot
-                if slot_key in quotas:
-                    slot_quotas[slot_key] = quotas[slot_key]
-                else:
-                    # If some quotas are missing in provided dict, prompt for them
-                    slot_quotas[slot_key] = int(
-                        input(f"Please write the quota for the slot {slot} in term {term + 1}: "))
+    for term in range(1, term_count + 1):
+        for slot in course_slots:
+            slot_key = (term, slot)
+            if quotas is not None and slot_key in quotas:
+                slot_quotas[slot_key] = quotas[slot_key]
+            elif quotas is not None and slot in quotas:
+                slot_quotas[slot_key] = quotas[slot]
+            else:
+                # Terms beyond the configured ones use the default capacities
+                slot_quotas[slot_key] = configured.get(slot_key, SLOT_CONFIG.capacities.get(slot, 0))
 
     return slot_quotas
 
@@ -47,6 +46,9 @@ def place_groups(groups, slots, slot_capacity):
     """
     Place groups into available slots based on their preferences and application times.
 
+    The feasibility of all pending groups against all slots is checked in one batched operation
+    per step over the groups x slots eligibility matrix, see occupancy.first_fit.
+
     Args:
         groups (List[Group]): List of groups to place.
         slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
@@ -55,53 +57,44 @@ def place_groups(groups, slots, slot_capacity):
     Returns:
         pd.DataFrame: A dataframe with group placement details.
     """
+    import numpy as np
+    import pandas as pd
+    from occupancy import SLOT_COLUMNS, eligibility_matrix, size_vector, capacity_vector, first_fit
 
-    # Initialize the result tracking
-    placements = []
-    unplaced_groups = []
+    eligibility = eligibility_matrix(groups)
+    sizes = size_vector(groups)
+    remaining = capacity_vector(slot_capacity, slots)
+
+    def place_round(group_indexes, round_eligibility):
+        # Place the groups with first-fit and record their placement details
+        assignment = first_fit(round_eligibility, sizes[group_indexes], remaining)
+        placed = assignment >= 0
+        load = np.bincount(assignment[placed], weights=sizes[group_indexes][placed],
+                           minlength=len(remaining)).astype(np.int64)
+        remaining[:] -= load
+        # Update slot capacity
+        for slot, people in zip(SLOT_COLUMNS.tolist(), load.tolist()):
+            if people:
+                slots[slot] += people
+        placements = pd.DataFrame([{
+            'group': [member.FULLNAME for member in groups[group_index].MEMBERS],
+            'std_numbers': [member.STD_NUMBER for member in groups[group_index].MEMBERS],
+            'slot': int(SLOT_COLUMNS[column]),
+            'apply_date': groups[group_index].APPLY_DATE
+        } for group_index, column in zip(group_indexes[placed].tolist(), assignment[placed].tolist())])
+        return placements, group_indexes[~placed]
 
     # First placement loop: try to place all groups based on their first preference
-    for group in groups:
-        placed = False
-        for preferred_slot in group.COURSE_SLOTS:
-            if slots[preferred_slot] + len(group.MEMBERS) <= slot_capacity[preferred_slot]:
-                # Place the group in this slot
-                placements.append({
-                    'group': [member.FULLNAME for member in group.MEMBERS],
-                    'slot': preferred_slot,
-                    'apply_date': group.APPLY_DATE
-                })
-                # Update slot capacity
-                slots[preferred_slot] += len(group.MEMBERS)
-                placed = True
-                break
-
-        if not placed:
-            unplaced_groups.append(group)
-
-    # Save the result of this round
-    df_first_round = pd.DataFrame(placements)
+    df_first_round, unplaced_groups = place_round(np.arange(len(groups)), eligibility)
 
     # Second placement round: try to place unplaced groups in their second preferences
-    placements = []
-    for group in unplaced_groups:
-        placed = False
-        for preferred_slot in group.COURSE_SLOTS[1:]:  # Start from the second preference
-            if slots[preferred_slot] + len(group.MEMBERS) <= slot_capacity[preferred_slot]:
-                placements.append({
-                    'group': [member.FULLNAME for member in group.MEMBERS],
-                    'slot': preferred_slot,
-                    'apply_date': group.APPLY_DATE
-                })
-                slots[preferred_slot] += len(group.MEMBERS)
-                placed = True
-                break
-
-    df_second_round = pd.DataFrame(placements)
+    later_preferences = eligibility[unplaced_groups].copy()
+    has_preference = later_preferences.any(axis=1)
+    later_preferences[has_preference, later_preferences[has_preference].argmax(axis=1)] = False  # Start from the second preference
+    df_second_round, _ = place_round(unplaced_groups, later_preferences)
 
     return df_first_round, df_second_round
 
-# TODO: Print out the ones who couldn't be placed. Try to solve that.
 def optimize_placements(group_list, slots, slot_capacity):
     """
     Optimize the placement by running multiple rounds of placement and selecting the one
@@ -115,6 +108,8 @@ def optimize_placements(group_list, slots, slot_capacity):
     Returns:
         pd.DataFrame: Optimized placement dataframe.
     """
+    import pandas as pd
+
     best_placement = None
     max_people_placed = 0
 
@@ -130,3 +125,246 @@ def optimize_placements(group_list, slots, slot_capacity):
             max_people_placed = total_placed
 
     return best_placement
+
+
+def indexed_assignment(sizes, group_slots, remaining):
+    """
+    Assign groups most-constrained first using a slot -> groups index and a priority queue.
+
+    Every group's priority is the number of its slots that still have room for it. Each slot keeps
+    its candidate groups sorted by size, so when a slot fills up the groups that no longer fit are
+    found without rescanning, their counts drop and they are pushed again with the new priority.
+    A group takes the feasible slot with the most remaining capacity. Ties are broken by the
+    group order, i.e. APPLY_DATE, which keeps the result deterministic.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+
+    Returns:
+        List[int]: Slot index per group, -1 for unplaced groups.
+    """
+    remaining = list(remaining)
+    assignment = [-1] * len(sizes)
+
+    # Inverted index: candidate groups of every slot sorted by size, largest first
+    slot_groups = [[] for _ in remaining]
+    for group_index, group_slot_list in enumerate(group_slots):
+        for slot_index in group_slot_list:
+            slot_groups[slot_index].append(group_index)
+    for candidates in slot_groups:
+        candidates.sort(key=lambda group_index: -sizes[group_index])
+    pointers = [0] * len(remaining)
+
+    def drop_oversized(slot_index):
+        candidates = slot_groups[slot_index]
+        while pointers[slot_index] < len(candidates) and \
+                sizes[candidates[pointers[slot_index]]] > remaining[slot_index]:
+            group_index = candidates[pointers[slot_index]]
+            pointers[slot_index] += 1
+            if assignment[group_index] < 0:
+                options[group_index] -= 1
+                heapq.heappush(heap, (options[group_index], group_index))
+
+    options = [len(group_slot_list) for group_slot_list in group_slots]
+    heap = [(option_count, group_index) for group_index, option_count in enumerate(options)]
+    heapq.heapify(heap)
+    for slot_index in range(len(remaining)):
+        drop_oversized(slot_index)
+
+    done = [False] * len(sizes)
+    while heap:
+        option_count, group_index = heapq.heappop(heap)
+        if done[group_index] or option_count != options[group_index]:
+            continue  # Stale entry
+        done[group_index] = True
+        if option_count == 0:
+            continue  # Capacities only shrink, so the group can never be placed
+
+        size = sizes[group_index]
+        slot_index = max((slot for slot in group_slots[group_index] if size <= remaining[slot]),
+                         key=lambda slot: remaining[slot])
+        assignment[group_index] = slot_index
+        remaining[slot_index] -= size
+        drop_oversized(slot_index)
+
+    return assignment
+
+
+def solve_assignment(sizes, group_slots, slot_capacity, time_budget=2.0, engine='exact'):
+    """
+    Place groups given as plain sizes and slot numbers, without building Group objects or dataframes.
+
+    Args:
+        sizes (List[int]): Number of members per group, in APPLY_DATE order.
+        group_slots (List[List[int]]): COURSE_SLOTS per group.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and free capacity per slot.
+        time_budget (float): Time limit of the exact search in seconds.
+        engine (str): 'greedy' for the place_groups rule, 'indexed' for the better of the greedy and
+            indexed placements or 'exact' to continue from there with branch-and-bound, which also
+            breaks ties in the headcount by APPLY_DATE.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    if engine not in ('greedy', 'indexed', 'exact'):
+        raise ValueError(f"engine must be 'greedy', 'indexed' or 'exact', not {engine!r}")
+
+    slot_numbers = [slot for slot, capacity in slot_capacity.items() if capacity > 0]
+    slot_index = {slot: index for index, slot in enumerate(slot_numbers)}
+    remaining = [slot_capacity[slot] for slot in slot_numbers]
+    indexed_slots = [[slot_index[slot] for slot in course_slots if slot in slot_index] for course_slots in group_slots]
+
+    assignment = greedy_assignment(sizes, indexed_slots, remaining)
+    if engine != 'greedy':
+        indexed = indexed_assignment(sizes, indexed_slots, remaining)
+        if placed_people(sizes, indexed) > placed_people(sizes, assignment):
+            assignment = indexed
+    if engine == 'exact' and time_budget > 0:
+        # Also runs when the headcount already meets the bound, to break ties by APPLY_DATE
+        bound = max_flow_bound(sizes, indexed_slots, remaining)
+        assignment, _, _ = branch_and_bound(sizes, indexed_slots, remaining, assignment, bound, time_budget)
+
+    return [slot_numbers[slot] if slot >= 0 else None for slot in assignment]
+
+
+def place_level(engine, sizes, group_slots, slot_capacity, time_budget):
+    """
+    Place the groups of one course level, used as the worker of place_by_course_level.
+
+    Args:
+        engine (str): Placement engine of solve_assignment.
+        sizes (List[int]): Number of members per group of this level, in APPLY_DATE order.
+        group_slots (List[List[int]]): COURSE_SLOTS per group of this level.
+        slot_capacity (Dict[int, int]): Free capacity of this level's slots.
+        time_budget (float): Time limit of the exact search in seconds.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    return solve_assignment(sizes, group_slots, slot_capacity, time_budget, engine)
+
+
+def place_by_course_level(groups, level_slots, level_capacity, engine='indexed', time_budget=2.0, workers=None,
+                          use_processes=True):
+    """
+    Place groups separately per COURSE_LEVEL, solving the independent levels concurrently.
+
+    Every level has its own occupancy and capacity table, e.g. 1* and 2* courses run on different
+    boats. Groups of a level without a capacity table stay unplaced. Workers only receive the
+    group sizes and slot lists of their level.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        level_slots (Dict[str, Dict[int, int]]): Current occupancy per course level and slot. Updated in place.
+        level_capacity (Dict[str, Dict[int, int]]): Capacity per course level and slot.
+        engine (str): 'greedy', 'indexed' or 'exact', see solve_assignment.
+        time_budget (float): Time limit of the exact search per level in seconds.
+        workers (int, optional): Number of workers. Defaults to the number of levels.
+        use_processes (bool): Use a process pool, otherwise a thread pool.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for unplaced groups.
+    """
+    groups_by_level = defaultdict(list)
+    for group_index, group in enumerate(groups):
+        if group.COURSE_LEVEL in level_capacity:
+            groups_by_level[group.COURSE_LEVEL].append(group_index)
+
+    assignment = [None] * len(groups)
+    levels = list(groups_by_level)
+    if not levels:
+        return assignment
+
+    workers = workers or min(len(levels), os.cpu_count() or 1)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        futures = {}
+        for level in levels:
+            occupancy = level_slots.setdefault(level, {})
+            free = {slot: capacity - occupancy.get(slot, 0) for slot, capacity in level_capacity[level].items()}
+            futures[level] = executor.submit(place_level, engine,
+                                             [len(groups[group_index].MEMBERS) for group_index in groups_by_level[level]],
+                                             [groups[group_index].COURSE_SLOTS for group_index in groups_by_level[level]],
+                                             free, time_budget)
+        results = {level: future.result() for level, future in futures.items()}
+
+    for level, level_assignment in results.items():
+        occupancy = level_slots[level]
+        for group_index, slot in zip(groups_by_level[level], level_assignment):
+            if slot is not None:
+                assignment[group_index] = slot
+                occupancy[slot] = occupancy.get(slot, 0) + len(groups[group_index].MEMBERS)
+
+    return assignment
+
+
+def solve_terms(sizes, group_slots, term_capacity, time_budget=2.0, engine='indexed'):
+    """
+    Place groups given as plain sizes and slot numbers over several terms, rolling unplaced groups forward.
+
+    Args:
+        sizes (List[int]): Number of members per group, in APPLY_DATE order.
+        group_slots (List[List[int]]): COURSE_SLOTS per group.
+        term_capacity (Dict[Tuple[int, int], int]): Free capacity per (term, slot).
+        time_budget (float): Time limit of the exact search per term in seconds.
+        engine (str): 'greedy', 'indexed' or 'exact', the engine of solve_assignment used for every term.
+
+    Returns:
+        Tuple[List[Optional[int]], List[Optional[int]]]: Term number and slot number per group, both None
+        for groups that are unplaced in every term.
+    """
+    terms = sorted({term for term, _ in term_capacity})
+    slot_numbers = sorted({slot for _, slot in term_capacity})
+
+    group_terms = [None] * len(sizes)
+    assignment = [None] * len(sizes)
+    waiting = list(range(len(sizes)))
+
+    for term in terms:
+        if not waiting:
+            break
+        term_assignment = solve_assignment([sizes[group_index] for group_index in waiting],
+                                           [group_slots[group_index] for group_index in waiting],
+                                           {slot: term_capacity.get((term, slot), 0) for slot in slot_numbers},
+                                           time_budget, engine)
+        for group_index, slot in zip(waiting, term_assignment):
+            if slot is not None:
+                group_terms[group_index] = term
+                assignment[group_index] = slot
+
+        # Unplaced groups roll forward in their original order
+        waiting = [group_index for group_index, slot in zip(waiting, term_assignment) if slot is None]
+
+    return group_terms, assignment
+
+
+def schedule_terms(groups, term_slots, term_capacity, engine='indexed', time_budget=2.0):
+    """
+    Place groups over several course terms in one pass, rolling unplaced groups forward.
+
+    Terms are filled in order. Groups that don't get a slot in a term are offered the next term
+    and keep their original APPLY_DATE priority there. The groups are converted to slot lists once,
+    so adding terms only adds one placement pass per term.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        term_slots (Dict[Tuple[int, int], int]): Current occupancy per (term, slot). Updated in place.
+        term_capacity (Dict[Tuple[int, int], int]): Capacity per (term, slot), e.g. from course_slots_creating.
+        engine (str): 'greedy', 'indexed' or 'exact', the engine of solve_assignment used for every term.
+        time_budget (float): Time limit of the exact search per term in seconds.
+
+    Returns:
+        Tuple[List[Optional[int]], List[Optional[int]]]: Term number and slot number per group, both None
+        for groups that are unplaced in every term.
+    """
+    sizes = [len(group.MEMBERS) for group in groups]
+    free = {key: capacity - term_slots.get(key, 0) for key, capacity in term_capacity.items()}
+    group_terms, assignment = solve_terms(sizes, [group.COURSE_SLOTS for group in groups], free, time_budget, engine)
+
+    for size, term, slot in zip(sizes, group_terms, assignment):
+        if slot is not None:
+            term_slots[(term, slot)] = term_slots.get((term, slot), 0) + size
+
+    return group_terms, assignment
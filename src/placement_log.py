@@ -0,0 +1,350 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from schemas import Group, Human
+
+# Bump when the meaning of an event changes
+LOG_VERSION = 1
+
+
+def group_key(group: Group) -> Tuple[int, ...]:
+    """
+    Identify a group across runs by its member student numbers in member order.
+
+    Args:
+        group (Group): Group whose members are sorted by APPLY_DATE.
+
+    Returns:
+        Tuple[int, ...]: Student numbers of the members.
+    """
+    return tuple(member.STD_NUMBER for member in group.MEMBERS)
+
+
+def human_to_record(person: Human) -> Dict[str, object]:
+    """
+    Serialize an applicant for the log.
+
+    Args:
+        person (Human): The applicant.
+
+    Returns:
+        Dict[str, object]: JSON-compatible record of all application fields.
+    """
+    return {
+        'std_number': person.STD_NUMBER,
+        'fullname': person.FULLNAME,
+        'phone_number': person.PHONE_NUMBER,
+        'apply_date': person.APPLY_DATE.isoformat() if person.APPLY_DATE is not None else None,
+        'is_member': person.isMember,
+        'course_level': person.COURSE_LEVEL,
+        'course_slots': list(person.COURSE_SLOTS),
+        'friends': list(person.FRIENDS),
+        'last_completed_course': person.LAST_COMPLETED_COURSE
+    }
+
+
+def human_from_record(record: Dict[str, object]) -> Human:
+    """
+    Recreate an applicant written by human_to_record.
+
+    Args:
+        record (Dict[str, object]): The logged record.
+
+    Returns:
+        Human: The applicant.
+    """
+    person = Human()
+    person.STD_NUMBER = record['std_number']
+    person.FULLNAME = record['fullname']
+    person.PHONE_NUMBER = record['phone_number']
+    person.APPLY_DATE = datetime.fromisoformat(record['apply_date']) if record['apply_date'] else None
+    person.isMember = record['is_member']
+    person.COURSE_LEVEL = record['course_level']
+    person.COURSE_SLOTS = record['course_slots']
+    person.FRIENDS = record['friends']
+    person.LAST_COMPLETED_COURSE = record['last_completed_course']
+    return person
+
+
+class PlacementState:
+    """
+    Slot state rebuilt from a placement log.
+
+    Attributes:
+        slot_capacity (Dict[int, int]): Maximum capacity per slot.
+        slots (Dict[int, int]): Occupancy per slot.
+        placement (Dict[Tuple[int, ...], int]): Group keys mapped to their slot numbers.
+        applications (Dict[int, Optional[Human]]): Applications added through the log, None for withdrawals,
+            in the order they were logged.
+        events (int): Number of events read.
+    """
+
+    def __init__(self):
+        self.slot_capacity: Dict[int, int] = {}
+        self.slots: Dict[int, int] = {}
+        self.placement: Dict[Tuple[int, ...], int] = {}
+        self.applications: Dict[int, Optional[Human]] = {}
+        self.events: int = 0
+
+    def apply(self, event: Dict[str, object]) -> None:
+        """
+        Apply one logged event.
+
+        Args:
+            event (Dict[str, object]): Event as written by PlacementLog.
+
+        Raises:
+            ValueError: If the occupancy recorded with a delta does not match the replayed occupancy.
+        """
+        kind = event['event']
+        if kind == 'snapshot':
+            self.slot_capacity = {int(slot): capacity for slot, capacity in event['slot_capacity'].items()}
+            self.slots = {int(slot): occupancy for slot, occupancy in event['slots'].items()}
+            self.placement = {tuple(members): slot for members, slot in event['placement']}
+        elif kind == 'capacity':
+            self.slot_capacity = {int(slot): capacity for slot, capacity in event['slot_capacity'].items()}
+            for slot in self.slot_capacity:
+                self.slots.setdefault(slot, 0)
+        elif kind in ('placed', 'released'):
+            members, slot = tuple(event['members']), event['slot']
+            if kind == 'placed':
+                self.placement[members] = slot
+            else:
+                self.placement.pop(members, None)
+            self.slots[slot] = self.slots.get(slot, 0) + event['delta']
+            if self.slots[slot] != event['occupancy']:
+                raise ValueError(f"Event {event['seq']} expects {event['occupancy']} people in slot {slot}, "
+                                 f"the replay has {self.slots[slot]}")
+        elif kind == 'applied':
+            person = human_from_record(event['person'])
+            self.applications.pop(person.STD_NUMBER, None)
+            self.applications[person.STD_NUMBER] = person
+        elif kind == 'withdrawn':
+            self.applications.pop(event['std_number'], None)
+            self.applications[event['std_number']] = None
+        self.events += 1
+
+    def apply_to(self, people: Dict[int, Human]) -> Dict[int, Human]:
+        """
+        Apply the logged applications and withdrawals to a pool of applicants.
+
+        Args:
+            people (Dict[int, Human]): Applicants the log was started from.
+
+        Returns:
+            Dict[int, Human]: A new dictionary with the logged changes applied.
+        """
+        people = dict(people)
+        for std_number, person in self.applications.items():
+            if person is None:
+                people.pop(std_number, None)
+            else:
+                people[std_number] = person
+        return people
+
+
+class PlacementLog:
+    """
+    Append-only JSONL log of placement events.
+
+    Every line is one event with a sequence number: 'placed', 'released' and 'unplaced' carry the
+    group's member student numbers, slot, occupancy delta and the slot's occupancy afterwards,
+    'snapshot' carries the complete slot state, 'capacity' a new capacity table, and 'applied' and
+    'withdrawn' the application changes. Replaying the events from the last snapshot rebuilds
+    the slot state without solving anything.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path (str): Path of the log, created if it does not exist. A half-written last event,
+                e.g. after a crash, is cut off so the next event starts on a line of its own.
+        """
+        self.file_path = file_path
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        self.seq = self._repair() if os.path.exists(file_path) else 0
+        self.file = open(file_path, 'a', encoding='utf-8')
+
+    def close(self) -> None:
+        """
+        Close the log file.
+        """
+        self.file.close()
+
+    def append(self, event: str, **fields) -> None:
+        """
+        Append one event and flush it to disk.
+
+        Args:
+            event (str): Event type.
+            **fields: JSON-compatible event fields.
+        """
+        record = {'seq': self.seq, 'event': event, **fields}
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.file.flush()
+        self.seq += 1
+
+    def placed(self, group: Group, slot: int, occupancy: int) -> None:
+        """
+        Record that a group took a slot, occupancy is the slot's headcount afterwards.
+        """
+        self.append('placed', members=list(group_key(group)), slot=slot, delta=len(group.MEMBERS), occupancy=occupancy)
+
+    def released(self, group: Group, slot: int, occupancy: int) -> None:
+        """
+        Record that a group left a slot, occupancy is the slot's headcount afterwards.
+        """
+        self.append('released', members=list(group_key(group)), slot=slot, delta=-len(group.MEMBERS), occupancy=occupancy)
+
+    def unplaced(self, group: Group) -> None:
+        """
+        Record that a group found no slot.
+        """
+        self.append('unplaced', members=list(group_key(group)), slot=None, delta=0)
+
+    def capacity(self, slot_capacity: Dict[int, int]) -> None:
+        """
+        Record a new capacity table.
+        """
+        self.append('capacity', slot_capacity=slot_capacity)
+
+    def applied(self, person: Human) -> None:
+        """
+        Record a new or edited application.
+        """
+        self.append('applied', person=human_to_record(person))
+
+    def withdrawn(self, std_number: int) -> None:
+        """
+        Record a withdrawn application.
+        """
+        self.append('withdrawn', std_number=std_number)
+
+    def snapshot(self, slot_capacity: Dict[int, int], slots: Dict[int, int],
+                 placement: Dict[Tuple[int, ...], int]) -> None:
+        """
+        Append the complete slot state, replays start from the last snapshot.
+
+        Args:
+            slot_capacity (Dict[int, int]): Maximum capacity per slot.
+            slots (Dict[int, int]): Occupancy per slot.
+            placement (Dict[Tuple[int, ...], int]): Group keys mapped to their slot numbers.
+        """
+        self.append('snapshot', version=LOG_VERSION, slot_capacity=dict(sorted(slot_capacity.items())),
+                    slots=dict(sorted(slots.items())),
+                    placement=sorted([list(members), slot] for members, slot in placement.items()))
+
+    def compact(self) -> None:
+        """
+        Rewrite the log as the net application changes followed by one snapshot of the current state.
+        """
+        state = replay(self.file_path)
+        self.file.close()
+        temporary_path = self.file_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            self.file, self.seq = file, 0
+            for std_number, person in state.applications.items():
+                if person is None:
+                    self.withdrawn(std_number)
+                else:
+                    self.applied(person)
+            self.snapshot(state.slot_capacity, state.slots, state.placement)
+        os.replace(temporary_path, self.file_path)
+        self.file = open(self.file_path, 'a', encoding='utf-8')
+
+    def _repair(self) -> int:
+        # Count the events that parse and cut off a torn last line, so appending continues on a fresh line
+        seq, end, newline = 0, 0, b''
+        with open(self.file_path, 'rb') as file:
+            for line in file:
+                if line.strip():
+                    try:
+                        json.loads(line)
+                    except ValueError:
+                        if file.read().strip():
+                            raise ValueError(f"Placement log {self.file_path} has a corrupt event before its end")
+                        break
+                    seq += 1
+                end = file.tell()
+                newline = b'' if line.endswith(b'\n') else b'\n'
+        with open(self.file_path, 'r+b') as file:
+            file.truncate(end)
+            file.seek(end)
+            file.write(newline)
+        return seq
+
+
+def read_events(file_path: str) -> Iterator[Dict[str, object]]:
+    """
+    Read the events of a placement log.
+
+    A half-written last line, e.g. after a crash, is skipped.
+
+    Args:
+        file_path (str): Path of the log.
+
+    Yields:
+        Dict[str, object]: The events in log order.
+    """
+    with open(file_path, encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                if file.read().strip():
+                    raise
+                return
+
+
+def replay(file_path: str) -> PlacementState:
+    """
+    Rebuild the slot state of a placement log without re-solving.
+
+    Args:
+        file_path (str): Path of the log.
+
+    Returns:
+        PlacementState: State after the last event.
+
+    Raises:
+        ValueError: If the log is from another LOG_VERSION or its occupancy deltas are inconsistent.
+    """
+    state = PlacementState()
+    for event in read_events(file_path):
+        if event['event'] == 'snapshot' and event['version'] != LOG_VERSION:
+            raise ValueError(f"Placement log version {event['version']} is not supported, expected {LOG_VERSION}")
+        state.apply(event)
+    return state
+
+
+def assignment_placement(groups: List[Group], assignment: List[Optional[int]]) -> Dict[Tuple[int, ...], int]:
+    """
+    Key a batch assignment by group for PlacementLog.snapshot.
+
+    Args:
+        groups (List[Group]): Final groups.
+        assignment (List[Optional[int]]): Slot number per group, None for unplaced groups.
+
+    Returns:
+        Dict[Tuple[int, ...], int]: Group keys of the placed groups mapped to their slot numbers.
+    """
+    return {group_key(group): slot for group, slot in zip(groups, assignment) if slot is not None}
+
+
+def replayed_assignment(groups: List[Group], state: PlacementState) -> List[Optional[int]]:
+    """
+    Map a replayed placement back onto groups.
+
+    Args:
+        groups (List[Group]): Final groups.
+        state (PlacementState): Replayed state.
+
+    Returns:
+        List[Optional[int]]: Slot number per group, None for groups the log has not placed.
+    """
+    return [state.placement.get(group_key(group)) for group in groups]
@@ -0,0 +1,142 @@
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+def time_call(func: Callable, *args, repeat: int = 3) -> float:
+    """
+    Measure the best wall time of a function call.
+
+    Args:
+        func (Callable): Function to be measured.
+        *args: Arguments passed to the function.
+        repeat (int): How many times the call is repeated.
+
+    Returns:
+        float: Best observed wall time in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class PipelineProfiler:
+    """
+    Records wall time, peak memory and input/output cardinalities of every pipeline stage.
+
+    Stages may be nested, every record keeps its nesting depth. The time and peak of an enclosing stage
+    include those of the stages inside it.
+    """
+
+    def __init__(self, trace_memory: bool = False, cprofile: bool = False):
+        """
+        Args:
+            trace_memory (bool): Measure the peak memory of every stage with tracemalloc, which slows
+                down allocation-heavy stages.
+            cprofile (bool): Run cProfile over all stages, see format_profile.
+        """
+        self.trace_memory = trace_memory
+        self.stages: List[Dict[str, object]] = []
+        self.profile: Optional[cProfile.Profile] = cProfile.Profile() if cprofile else None
+        # Highest traced memory seen so far by every open stage, innermost last
+        self._peaks: List[int] = []
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str, **inputs: int) -> Iterator[Dict[str, object]]:
+        """
+        Measure one stage. Output cardinalities are added to record['outputs'] inside the block.
+
+        Args:
+            name (str): Name of the stage.
+            **inputs (int): Input cardinalities, e.g. people=315.
+
+        Yields:
+            Dict[str, object]: The stage record.
+        """
+        record: Dict[str, object] = {'stage': name, 'depth': self._depth, 'inputs': dict(inputs), 'outputs': {}}
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            memory_before, peak = tracemalloc.get_traced_memory()
+            # Keep the enclosing stage's peak before the shared tracemalloc peak is reset
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(memory_before)
+        if self.profile is not None and self._depth == 0:
+            self.profile.enable()
+        self._depth += 1
+        start = time.perf_counter()
+
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self._depth -= 1
+            if self.profile is not None and self._depth == 0:
+                self.profile.disable()
+            if self.trace_memory:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record['peak_memory_bytes'] = peak - memory_before
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            if started_tracing:
+                tracemalloc.stop()
+            self.stages.append(record)
+
+    def report(self) -> Dict[str, object]:
+        """
+        Build the structured report of all measured stages.
+
+        Returns:
+            Dict[str, object]: Stage records and the total wall time of the top-level stages.
+        """
+        return {
+            # Nested stages are already part of the time of the stage enclosing them
+            'total_seconds': sum(record['seconds'] for record in self.stages if record['depth'] == 0),
+            'stages': self.stages
+        }
+
+    def to_json(self, file_path: Optional[str] = None) -> str:
+        """
+        Serialize the report to JSON and optionally write it to a file.
+
+        Args:
+            file_path (str, optional): Where to write the report.
+
+        Returns:
+            str: The JSON report.
+        """
+        report = json.dumps(self.report(), indent=2, ensure_ascii=False)
+        if file_path is not None:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(report)
+        return report
+
+    def format_profile(self, limit: int = 20, sort_by: str = 'cumulative') -> str:
+        """
+        Format the cProfile statistics collected over all stages.
+
+        Args:
+            limit (int): Number of functions to show.
+            sort_by (str): pstats sort key.
+
+        Returns:
+            str: The formatted statistics, empty if cProfile was not enabled.
+        """
+        if self.profile is None:
+            return ''
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort_by).print_stats(limit)
+        return stream.getvalue()
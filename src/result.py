@@ -0,0 +1,189 @@
+import importlib.util
+import os
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from schemas import Group
+
+# Optional engines pandas uses for the binary formats, in order of preference
+PARQUET_ENGINES = ['pyarrow', 'fastparquet']
+EXCEL_ENGINES = ['openpyxl', 'xlsxwriter']
+
+
+def available_engine(engines: List[str], file_format: str) -> str:
+    """
+    Find an installed writer engine for an optional export format.
+
+    Args:
+        engines (List[str]): Module names pandas can write the format with.
+        file_format (str): Name of the format used in the error message.
+
+    Returns:
+        str: The first installed engine.
+
+    Raises:
+        ImportError: If none of the engines is installed.
+    """
+    for engine in engines:
+        if importlib.util.find_spec(engine) is not None:
+            return engine
+    raise ImportError(f"Writing {file_format} files needs one of {', '.join(engines)}; "
+                      f"install it with 'pip install {engines[0]}'.")
+
+
+class PlacementResult:
+    """
+    Columnar placement result with one row per applicant.
+
+    The frame has the columns std_number, fullname, group_id, slot, apply_date and course_level.
+    slot is a nullable integer column that is <NA> for applicants whose group was not placed.
+    Results of a multi-term schedule have an additional nullable term column.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        """
+        Args:
+            frame (pd.DataFrame): One row per applicant in the columns described above.
+        """
+        self.frame = frame
+
+    @classmethod
+    def from_assignment(cls, groups: List[Group], assignment: List[Optional[int]],
+                        terms: Optional[List[Optional[int]]] = None) -> 'PlacementResult':
+        """
+        Build the result from groups and the slot number of every group.
+
+        Args:
+            groups (List[Group]): Final groups, sorted by APPLY_DATE.
+            assignment (List[Optional[int]]): Slot number per group, None for unplaced groups.
+            terms (List[Optional[int]], optional): Term number per group from schedule_terms, adds a term column.
+
+        Returns:
+            PlacementResult: One row per member of every group.
+        """
+        sizes = np.fromiter((len(group.MEMBERS) for group in groups), dtype=np.int64, count=len(groups))
+        members = [member for group in groups for member in group.MEMBERS]
+        group_slots = pd.array(assignment, dtype='Int64')
+
+        frame = pd.DataFrame({
+            'std_number': [member.STD_NUMBER for member in members],
+            'fullname': [member.FULLNAME for member in members],
+            'group_id': np.repeat(np.arange(len(groups)), sizes),
+            'slot': group_slots.take(np.repeat(np.arange(len(groups)), sizes)),
+            'apply_date': np.repeat(np.array([group.APPLY_DATE for group in groups], dtype='datetime64[ns]'), sizes),
+            'course_level': np.repeat(np.array([group.COURSE_LEVEL for group in groups], dtype=object), sizes)
+        })
+        if terms is not None:
+            frame['term'] = pd.array(terms, dtype='Int64').take(np.repeat(np.arange(len(groups)), sizes))
+        return cls(frame)
+
+    @classmethod
+    def from_placements(cls, placements: pd.DataFrame) -> 'PlacementResult':
+        """
+        Build the result from a placement dataframe in the place_groups format.
+
+        std_number is left empty for frames without the std_numbers column.
+
+        Args:
+            placements (pd.DataFrame): One row per placed group with its member names, optionally their
+                student numbers, the slot and apply date.
+
+        Returns:
+            PlacementResult: One row per placed applicant.
+        """
+        if placements is None or placements.empty:
+            return cls(pd.DataFrame({'std_number': pd.array([], dtype='Int64'), 'fullname': pd.Series([], dtype=object),
+                                     'group_id': pd.Series([], dtype=np.int64), 'slot': pd.array([], dtype='Int64'),
+                                     'apply_date': pd.Series([], dtype='datetime64[ns]')}))
+
+        has_numbers = 'std_numbers' in placements
+        frame = (placements.reset_index(drop=True)
+                 .rename_axis('group_id')
+                 .reset_index()
+                 .explode(['group', 'std_numbers'] if has_numbers else 'group', ignore_index=True)
+                 .rename(columns={'group': 'fullname'}))
+        std_numbers = frame.pop('std_numbers') if has_numbers else [pd.NA] * len(frame)
+        frame.insert(0, 'std_number', pd.array(std_numbers, dtype='Int64'))
+        frame['slot'] = frame['slot'].astype('Int64')
+        return cls(frame)
+
+    @property
+    def placed_people(self) -> int:
+        """
+        Number of applicants with a slot.
+        """
+        return int(self.frame['slot'].notna().sum())
+
+    def roster(self, separator: str = ', ') -> pd.DataFrame:
+        """
+        Pivot the placed groups into the slot-by-group roster.
+
+        Args:
+            separator (str): Separator between the member names of a group.
+
+        Returns:
+            pd.DataFrame: One column per slot and one row per group position in the slot, empty cells
+            where a slot has fewer groups than the fullest one.
+        """
+        placed = self.frame[self.frame['slot'].notna()]
+        if placed.empty:
+            return pd.DataFrame()
+        if not placed['group_id'].is_monotonic_increasing:
+            placed = placed.sort_values('group_id', kind='stable')
+
+        # Members of a group are consecutive rows: join their names with one reduceat over the name column
+        group_ids = placed['group_id'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, group_ids[1:] != group_ids[:-1]])
+        ends = np.r_[starts[1:], len(group_ids)] - 1
+        names = placed['fullname'].to_numpy(dtype=object)
+        separated = names + separator
+        separated[ends] = names[ends]
+        members = np.add.reduceat(separated, starts)
+
+        # Each group goes to the next free row of its slot column, in group order
+        group_slots = placed['slot'].to_numpy(dtype=np.int64)[starts]
+        slot_numbers, columns = np.unique(group_slots, return_inverse=True)
+        positions = pd.Series(columns).groupby(columns).cumcount().to_numpy()
+        table = np.full((positions.max() + 1, len(slot_numbers)), '', dtype=object)
+        table[positions, columns] = members
+        return pd.DataFrame(table, columns=slot_numbers.tolist())
+
+    def write(self, file_path: str, include_roster: bool = False) -> None:
+        """
+        Export the applicant rows, the format is chosen by the file extension.
+
+        CSV is always available. Parquet needs pyarrow or fastparquet and XLSX needs openpyxl
+        or xlsxwriter. An XLSX export always contains the roster as a second sheet.
+
+        Args:
+            file_path (str): Path ending in .csv, .parquet or .xlsx.
+            include_roster (bool): For CSV and Parquet, also write the roster next to the file
+                with a '_roster' suffix.
+
+        Raises:
+            ValueError: If the extension is not supported.
+            ImportError: If the optional engine of the format is missing.
+        """
+        base, extension = os.path.splitext(file_path)
+        extension = extension.lower()
+
+        if extension == '.csv':
+            self.frame.to_csv(file_path, index=False)
+            if include_roster:
+                self.roster().to_csv(f"{base}_roster{extension}", index=False)
+        elif extension == '.parquet':
+            engine = available_engine(PARQUET_ENGINES, 'Parquet')
+            self.frame.to_parquet(file_path, engine=engine, index=False)
+            if include_roster:
+                roster = self.roster()
+                roster.columns = roster.columns.astype(str)
+                roster.to_parquet(f"{base}_roster{extension}", engine=engine, index=False)
+        elif extension == '.xlsx':
+            engine = available_engine(EXCEL_ENGINES, 'XLSX')
+            with pd.ExcelWriter(file_path, engine=engine) as writer:
+                self.frame.to_excel(writer, sheet_name='applicants', index=False)
+                self.roster().to_excel(writer, sheet_name='roster', index=False)
+        else:
+            raise ValueError(f"Unsupported export format {extension!r}, use .csv, .parquet or .xlsx")
@@ -0,0 +1,152 @@
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from placement import solve_terms
+from schemas import Group
+
+# Shared by the worker processes, set once per worker by init_worker
+_GROUP_SIZES: List[int] = []
+_GROUP_SLOTS: List[List[int]] = []
+
+
+def capacity_grid(base_capacity: Dict[int, int], variations: Dict[object, List[int]],
+                  term_counts: Tuple[int, ...] = (1,)) -> List[dict]:
+    """
+    Create one scenario for every combination of capacity variations.
+
+    Args:
+        base_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        variations (Dict[object, List[int]]): Capacities to try, keyed by a slot number or a tuple
+            of slot numbers that share the same value (e.g. all weekend slots).
+        term_counts (Tuple[int, ...]): Numbers of course terms to try.
+
+    Returns:
+        List[dict]: Scenario dictionaries accepted by run_scenarios.
+    """
+    keys = list(variations)
+    scenarios = []
+    for values in itertools.product(*(variations[key] for key in keys)):
+        slot_capacity = dict(base_capacity)
+        name_parts = []
+        for key, value in zip(keys, values):
+            for slot in key if isinstance(key, tuple) else (key,):
+                slot_capacity[slot] = value
+            name_parts.append(f"{key}={value}")
+        for term_count in term_counts:
+            scenarios.append({
+                'name': ', '.join(name_parts + [f"terms={term_count}"]),
+                'slot_capacity': slot_capacity,
+                'term_count': term_count
+            })
+    return scenarios
+
+
+def load_scenarios(file_path: str) -> List[dict]:
+    """
+    Load scenarios from a JSON file.
+
+    The file contains a list of objects with a 'name', a 'slot_capacity' mapping slot numbers to
+    capacities and optionally a 'term_count' and a list of 'closed_slots' without an instructor.
+
+    Args:
+        file_path (str): Path to the JSON file.
+
+    Returns:
+        List[dict]: Scenario dictionaries accepted by run_scenarios.
+    """
+    with open(file_path, encoding='utf-8') as file:
+        scenarios = json.load(file)
+    for scenario in scenarios:
+        # JSON object keys are strings, slot numbers are integers everywhere else
+        scenario['slot_capacity'] = {int(slot): capacity for slot, capacity in scenario['slot_capacity'].items()}
+    return scenarios
+
+
+def init_worker(group_sizes: List[int], group_slots: List[List[int]]) -> None:
+    """
+    Store the groups once per worker process instead of sending them with every scenario.
+
+    Args:
+        group_sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): COURSE_SLOTS per group.
+    """
+    global _GROUP_SIZES, _GROUP_SLOTS
+    _GROUP_SIZES, _GROUP_SLOTS = group_sizes, group_slots
+
+
+def evaluate_scenario(scenario: dict, engine: str = 'indexed', time_budget: float = 1.0) -> Dict[str, object]:
+    """
+    Place the shared groups under one scenario and summarize the outcome.
+
+    Every term offers the scenario's capacities and groups unplaced in a term roll forward to the
+    next one, as in 'main.py place --terms'.
+
+    Args:
+        scenario (dict): Scenario with 'name', 'slot_capacity' and optional 'term_count' and 'closed_slots'.
+        engine (str): 'greedy', 'indexed' or 'exact', see placement.solve_assignment.
+        time_budget (float): Time limit of the exact solver per term in seconds.
+
+    Returns:
+        Dict[str, object]: One row of the comparison table.
+    """
+    term_count = scenario.get('term_count', 1)
+    closed_slots = set(scenario.get('closed_slots', ()))
+    term_capacity = {(term, slot): 0 if slot in closed_slots else capacity
+                     for term in range(1, term_count + 1) for slot, capacity in scenario['slot_capacity'].items()}
+
+    _, assignment = solve_terms(_GROUP_SIZES, _GROUP_SLOTS, term_capacity, time_budget, engine)
+
+    total_people = sum(_GROUP_SIZES)
+    placed = sum(size for size, slot in zip(_GROUP_SIZES, assignment) if slot is not None)
+    placed_groups = sum(1 for slot in assignment if slot is not None)
+    total_capacity = sum(term_capacity.values())
+
+    return {
+        'scenario': scenario['name'],
+        'term_count': term_count,
+        'total_capacity': total_capacity,
+        'placed_people': placed,
+        'unplaced_people': total_people - placed,
+        'placed_groups': placed_groups,
+        'unplaced_groups': len(assignment) - placed_groups,
+        'utilization': placed / total_capacity if total_capacity else 0.0
+    }
+
+
+def run_scenarios(groups: List[Group], scenarios: List[dict], workers: Optional[int] = None,
+                  engine: str = 'indexed', time_budget: float = 1.0) -> pd.DataFrame:
+    """
+    Evaluate many capacity scenarios against the same, already built groups.
+
+    The groups are reduced to sizes and slot lists and sent to every worker once, so each
+    scenario only costs one placement pass.
+
+    Args:
+        groups (List[Group]): Final groups, sorted by APPLY_DATE.
+        scenarios (List[dict]): Scenarios created by capacity_grid or load_scenarios.
+        workers (int, optional): Number of worker processes. Defaults to the CPU count, 1 runs in-process.
+        engine (str): 'greedy', 'indexed' or 'exact', see placement.solve_assignment.
+        time_budget (float): Time limit of the exact solver per term in seconds.
+
+    Returns:
+        pd.DataFrame: Comparison table with placed and unplaced counts per scenario.
+    """
+    workers = workers or os.cpu_count() or 1
+    group_sizes = [len(group.MEMBERS) for group in groups]
+    group_slots = [group.COURSE_SLOTS for group in groups]
+
+    if workers == 1:
+        init_worker(group_sizes, group_slots)
+        rows = [evaluate_scenario(scenario, engine, time_budget) for scenario in scenarios]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(group_sizes, group_slots)) as executor:
+            rows = list(executor.map(evaluate_scenario, scenarios, itertools.repeat(engine),
+                                     itertools.repeat(time_budget), chunksize=max(1, len(scenarios) // (workers * 4))))
+
+    return pd.DataFrame(rows)
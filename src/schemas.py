@@ -1,5 +1,7 @@
 from datetime import datetime
-from typing import List, Set, Optional, Dict
+from typing import List, Set, Optional, Dict, Iterable
+
+from slot_config import SLOT_CONFIG
 
 
 def parse_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -21,6 +23,9 @@ def parse_date(date_str: Optional[str]) -> Optional[datetime]:
 
 
 class Human:
+    __slots__ = ('STD_NUMBER', 'FULLNAME', 'PHONE_NUMBER', 'APPLY_DATE', 'isMember', 'COURSE_LEVEL',
+                 '_course_slots', 'SLOT_MASK', 'FRIENDS', 'isPlaced', 'LAST_COMPLETED_COURSE')
+
     def __init__(self):
         self.STD_NUMBER: int = 0
         self.FULLNAME: str = ''
@@ -33,8 +38,20 @@ class Human:
         self.isPlaced: bool = False
         self.LAST_COMPLETED_COURSE: str = ''
 
+    @property
+    def COURSE_SLOTS(self) -> List[int]:
+        return self._course_slots
+
+    @COURSE_SLOTS.setter
+    def COURSE_SLOTS(self, course_slots: List[int]):
+        # Keep the bitmask in sync with the slot list so group intersections are a single AND
+        self._course_slots = course_slots
+        self.SLOT_MASK = slots_to_mask(course_slots)
+
 
 class Group:
+    __slots__ = ('MEMBERS', 'APPLY_DATE', 'SLOT_MASK', 'isPlaced', 'PLACED_SLOTS', 'COURSE_LEVEL')
+
     def __init__(self, members: List[Human]):
         """
         Initializes the group with members and calculates key attributes.
@@ -43,13 +60,20 @@ class Group:
             members (List[Human]): List of Human objects that belong to the group.
         """
         self.MEMBERS: List[Human] = members
-        self.APPLY_DATE: Optional[datetime] = self.calculate_earliest_apply_date()
-        self.COURSE_SLOTS: List[int] = self.calculate_course_slots_intersection()
         self.isPlaced: bool = False
         self.PLACED_SLOTS: List[int] = []
         self.COURSE_LEVEL: str = ''
+        # check_course_level filters the members and calculates the date and slots only once
         self.check_course_level()
 
+    @property
+    def COURSE_SLOTS(self) -> List[int]:
+        return mask_to_slots(self.SLOT_MASK)
+
+    @COURSE_SLOTS.setter
+    def COURSE_SLOTS(self, course_slots: List[int]):
+        self.SLOT_MASK = slots_to_mask(course_slots)
+
     def calculate_earliest_apply_date(self) -> Optional[datetime]:
         """
         Calculate the earliest application date among group members.
@@ -60,37 +84,44 @@ class Group:
         valid_dates = [member.APPLY_DATE for member in self.MEMBERS if member.APPLY_DATE is not None]
         return min(valid_dates, default=None)  # Use default=None to avoid ValueError on empty list
 
+    def calculate_course_slots_mask(self) -> int:
+        """
+        Calculate the bitmask of course slots available to all members.
+
+        Returns:
+            int: Bitwise AND of the members' slot masks, 0 for an empty group.
+        """
+        if not self.MEMBERS:
+            return 0
+        common_mask = ALL_SLOTS_MASK
+        for member in self.MEMBERS:
+            common_mask &= member.SLOT_MASK
+        return common_mask
+
     def calculate_course_slots_intersection(self) -> List[int]:
         """
         Calculate the intersection of available course slots among group members.
 
         Returns:
-            List[int]: A list of course slots available to all members.
+            List[int]: A list of course slots available to all members, in slot code order.
         """
-        if not self.MEMBERS:
-            return []
-        common_slots = set(self.MEMBERS[0].COURSE_SLOTS)
-        for member in self.MEMBERS[1:]:
-            common_slots.intersection_update(member.COURSE_SLOTS)
-        return list(common_slots)
+        return mask_to_slots(self.calculate_course_slots_mask())
 
     def check_course_level(self):
         """
         Ensure all members are enrolled in the same course level.
         Removes members not matching the earliest member's course level.
         """
-        if not self.MEMBERS:
-            return
+        if self.MEMBERS:
+            # Use the course level of the earliest applicant
+            earliest_course_level = self.MEMBERS[0].COURSE_LEVEL
 
-        # Use the course level of the earliest applicant
-        earliest_course_level = self.MEMBERS[0].COURSE_LEVEL
-
-        # Retain only members with the same course level
-        self.MEMBERS = [member for member in self.MEMBERS if member.COURSE_LEVEL == earliest_course_level]
+            # Retain only members with the same course level
+            self.MEMBERS = [member for member in self.MEMBERS if member.COURSE_LEVEL == earliest_course_level]
 
         # Recalculate apply date and course slots after filtering members
         self.APPLY_DATE = self.calculate_earliest_apply_date()
-        self.COURSE_SLOTS = self.calculate_course_slots_intersection()
+        self.SLOT_MASK = self.calculate_course_slots_mask()
 
     def get_member_std_numbers(self) -> Set[int]:
         """
@@ -111,27 +142,46 @@ class Group:
         return f"Group with members {[member.FULLNAME for member in self.MEMBERS]} and earliest apply date {self.APPLY_DATE}"
 
 
-# Example slot dictionary mapping from time slots to integers
-slots: Dict[str, int] = {
-    "Pazartesi - 1.Slot - 9.00 - 12.00": 11,
-    "Pazartesi - 2.Slot - 12.00 - 15.00": 12,
-    "Pazartesi - 3.Slot - 15.00 - 18.00": 13,
-    "Salı - 1.Slot - 9.00 - 12.00": 21,
-    "Salı - 2.Slot - 12.00 - 15.00": 22,
-    "Salı - 3.Slot - 15.00 - 18.00": 23,
-    "Çarşamba - 1.Slot - 9.00 - 12.00": 31,
-    "Çarşamba - 2.Slot - 12.00 - 15.00": 32,
-    "Çarşamba - 3.Slot - 15.00 - 18.00": 33,
-    "Perşembe - 1.Slot - 9.00 - 12.00": 41,
-    "Perşembe - 2.Slot - 12.00 - 15.00": 42,
-    "Perşembe - 3.Slot - 15.00 - 18.00": 43,
-    "Cuma - 1.Slot - 9.00 - 12.00": 51,
-    "Cuma - 2.Slot - 12.00 - 15.00": 52,
-    "Cuma - 3.Slot - 15.00 - 18.00": 53,
-    "Cumartesi - 1.Slot - 9.00 - 12.00": 61,
-    "Cumartesi - 2.Slot - 12.00 - 15.00": 62,
-    "Cumartesi - 3.Slot - 15.00 - 18.00": 63,
-    "Pazar - 1.Slot - 9.00 - 12.00": 71,
-    "Pazar - 2.Slot - 12.00 - 15.00": 72,
-    "Pazar - 3.Slot - 15.00 - 18.00": 73
-}
+# Slot labels mapping to slot codes, compiled from the slot configuration (config/slots.json)
+slots: Dict[str, int] = SLOT_CONFIG.labels
+
+
+# Bit position of every slot code, so that a set of slots can be stored as a 21-bit mask
+SLOT_BITS: Dict[int, int] = {code: bit for bit, code in enumerate(slots.values())}
+BIT_SLOTS: List[int] = list(slots.values())
+ALL_SLOTS_MASK: int = (1 << len(BIT_SLOTS)) - 1
+
+
+def slots_to_mask(course_slots: Iterable[int]) -> int:
+    """
+    Convert slot codes into a bitmask over the slots table.
+
+    Args:
+        course_slots (Iterable[int]): Slot codes such as 11 or 73.
+
+    Returns:
+        int: Bitmask with one bit set per known slot code.
+    """
+    mask = 0
+    for slot in course_slots:
+        if slot in SLOT_BITS:
+            mask |= 1 << SLOT_BITS[slot]
+    return mask
+
+
+def mask_to_slots(mask: int) -> List[int]:
+    """
+    Convert a slot bitmask back into slot codes.
+
+    Args:
+        mask (int): Bitmask created by slots_to_mask.
+
+    Returns:
+        List[int]: Slot codes in the order of the slots table.
+    """
+    course_slots = []
+    while mask:
+        lowest_bit = mask & -mask
+        course_slots.append(BIT_SLOTS[lowest_bit.bit_length() - 1])
+        mask ^= lowest_bit
+    return course_slots
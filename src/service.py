@@ -0,0 +1,345 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from cache import PipelineCache, CACHE_DIR
+from main import DATA_FILE_PATH, SLOT_CAPACITY
+from placement import solve_assignment
+from placement_log import PlacementLog
+from schemas import Human
+from session import PlacementSession
+from slot_config import SLOT_CONFIG
+
+# Constants
+MAX_BODY_BYTES = 1 << 20
+LOG_FILE_PATH = os.path.join(CACHE_DIR, 'placement_log.jsonl')
+
+
+class ServiceError(Exception):
+    """
+    Error that is reported to the client with an HTTP status.
+    """
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def human_from_json(payload: dict) -> Human:
+    """
+    Create an applicant from a JSON application.
+
+    Args:
+        payload (dict): Application with std_number, fullname, course_level, apply_date and optionally
+            phone_number, course_slots (slot codes or slot names) and friends. An apply_date with a UTC
+            offset is converted to naive local time.
+
+    Returns:
+        Human: The applicant.
+    """
+    try:
+        person = Human()
+        person.STD_NUMBER = int(payload['std_number'])
+        person.FULLNAME = str(payload['fullname'])
+        person.PHONE_NUMBER = str(payload.get('phone_number', ''))
+        person.isMember = True
+        person.COURSE_LEVEL = str(payload['course_level'])
+        apply_date = datetime.fromisoformat(payload['apply_date']) if payload.get('apply_date') else datetime.now()
+        if apply_date.tzinfo is not None:
+            # Application dates of the responses are naive local times, so offsets are converted to local time
+            apply_date = apply_date.astimezone().replace(tzinfo=None)
+        person.APPLY_DATE = apply_date
+        person.COURSE_SLOTS = [slot if isinstance(slot, int) else parse_slot_label(slot)
+                               for slot in payload.get('course_slots', [])]
+        person.FRIENDS = [int(friend) for friend in payload.get('friends', [])]
+        person.LAST_COMPLETED_COURSE = '1* Temel Yelken Eğitimi'  # TODO: Check this info from the database in the future
+    except (KeyError, TypeError, ValueError) as error:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid application: {error!r}")
+    return person
+
+
+def parse_slot_label(label: str) -> int:
+    """
+    Find the slot code of a slot label in an application.
+
+    Raises:
+        ValueError: If the label names no configured slot.
+    """
+    code = SLOT_CONFIG.parse_slot(label)
+    if code is None:
+        raise ValueError(f"Unknown slot {label!r}")
+    return code
+
+
+class PlacementService:
+    """
+    Local HTTP/JSON service keeping applicants, groups and the last placement in memory.
+
+    Routes:
+        GET    /health                     Liveness check.
+        GET    /placements                 Current placement and counts.
+        POST   /applications               Add or edit an application, placed incrementally.
+        DELETE /applications/<std_number>  Withdraw an application.
+        PUT    /capacity                   Replace slot capacities and re-solve in the worker pool.
+        POST   /solve                      Re-solve the whole placement in the worker pool.
+    """
+
+    def __init__(self, session: PlacementSession, workers: int = 1, time_budget: float = 2.0):
+        """
+        Args:
+            session (PlacementSession): Warm state the service works on.
+            workers (int): Number of processes used for full solves.
+            time_budget (float): Time limit of a full solve in seconds.
+        """
+        self.session = session
+        self.workers = workers
+        self.time_budget = time_budget
+        self.executor = self.create_executor()
+        self.lock = asyncio.Lock()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def create_executor(self) -> ProcessPoolExecutor:
+        """
+        Create the worker pool of full solves.
+
+        Returns:
+            ProcessPoolExecutor: Pool of spawned worker processes.
+        """
+        # Forking from inside a running event loop can deadlock the worker, so workers are spawned
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8080) -> Tuple[str, int]:
+        """
+        Start listening.
+
+        Args:
+            host (str): Interface to bind, localhost by default.
+            port (int): Port to bind, 0 picks a free port.
+
+        Returns:
+            Tuple[str, int]: The bound host and port.
+        """
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self) -> None:
+        """
+        Stop listening and shut the worker pool down.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, body = await self.read_request(reader)
+                status, response = await self.route(method, path, body)
+            except ServiceError as error:
+                status, response = error.status, {'error': str(error)}
+            except asyncio.IncompleteReadError:
+                return
+            except Exception as error:
+                status, response = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"Request failed: {error!r}"}
+
+            payload = json.dumps(response, ensure_ascii=False, default=str).encode('utf-8')
+            writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                         f"Content-Type: application/json; charset=utf-8\r\n"
+                         f"Content-Length: {len(payload)}\r\n"
+                         f"Connection: close\r\n\r\n".encode('latin-1') + payload)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def read_request(reader: asyncio.StreamReader) -> Tuple[str, str, Optional[object]]:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        method, path, _ = request_line
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Content-Length must be an integer")
+        if length < 0:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, "Content-Length must not be negative")
+        if length > MAX_BODY_BYTES:
+            raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = None
+        if length:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except json.JSONDecodeError as error:
+                raise ServiceError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {error}")
+        return method, path, body
+
+    async def route(self, method: str, path: str, body: Optional[object]) -> Tuple[HTTPStatus, object]:
+        parts = [part for part in path.split('?')[0].split('/') if part]
+
+        if method == 'GET' and parts == ['health']:
+            return HTTPStatus.OK, {'status': 'ok'}
+        if method == 'GET' and parts == ['placements']:
+            return HTTPStatus.OK, self.placement_summary()
+        if method == 'POST' and parts == ['applications']:
+            person = human_from_json(body if isinstance(body, dict) else {})
+            async with self.lock:
+                self.session.add_applicant(person)
+            return HTTPStatus.CREATED, self.applicant_summary(person.STD_NUMBER)
+        if method == 'DELETE' and len(parts) == 2 and parts[0] == 'applications':
+            try:
+                std_number = int(parts[1])
+            except ValueError:
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Student number must be an integer")
+            async with self.lock:
+                if std_number not in self.session.people:
+                    raise ServiceError(HTTPStatus.NOT_FOUND, f"No application for {std_number}")
+                self.session.withdraw_applicant(std_number)
+            return HTTPStatus.OK, {'withdrawn': std_number}
+        if method == 'PUT' and parts == ['capacity']:
+            if not isinstance(body, dict):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Capacity must be an object of slot: capacity")
+            try:
+                slot_capacity = {int(slot): int(capacity) for slot, capacity in body.items()}
+            except (TypeError, ValueError):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, "Slots and capacities must be integers")
+            async with self.lock:
+                self.session.set_capacity(slot_capacity)
+                await self.solve()
+            return HTTPStatus.OK, self.placement_summary()
+        if method == 'POST' and parts == ['solve']:
+            async with self.lock:
+                await self.solve()
+            return HTTPStatus.OK, self.placement_summary()
+
+        raise ServiceError(HTTPStatus.NOT_FOUND, f"No route for {method} {path}")
+
+    async def solve(self) -> None:
+        """
+        Re-solve the whole placement in the worker pool without blocking the event loop.
+
+        Raises:
+            ServiceError: If the solve fails in the worker. The current placement is kept, and a
+                worker pool broken by a crashed worker is replaced for the next solve.
+        """
+        group_ids = list(self.session.groups)
+        sizes = [len(self.session.groups[group_id].MEMBERS) for group_id in group_ids]
+        group_slots = [self.session.groups[group_id].COURSE_SLOTS for group_id in group_ids]
+
+        loop = asyncio.get_running_loop()
+        try:
+            assignment = await loop.run_in_executor(self.executor, solve_assignment, sizes, group_slots,
+                                                    self.session.slot_capacity, self.time_budget)
+        except BrokenProcessPool as error:
+            self.executor.shutdown(wait=False)
+            self.executor = self.create_executor()
+            raise ServiceError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Solve failed, a worker crashed: {error}")
+        except Exception as error:
+            raise ServiceError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Solve failed: {error!r}")
+        self.session.load_placement({group_id: slot for group_id, slot in zip(group_ids, assignment)
+                                     if slot is not None})
+
+    def placement_summary(self) -> Dict[str, object]:
+        placements = [{
+            'slot': slot,
+            'members': [member.STD_NUMBER for member in self.session.groups[group_id].MEMBERS],
+            'names': [member.FULLNAME for member in self.session.groups[group_id].MEMBERS],
+            'apply_date': self.session.groups[group_id].APPLY_DATE
+        } for group_id, slot in self.session.placement.items()]
+        return {
+            'applicants': len(self.session.people),
+            'groups': len(self.session.groups),
+            'placed_people': self.session.placed_people(),
+            'slots': self.session.slots,
+            'placements': sorted(placements, key=lambda placement: (placement['apply_date'] is None,
+                                                                    placement['apply_date'] or datetime.min))
+        }
+
+    def applicant_summary(self, std_number: int) -> Dict[str, object]:
+        group_id = self.session.group_of[std_number]
+        return {
+            'std_number': std_number,
+            'group': [member.STD_NUMBER for member in self.session.groups[group_id].MEMBERS],
+            'slot': self.session.placement.get(group_id)
+        }
+
+
+def load_session(file_path: str, log_path: Optional[str]) -> PlacementSession:
+    """
+    Load the warm state from the cache, and restore the last placement from the log if there is one.
+
+    Args:
+        file_path (str): Path to the responses CSV.
+        log_path (str, optional): Placement log of the service, None to run without a log.
+
+    Returns:
+        PlacementSession: The session the service works on.
+    """
+    people, _ = PipelineCache().load_groups(file_path)
+    if log_path is None:
+        return PlacementSession(people, SLOT_CAPACITY)
+
+    start = time.perf_counter()
+    log = PlacementLog(log_path)
+    if log.seq == 0:
+        return PlacementSession(people, SLOT_CAPACITY, log=log)
+    log.compact()
+    session = PlacementSession.from_log(people, log, SLOT_CAPACITY)
+    print(f"Restored {session.placed_people()} placed people from {log_path} "
+          f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return session
+
+
+async def serve(file_path: str, host: str, port: int, workers: int, log_path: Optional[str] = LOG_FILE_PATH) -> None:
+    """
+    Load the warm state and serve until cancelled.
+
+    Args:
+        file_path (str): Path to the responses CSV.
+        host (str): Interface to bind.
+        port (int): Port to bind.
+        workers (int): Number of processes used for full solves.
+        log_path (str, optional): Placement log every change is appended to and restarts replay.
+    """
+    service = PlacementService(load_session(file_path, log_path), workers=workers)
+    host, port = await service.start(host, port)
+    print(f"Serving placements on http://{host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.stop()
+        if service.session.log is not None:
+            service.session.log.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the local placement service.")
+    parser.add_argument('--data', default=DATA_FILE_PATH, help="Path to the responses CSV.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=1, help="Processes used for full solves.")
+    parser.add_argument('--log', default=LOG_FILE_PATH, help="Placement log replayed on restart.")
+    parser.add_argument('--no-log', action='store_true', help="Start from a fresh placement and keep no log.")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.data, args.host, args.port, args.workers, None if args.no_log else args.log))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,348 @@
+from collections import defaultdict
+from itertools import count
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from group_manager import friendship_components
+from placement_log import PlacementLog, group_key, replay
+from schemas import Group, Human
+
+
+class PlacementSession:
+    """
+    Keeps applicants, friendship groups and slot occupancy in memory and updates them incrementally.
+
+    Every update only rebuilds the friendship component of the touched applicants, releases the
+    slots that component used and places the new groups with the first-fit rule of place_groups.
+    Slots freed by the update are offered to the unplaced groups that can use them. Groups that are
+    already placed keep their slots, so an update never reshuffles the rest of the assignment.
+
+    With a PlacementLog attached, every change is appended to the log, so a restart can rebuild
+    the session with from_log instead of solving again.
+    """
+
+    def __init__(self, people: Dict[int, Human], slot_capacity: Dict[int, int], slots: Optional[Dict[int, int]] = None,
+                 placement: Optional[Dict[Tuple[int, ...], int]] = None, log: Optional[PlacementLog] = None):
+        """
+        Builds the initial groups and placement.
+
+        Args:
+            people (Dict[int, Human]): Dictionary where keys are student numbers and values are Human objects.
+            slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+            slots (Dict[int, int], optional): Current occupancy per slot. Starts empty if not provided.
+            placement (Dict[Tuple[int, ...], int], optional): Group keys (see placement_log.group_key) mapped to
+                their slot numbers. The groups are restored to these slots instead of being placed.
+            log (PlacementLog, optional): Log every change is appended to, starting with a snapshot.
+        """
+        self.people: Dict[int, Human] = dict(people)
+        self.slot_capacity: Dict[int, int] = dict(slot_capacity)
+        self.slots: Dict[int, int] = dict(slots) if slots is not None else {slot: 0 for slot in slot_capacity}
+
+        self.adjacency: Dict[int, Set[int]] = defaultdict(set)
+        self.mentioned_by: Dict[int, Set[int]] = defaultdict(set)
+        self.group_of: Dict[int, int] = {}
+        self.groups: Dict[int, Group] = {}
+        self.placement: Dict[int, int] = {}
+        self.unplaced_by_slot: Dict[int, Set[int]] = defaultdict(set)
+        self._group_ids = count()
+        self.log: Optional[PlacementLog] = None
+
+        for person in self.people.values():
+            self._link(person)
+
+        new_groups = {}
+        for member_ids in friendship_components(self.people).components().values():
+            new_groups[next(self._group_ids)] = self._build_group(member_ids)
+        self._register(new_groups)
+        if placement is None:
+            self._place(self._placing_order(new_groups), set(new_groups))
+        else:
+            self.load_placement({group_id: placement[group_key(group)] for group_id, group in new_groups.items()
+                                 if group_key(group) in placement})
+
+        self.log = log
+        if log is not None:
+            self.checkpoint()
+
+    @classmethod
+    def from_log(cls, people: Dict[int, Human], log: PlacementLog, slot_capacity: Dict[int, int]) -> 'PlacementSession':
+        """
+        Rebuilds a session by replaying its log, without solving the placement again.
+
+        Args:
+            people (Dict[int, Human]): Applicants the log was started from, e.g. from the pipeline cache.
+            log (PlacementLog): Log of the previous session, further changes are appended to it.
+            slot_capacity (Dict[int, int]): Capacity table used if the log has none yet.
+
+        Returns:
+            PlacementSession: Session with the logged applications, capacities and placement.
+        """
+        state = replay(log.file_path)
+        return cls(state.apply_to(people), state.slot_capacity or slot_capacity, slots=None,
+                   placement=state.placement, log=log)
+
+    def add_applicant(self, person: Human) -> None:
+        """
+        Adds a new application, or replaces the existing one with the same student number.
+
+        The session is left unchanged if the applicant's groups cannot be built, e.g. because the
+        APPLY_DATE cannot be compared with the dates of the friends.
+
+        Args:
+            person (Human): The applicant to be added.
+        """
+        self._update(removed=[person.STD_NUMBER] if person.STD_NUMBER in self.people else [], added=[person])
+
+    def edit_applicant(self, person: Human) -> None:
+        """
+        Replaces an applicant's details, e.g. after a form response was edited.
+
+        Args:
+            person (Human): The updated applicant.
+        """
+        self.add_applicant(person)
+
+    def withdraw_applicant(self, std_number: int) -> None:
+        """
+        Removes an application and frees the places its group used.
+
+        Args:
+            std_number (int): Student number of the withdrawn applicant.
+        """
+        if std_number in self.people:
+            self._update(removed=[std_number], added=[])
+
+    def set_capacity(self, slot_capacity: Dict[int, int]) -> None:
+        """
+        Replaces the capacity table. Existing placements are kept, call load_placement with a new solve
+        to use the changed capacities.
+
+        Args:
+            slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        """
+        self.slot_capacity = dict(slot_capacity)
+        for slot in self.slot_capacity:
+            self.slots.setdefault(slot, 0)
+        if self.log is not None:
+            self.log.capacity(self.slot_capacity)
+
+    def load_placement(self, placement: Dict[int, int]) -> None:
+        """
+        Replaces the whole assignment, e.g. with the result of a full solve.
+
+        Args:
+            placement (Dict[int, int]): Group ids mapped to their slot numbers, unplaced groups are left out.
+        """
+        self.slots = {slot: 0 for slot in self.slot_capacity}
+        self.placement = {}
+        self.unplaced_by_slot = defaultdict(set)
+        for group_id, group in self.groups.items():
+            slot = placement.get(group_id)
+            if slot is None:
+                group.isPlaced = False
+                group.PLACED_SLOTS = []
+                for course_slot in group.COURSE_SLOTS:
+                    self.unplaced_by_slot[course_slot].add(group_id)
+            else:
+                self.slots[slot] = self.slots.get(slot, 0) + len(group.MEMBERS)
+                self.placement[group_id] = slot
+                group.isPlaced = True
+                group.PLACED_SLOTS = [slot]
+        if self.log is not None:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """
+        Appends a snapshot of the complete slot state to the log, replays start from the last one.
+        """
+        self.log.snapshot(self.slot_capacity, self.slots,
+                          {group_key(self.groups[group_id]): slot for group_id, slot in self.placement.items()})
+
+    def placed_people(self) -> int:
+        """
+        Count the people currently placed.
+
+        Returns:
+            int: Number of placed applicants.
+        """
+        return sum(len(self.groups[group_id].MEMBERS) for group_id in self.placement)
+
+    def unplaced_groups(self) -> List[Group]:
+        """
+        List the groups that currently have no slot.
+
+        Returns:
+            List[Group]: Unplaced groups sorted by APPLY_DATE.
+        """
+        unplaced = [group for group_id, group in self.groups.items() if group_id not in self.placement]
+        return sorted(unplaced, key=lambda group: group.APPLY_DATE)
+
+    def placements(self) -> 'pd.DataFrame':
+        """
+        Export the current placement in the place_groups result format.
+
+        Returns:
+            pd.DataFrame: A dataframe with group placement details sorted by APPLY_DATE.
+        """
+        placements = [{
+            'group': [member.FULLNAME for member in self.groups[group_id].MEMBERS],
+            'std_numbers': [member.STD_NUMBER for member in self.groups[group_id].MEMBERS],
+            'slot': slot,
+            'apply_date': self.groups[group_id].APPLY_DATE
+        } for group_id, slot in self.placement.items()]
+        import pandas as pd
+
+        return pd.DataFrame(placements).sort_values('apply_date', ignore_index=True) if placements else pd.DataFrame()
+
+    def _update(self, removed: List[int], added: List[Human]) -> None:
+        # Collect the applicants whose component can change
+        previous = {std_number: self.people[std_number] for std_number in removed}
+        touched = set()
+        for std_number in removed:
+            touched.add(std_number)
+            touched.update(self.adjacency.get(std_number, ()))
+            self._unlink(self.people.pop(std_number))
+        for person in added:
+            self.people[person.STD_NUMBER] = person
+            self._link(person)
+            touched.add(person.STD_NUMBER)
+            touched.update(self.adjacency[person.STD_NUMBER])
+
+        # Every group that contains a touched applicant is rebuilt
+        released = {self.group_of[std_number] for std_number in touched if std_number in self.group_of}
+        members = {std_number for std_number in touched if std_number in self.people}
+        for group_id in released:
+            members.update(member.STD_NUMBER for member in self.groups[group_id].MEMBERS)
+        freed_slots = {self.placement[group_id] for group_id in released if group_id in self.placement}
+
+        # Build the new groups and their placing order before anything is released, so a failure leaves the
+        # groups and slots untouched and only the applicant changes have to be rolled back
+        try:
+            new_groups = {next(self._group_ids): self._build_group(component)
+                          for component in self._components(members)}
+            waiting = {group_id: self.groups[group_id] for group_id in self._waiting_for(freed_slots) - released}
+            order = self._placing_order({**waiting, **new_groups})
+        except Exception:
+            for person in reversed(added):
+                self._unlink(self.people.pop(person.STD_NUMBER))
+            for std_number, person in previous.items():
+                self.people[std_number] = person
+                self._link(person)
+            raise
+
+        if self.log is not None:
+            for person in added:
+                self.log.applied(person)
+            for std_number in previous.keys() - self.people.keys():
+                self.log.withdrawn(std_number)
+
+        for group_id in released:
+            self._release(group_id)
+            del self.groups[group_id]
+        self._register(new_groups)
+
+        # The rebuilt groups and the groups waiting for a freed place compete in one APPLY_DATE order
+        self._place(order, set(new_groups))
+
+    def _components(self, members: Set[int]) -> List[List[int]]:
+        # Friendship components of the members with a search restricted to them
+        components = []
+        seen = set()
+        for std_number in members:
+            if std_number in seen or std_number not in self.people:
+                continue
+            component, frontier = [], [std_number]
+            seen.add(std_number)
+            while frontier:
+                current = frontier.pop()
+                component.append(current)
+                for neighbour in self.adjacency.get(current, ()):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        frontier.append(neighbour)
+            components.append(component)
+        return components
+
+    def _link(self, person: Human) -> None:
+        # Friendships only link applicants of the same COURSE_LEVEL, as in friendship_components
+        std_number = person.STD_NUMBER
+        for friend_id in person.FRIENDS:
+            self.mentioned_by[friend_id].add(std_number)
+        for other_id in set(person.FRIENDS) | self.mentioned_by.get(std_number, set()):
+            other = self.people.get(other_id)
+            if other is not None and other_id != std_number and other.COURSE_LEVEL == person.COURSE_LEVEL:
+                self.adjacency[std_number].add(other_id)
+                self.adjacency[other_id].add(std_number)
+
+    def _unlink(self, person: Human) -> None:
+        std_number = person.STD_NUMBER
+        for friend_id in person.FRIENDS:
+            self.mentioned_by[friend_id].discard(std_number)
+        for other_id in self.adjacency.pop(std_number, set()):
+            self.adjacency[other_id].discard(std_number)
+
+    def _build_group(self, member_ids: Iterable[int]) -> Group:
+        members = sorted((self.people[member_id] for member_id in member_ids), key=lambda member: member.APPLY_DATE)
+        group = Group(members=members)
+        group.COURSE_LEVEL = members[0].COURSE_LEVEL
+        return group
+
+    def _register(self, groups: Dict[int, Group]) -> None:
+        for group_id, group in groups.items():
+            self.groups[group_id] = group
+            for member in group.MEMBERS:
+                self.group_of[member.STD_NUMBER] = group_id
+
+    def _release(self, group_id: int) -> Optional[int]:
+        group = self.groups[group_id]
+        for member in group.MEMBERS:
+            if self.group_of.get(member.STD_NUMBER) == group_id:
+                del self.group_of[member.STD_NUMBER]
+        for slot in group.COURSE_SLOTS:
+            self.unplaced_by_slot[slot].discard(group_id)
+        slot = self.placement.pop(group_id, None)
+        if slot is not None:
+            self.slots[slot] -= len(group.MEMBERS)
+            group.isPlaced = False
+            group.PLACED_SLOTS = []
+            if self.log is not None:
+                self.log.released(group, slot, self.slots[slot])
+        return slot
+
+    def _try_place(self, group_id: int) -> bool:
+        group = self.groups[group_id]
+        for preferred_slot in group.COURSE_SLOTS:
+            if preferred_slot in self.slot_capacity and \
+                    self.slots[preferred_slot] + len(group.MEMBERS) <= self.slot_capacity[preferred_slot]:
+                self.slots[preferred_slot] += len(group.MEMBERS)
+                self.placement[group_id] = preferred_slot
+                group.isPlaced = True
+                group.PLACED_SLOTS = [preferred_slot]
+                if self.log is not None:
+                    self.log.placed(group, preferred_slot, self.slots[preferred_slot])
+                for slot in group.COURSE_SLOTS:
+                    self.unplaced_by_slot[slot].discard(group_id)
+                return True
+        return False
+
+    @staticmethod
+    def _placing_order(groups: Dict[int, Group]) -> List[int]:
+        return sorted(groups, key=lambda group_id: (groups[group_id].APPLY_DATE, group_id))
+
+    def _place(self, order: List[int], new_ids: Set[int]) -> None:
+        # Groups are tried in the given APPLY_DATE order, only new ones are recorded as unplaced
+        for group_id in order:
+            if not self._try_place(group_id) and group_id in new_ids:
+                for slot in self.groups[group_id].COURSE_SLOTS:
+                    self.unplaced_by_slot[slot].add(group_id)
+                if self.log is not None:
+                    self.log.unplaced(self.groups[group_id])
+
+    def _waiting_for(self, freed_slots: Set[int]) -> Set[int]:
+        # Waiting groups that can use one of the freed places
+        candidates = set()
+        for slot in freed_slots:
+            candidates.update(self.unplaced_by_slot.get(slot, ()))
+        return candidates
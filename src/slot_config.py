@@ -0,0 +1,306 @@
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+# Constants
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config', 'slots.json')
+CONFIG_PATH_VARIABLE = 'BOUNSAILING_SLOT_CONFIG'
+MEMO_LIMIT = 1 << 16
+
+# Dotless and dotted i are folded before the accents are stripped, the rest decompose into ASCII letters
+TURKISH_FOLD = str.maketrans({'ı': 'i', 'İ': 'i', 'I': 'i'})
+PERIOD_PATTERN = re.compile(r'(?:\b(\d+) ?slot\b|\bslot ?(\d+)\b)')
+TIME_PATTERN = re.compile(r'\b(\d{1,2}) (\d{2})\b')
+
+
+def normalize_label(label: str) -> str:
+    """
+    Normalize a slot label so that spelling, case, accent and separator drift map to the same key.
+
+    Args:
+        label (str): Slot label as written in a form, e.g. 'Çarşamba - 2.Slot - 12.00 - 15.00'.
+
+    Returns:
+        str: Lowercase ASCII words separated by single spaces, e.g. 'carsamba 2 slot 12 00 15 00'.
+    """
+    folded = unicodedata.normalize('NFKD', label.translate(TURKISH_FOLD))
+    folded = ''.join(character for character in folded if not unicodedata.combining(character)).casefold()
+    return ' '.join(re.findall(r'[a-z]+|\d+', folded))
+
+
+def time_minutes(text: str) -> int:
+    """
+    Convert a time of day such as '9.00' or '09:00' into minutes after midnight.
+
+    Raises:
+        ValueError: If the text is not a time of day.
+    """
+    match = TIME_PATTERN.fullmatch(normalize_label(str(text)))
+    if match is None or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+        raise ValueError(f"'{text}' is not a time of day such as '9.00' or '09:00'")
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def validate_config(config: object) -> None:
+    """
+    Check the structure of a slot configuration before it is compiled.
+
+    Args:
+        config (object): Configuration as read from config/slots.json.
+
+    Raises:
+        ValueError: If a section or field is missing or has the wrong type, a number is defined twice,
+            the catalogue lists no slot or a course level refers to an unknown slot.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("The slot configuration must be a mapping with 'days', 'periods' and 'slots'")
+
+    required = {'days': ('number', 'name'), 'periods': ('number', 'start', 'end'), 'slots': ('code', 'day', 'period'),
+                'locations': ('name',), 'terms': ('number',), 'levels': ('name', 'capacity')}
+    for section, fields in required.items():
+        entries = config.get(section, [] if section in ('locations', 'terms', 'levels') else None)
+        if not isinstance(entries, list) or (section == 'slots' and not entries):
+            raise ValueError(f"The slot configuration needs a non-empty list '{section}'" if section == 'slots'
+                             else f"The slot configuration needs a list '{section}'")
+        for index, entry in enumerate(entries):
+            missing = [field for field in fields if not isinstance(entry, dict) or field not in entry]
+            if missing:
+                raise ValueError(f"Entry {index} of '{section}' lacks {', '.join(repr(field) for field in missing)}")
+        identifier = fields[0]
+        identifiers = [entry[identifier] for entry in entries]
+        if len(set(identifiers)) != len(identifiers):
+            raise ValueError(f"Two entries of '{section}' share a {identifier}")
+
+    for period in config['periods']:
+        for field in ('start', 'end'):
+            try:
+                time_minutes(period[field])
+            except ValueError as error:
+                raise ValueError(f"Period {period['number']}: {error}") from None
+    for slot in config['slots']:
+        if not isinstance(slot['code'], int) or slot['code'] < 0:
+            raise ValueError(f"Slot code {slot['code']!r} is not a non-negative integer")
+        if not isinstance(slot.get('capacity', 0), int) or slot.get('capacity', 0) < 0:
+            raise ValueError(f"Slot {slot['code']} needs a non-negative integer capacity")
+    codes = {str(slot['code']) for slot in config['slots']}
+    for level in config.get('levels', []):
+        if not isinstance(level['capacity'], dict):
+            raise ValueError(f"Level {level['name']!r} needs a capacity mapping from slot codes to quotas")
+        for slot, quota in level['capacity'].items():
+            if str(slot) not in codes:
+                raise ValueError(f"Level {level['name']!r} refers to the unknown slot {slot!r}")
+            if not isinstance(quota, int) or quota < 0:
+                raise ValueError(f"Level {level['name']!r} needs a non-negative integer capacity for slot {slot}")
+
+
+class SlotConfig:
+    """
+    Compiled slot, term and capacity configuration.
+
+    A slot is identified by its day, period and optional location. Labels are parsed in two steps:
+    the normalized label is looked up among the normalized canonical labels, and labels that drifted
+    from the canonical format are tokenized into day, period (a 'N.Slot' token or the start time)
+    and location tokens. Both steps are dictionary lookups and every distinct label is parsed only
+    once, so the parsing cost does not grow with the number of slots, terms or locations.
+    """
+
+    def __init__(self, config: Dict[str, object]):
+        """
+        Args:
+            config (Dict[str, object]): Configuration with 'days', 'periods', 'slots' and optionally
+                'locations', 'terms' and 'levels', in the format of config/slots.json.
+
+        Raises:
+            ValueError: If the configuration is malformed (see validate_config), a slot refers to an unknown
+                day, period or location, or two slots share a day, period and location.
+        """
+        validate_config(config)
+        self.days: Dict[int, str] = {day['number']: day['name'] for day in config['days']}
+        self.periods: Dict[int, Tuple[str, str]] = {period['number']: (period['start'], period['end'])
+                                                    for period in config['periods']}
+        self.locations: Dict[str, List[str]] = {location['name']: location.get('aliases', [])
+                                                for location in config.get('locations', [])}
+        self.terms: List[Dict[str, object]] = config.get('terms') or [{'number': 1, 'name': '1'}]
+        self.levels: Dict[str, Dict[int, int]] = {level['name']: {int(slot): quota for slot, quota in level['capacity'].items()}
+                                                  for level in config.get('levels', [])}
+
+        # Token tables of the fallback parser
+        self.day_tokens: Dict[str, int] = {}
+        for day in config['days']:
+            for name in [day['name']] + day.get('aliases', []):
+                self.day_tokens[normalize_label(name)] = day['number']
+        self.location_tokens: Dict[str, str] = {normalize_label(alias): name for name, aliases in self.locations.items()
+                                                for alias in [name] + aliases}
+        self.period_starts: Dict[int, int] = {time_minutes(start): number for number, (start, _) in self.periods.items()}
+
+        self.labels: Dict[str, int] = {}
+        self.capacities: Dict[int, int] = {}
+        self.codes: Dict[Tuple[int, int, Optional[str]], int] = {}
+        self.lookup: Dict[str, int] = {}
+        for slot in config['slots']:
+            code, day, period, location = slot['code'], slot['day'], slot['period'], slot.get('location')
+            if day not in self.days or period not in self.periods or (location is not None and location not in self.locations):
+                raise ValueError(f"Slot {code} refers to an unknown day, period or location")
+            if code in self.capacities or (day, period, location) in self.codes:
+                raise ValueError(f"Slot {code} is defined twice")
+            start, end = self.periods[period]
+            label = f"{self.days[day]} - {period}.Slot - {start} - {end}"
+            if location is not None:
+                label += f" - {location}"
+            self.labels[label] = code
+            self.capacities[code] = slot.get('capacity', 0)
+            self.codes[(day, period, location)] = code
+            for alias in [label] + slot.get('labels', []):
+                self.lookup[normalize_label(alias)] = code
+
+        self._memo: Dict[str, Optional[int]] = {}
+
+    def parse_slot(self, label: str) -> Optional[int]:
+        """
+        Find the slot code of a label.
+
+        Args:
+            label (str): Slot label, possibly in an older or newer form format.
+
+        Returns:
+            Optional[int]: The slot code, None if the label names no configured slot.
+        """
+        try:
+            return self._memo[label]
+        except KeyError:
+            pass
+        if len(self._memo) >= MEMO_LIMIT:
+            self._memo.clear()
+        code = self._memo[label] = self._parse(label)
+        return code
+
+    def parse_slots(self, text: str) -> List[int]:
+        """
+        Parse a comma-separated list of slot labels, skipping labels that name no configured slot.
+
+        Args:
+            text (str): Slot labels as written in the form's checkbox column.
+
+        Returns:
+            List[int]: Slot codes in the order of the labels.
+        """
+        codes = (self.parse_slot(label) for label in text.split(','))
+        return [code for code in codes if code is not None]
+
+    def capacity(self, term: Optional[int] = None) -> Dict[int, int]:
+        """
+        Build the capacity table of a term.
+
+        Args:
+            term (int, optional): Term number, the slots' default capacities if not provided.
+
+        Returns:
+            Dict[int, int]: Dictionary with slot numbers and maximum capacity per slot.
+        """
+        capacities = dict(self.capacities)
+        if term is not None:
+            overrides = next((entry.get('capacity', {}) for entry in self.terms if entry['number'] == term), None)
+            if overrides is None:
+                raise ValueError(f"Term {term} is not configured")
+            capacities.update({int(slot): quota for slot, quota in overrides.items()})
+        return capacities
+
+    def term_capacity(self) -> Dict[Tuple[int, int], int]:
+        """
+        Build the capacity of every slot in every term.
+
+        Returns:
+            Dict[Tuple[int, int], int]: Capacity per (term, slot), the format of course_slots_creating.
+        """
+        return {(entry['number'], slot): quota for entry in self.terms
+                for slot, quota in self.capacity(entry['number']).items()}
+
+    def level_capacity(self) -> Dict[str, Dict[int, int]]:
+        """
+        Build the capacity table of every course level.
+
+        A level only has room in the slots its entry lists, the other slots are 0 for it.
+
+        Returns:
+            Dict[str, Dict[int, int]]: Capacity per COURSE_LEVEL and slot, the format of place_by_course_level.
+        """
+        return {level: {slot: quotas.get(slot, 0) for slot in self.capacities} for level, quotas in self.levels.items()}
+
+    def fingerprint(self) -> str:
+        """
+        Identify the compiled configuration, e.g. for cache keys.
+
+        Returns:
+            str: Hex digest over the lookup tables.
+        """
+        tables = (sorted(self.lookup.items()), sorted(self.day_tokens.items()), sorted(self.location_tokens.items()),
+                  sorted(self.period_starts.items()), sorted((code, list(key)) for key, code in self.codes.items()))
+        return hashlib.sha256(repr(tables).encode('utf-8')).hexdigest()
+
+    def _parse(self, label: str) -> Optional[int]:
+        key = normalize_label(label)
+        if key in self.lookup:
+            return self.lookup[key]
+
+        tokens = key.split()
+        day = next((self.day_tokens[token] for token in tokens if token in self.day_tokens), None)
+        location = next((self.location_tokens[token] for token in tokens + [' '.join(pair) for pair in zip(tokens, tokens[1:])]
+                         if token in self.location_tokens), None)
+
+        period = None
+        match = PERIOD_PATTERN.search(key)
+        if match is not None:
+            period = int(match.group(1) or match.group(2))
+        else:
+            # Without a slot number, the first time of day is the start of the period
+            match = TIME_PATTERN.search(key)
+            if match is not None:
+                period = self.period_starts.get(int(match.group(1)) * 60 + int(match.group(2)))
+
+        return self.codes.get((day, period, location))
+
+
+def load_slot_config(file_path: Optional[str] = None) -> SlotConfig:
+    """
+    Load and compile a slot configuration.
+
+    JSON is always supported, YAML files (.yaml, .yml) need PyYAML.
+
+    Args:
+        file_path (str, optional): Path to the configuration. Defaults to the BOUNSAILING_SLOT_CONFIG
+            environment variable, then to config/slots.json.
+
+    Returns:
+        SlotConfig: The compiled configuration.
+
+    Raises:
+        ImportError: If a YAML configuration is given and PyYAML is not installed.
+        ValueError: If the file cannot be parsed or the configuration is invalid.
+    """
+    file_path = file_path or os.environ.get(CONFIG_PATH_VARIABLE) or DEFAULT_CONFIG_PATH
+    with open(file_path, encoding='utf-8') as file:
+        if os.path.splitext(file_path)[1].lower() in ('.yaml', '.yml'):
+            if importlib.util.find_spec('yaml') is None:
+                raise ImportError("Reading YAML slot configurations needs PyYAML; install it with 'pip install pyyaml'.")
+            import yaml
+            try:
+                config = yaml.safe_load(file)
+            except yaml.YAMLError as error:
+                raise ValueError(f"Slot configuration {file_path} is not valid YAML: {error}") from None
+        else:
+            try:
+                config = json.load(file)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Slot configuration {file_path} is not valid JSON: {error}") from None
+    try:
+        return SlotConfig(config)
+    except ValueError as error:
+        raise ValueError(f"Slot configuration {file_path} is invalid: {error}") from None
+
+
+# Loaded once, schemas.slots and the capacity tables are derived from it
+SLOT_CONFIG = load_slot_config()
@@ -0,0 +1,471 @@
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from schemas import Group
+
+
+def build_problem(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int]):
+    """
+    Convert groups and slot dictionaries into plain lists used by the solvers.
+
+    Args:
+        groups (List[Group]): Groups to place, in APPLY_DATE priority order.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+
+    Returns:
+        Tuple[List[int], List[List[int]], List[int], List[int]]: Group sizes, allowed slot indexes per group,
+        slot numbers and remaining capacity per slot index.
+    """
+    slot_numbers = [slot for slot in slot_capacity if slot_capacity[slot] - slots.get(slot, 0) > 0]
+    slot_index = {slot: index for index, slot in enumerate(slot_numbers)}
+    remaining = [slot_capacity[slot] - slots.get(slot, 0) for slot in slot_numbers]
+
+    sizes = [len(group.MEMBERS) for group in groups]
+    group_slots = [[slot_index[slot] for slot in group.COURSE_SLOTS if slot in slot_index] for group in groups]
+
+    return sizes, group_slots, slot_numbers, remaining
+
+
+def greedy_assignment(sizes: List[int], group_slots: List[List[int]], remaining: List[int]) -> List[int]:
+    """
+    Place every group into its first slot with enough room, the same rule place_groups uses.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+
+    Returns:
+        List[int]: Slot index per group, -1 for unplaced groups.
+    """
+    remaining = list(remaining)
+    assignment = [-1] * len(sizes)
+    for group_index, size in enumerate(sizes):
+        for slot_index in group_slots[group_index]:
+            if size <= remaining[slot_index]:
+                remaining[slot_index] -= size
+                assignment[group_index] = slot_index
+                break
+    return assignment
+
+
+def placed_people(sizes: List[int], assignment: List[int]) -> int:
+    """
+    Count the people placed by an assignment.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups.
+
+    Returns:
+        int: Total number of placed people.
+    """
+    return sum(size for size, slot_index in zip(sizes, assignment) if slot_index >= 0)
+
+
+def better_assignment(sizes: List[int], candidate: List[int], incumbent: List[int]) -> bool:
+    """
+    Check whether a candidate assignment beats the incumbent: more placed people, or as many and the
+    earliest applicant placed by only one of them is placed by the candidate.
+
+    Args:
+        sizes (List[int]): Number of members per group, in APPLY_DATE order.
+        candidate (List[int]): Slot index per group, -1 for unplaced groups.
+        incumbent (List[int]): Slot index per group, -1 for unplaced groups.
+
+    Returns:
+        bool: True if the candidate is strictly better.
+    """
+    candidate_people, incumbent_people = placed_people(sizes, candidate), placed_people(sizes, incumbent)
+    if candidate_people != incumbent_people:
+        return candidate_people > incumbent_people
+    for candidate_slot, incumbent_slot in zip(candidate, incumbent):
+        if (candidate_slot >= 0) != (incumbent_slot >= 0):
+            return candidate_slot >= 0
+    return False
+
+
+def assignment_to_frame(groups: List[Group], assignment: List[int], slot_numbers: List[int],
+                        slots: Dict[int, int]) -> 'pd.DataFrame':
+    """
+    Convert an assignment into the place_groups result format and book it into the slots dictionary.
+
+    Args:
+        groups (List[Group]): Groups the assignment refers to.
+        assignment (List[int]): Slot index per group, -1 for unplaced groups.
+        slot_numbers (List[int]): Slot number per slot index.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+
+    Returns:
+        pd.DataFrame: A dataframe with group placement details.
+    """
+    import pandas as pd
+
+    placements = []
+    for group, slot_index in zip(groups, assignment):
+        if slot_index >= 0:
+            slot = slot_numbers[slot_index]
+            placements.append({
+                'group': [member.FULLNAME for member in group.MEMBERS],
+                'std_numbers': [member.STD_NUMBER for member in group.MEMBERS],
+                'slot': slot,
+                'apply_date': group.APPLY_DATE
+            })
+            slots[slot] = slots.get(slot, 0) + len(group.MEMBERS)
+    return pd.DataFrame(placements)
+
+
+def max_flow_bound(sizes: List[int], group_slots: List[List[int]], remaining: List[int]) -> int:
+    """
+    Upper bound on placed people from the max-flow relaxation where groups may be split across slots.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+
+    Returns:
+        int: Maximum number of people placeable when groups are divisible.
+    """
+    group_count, slot_count = len(sizes), len(remaining)
+    source, sink = group_count + slot_count, group_count + slot_count + 1
+    graph: List[List[int]] = [[] for _ in range(group_count + slot_count + 2)]
+    heads: List[int] = []
+    capacities: List[int] = []
+
+    def add_edge(start: int, end: int, capacity: int):
+        graph[start].append(len(heads))
+        heads.append(end)
+        capacities.append(capacity)
+        graph[end].append(len(heads))
+        heads.append(start)
+        capacities.append(0)
+
+    for group_index, size in enumerate(sizes):
+        if group_slots[group_index]:
+            add_edge(source, group_index, size)
+            for slot_index in group_slots[group_index]:
+                add_edge(group_index, group_count + slot_index, size)
+    for slot_index, capacity in enumerate(remaining):
+        add_edge(group_count + slot_index, sink, capacity)
+
+    flow = 0
+    while True:
+        # Breadth-first search for the level graph
+        levels = [-1] * len(graph)
+        levels[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for edge in graph[node]:
+                if capacities[edge] > 0 and levels[heads[edge]] < 0:
+                    levels[heads[edge]] = levels[node] + 1
+                    queue.append(heads[edge])
+        if levels[sink] < 0:
+            return flow
+
+        # Depth-first search for blocking flows with an explicit stack
+        pointers = [0] * len(graph)
+        while True:
+            path: List[int] = []
+            node = source
+            while node != sink:
+                advanced = False
+                while pointers[node] < len(graph[node]):
+                    edge = graph[node][pointers[node]]
+                    if capacities[edge] > 0 and levels[heads[edge]] == levels[node] + 1:
+                        path.append(edge)
+                        node = heads[edge]
+                        advanced = True
+                        break
+                    pointers[node] += 1
+                if not advanced:
+                    if node == source:
+                        break
+                    levels[node] = -1
+                    edge = path.pop()
+                    node = heads[edge ^ 1]
+            if node != sink:
+                break
+            pushed = min(capacities[edge] for edge in path)
+            for edge in path:
+                capacities[edge] -= pushed
+                capacities[edge ^ 1] += pushed
+            flow += pushed
+
+
+def relaxation_bound(sizes: List[int], group_slots: List[List[int]], capacities: List[int], group_index: int,
+                     end: Optional[int] = None) -> int:
+    """
+    Max-flow bound on the people the groups from group_index on (up to end) can still add.
+
+    A group only counts towards slots that still have room for all of its members, and groups with
+    the same usable slots are merged into one flow node, so the network stays small deep in the search.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        capacities (List[int]): Current remaining capacity per slot index.
+        group_index (int): First group not branched on yet.
+        end (int, optional): Group index after the last group considered, all groups if not provided.
+
+    Returns:
+        int: Maximum number of people placeable when the remaining groups are divisible.
+    """
+    demand: Dict[Tuple[int, ...], int] = {}
+    for index in range(group_index, len(sizes) if end is None else end):
+        usable = tuple(slot for slot in group_slots[index] if sizes[index] <= capacities[slot])
+        if usable:
+            demand[usable] = demand.get(usable, 0) + sizes[index]
+    return max_flow_bound(list(demand.values()), [list(usable) for usable in demand], capacities)
+
+
+def search_assignments(sizes: List[int], group_slots: List[List[int]], remaining: List[int],
+                       forced: List[Optional[bool]], floor: int, target: int,
+                       deadline: float) -> Tuple[Optional[List[int]], bool, int]:
+    """
+    Depth-first search for assignments that place more than floor people.
+
+    Groups are branched in priority order and a group is tried in its slots before it is skipped.
+    Every assignment found raises the floor, the search stops when one reaches target. A node is
+    pruned when the suffix demand, the per-slot subset sums or the max-flow relaxation of the groups
+    not branched yet cannot lift it above the floor, or when the same group index and capacities were
+    searched before: the placed headcount follows from the capacities, so the subtree has nothing
+    new to offer.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+        forced (List[Optional[bool]]): Per leading group True if it must be placed, False if it must
+            be skipped; groups beyond the list are free.
+        floor (int): Headcount an assignment has to exceed.
+        target (int): Headcount at which the search stops, e.g. a proven upper bound.
+        deadline (float): time.perf_counter() value at which the search gives up.
+
+    Returns:
+        Tuple[Optional[List[int]], bool, int]: The best assignment found (None if none beats the floor),
+        whether the search finished and the explored node count.
+    """
+    group_count, slot_count = len(sizes), len(remaining)
+    forced = list(forced) + [None] * (group_count - len(forced))
+
+    # The headcount does not depend on the branching order, so forced groups are branched first and
+    # then the groups with the fewest slots and the most members, which fill the slots early
+    order = sorted((index for index in range(group_count) if forced[index] is not False),
+                   key=lambda index: (forced[index] is not True, len(group_slots[index]), -sizes[index]))
+    sizes, forced = [sizes[index] for index in order], [forced[index] for index in order]
+    group_options = [group_slots[index] for index in order]
+    group_count = len(order)
+    forced_count = sum(1 for must_place in forced if must_place is True)
+    forced_people = [0] * (forced_count + 1)
+    for position in range(forced_count - 1, -1, -1):
+        forced_people[position] = forced_people[position + 1] + sizes[position]
+
+    # Suffix demand per slot gives a cheap bound that is tried before the max-flow bound
+    suffix_people = [0] * (group_count + 1)
+    suffix_demand = [[0] * slot_count for _ in range(group_count + 1)]
+    for group_index in range(group_count - 1, -1, -1):
+        usable = bool(group_options[group_index])
+        suffix_people[group_index] = suffix_people[group_index + 1] + (sizes[group_index] if usable else 0)
+        demand = list(suffix_demand[group_index + 1])
+        for slot_index in group_options[group_index]:
+            demand[slot_index] += sizes[group_index]
+        suffix_demand[group_index] = demand
+
+    searched = set()
+
+    def pruned(group_index: int) -> bool:
+        key = (group_index, tuple(capacities))
+        if key in searched:
+            return True
+        if len(searched) >= 1 << 18:
+            searched.clear()
+        searched.add(key)
+
+        demand = suffix_demand[group_index]
+        capacity_bound = sum(min(capacities[slot], demand[slot]) for slot in range(slot_count))
+        if placed + min(suffix_people[group_index], capacity_bound) <= floor:
+            return True
+
+        # Groups are indivisible, so a slot can only be filled up to a subset sum of the sizes that can use it
+        fills = [1] * slot_count
+        for index in range(group_index, group_count):
+            for slot_index in group_options[index]:
+                if sizes[index] <= capacities[slot_index]:
+                    fills[slot_index] |= (fills[slot_index] << sizes[index]) & ((2 << capacities[slot_index]) - 1)
+        if placed + sum(fill.bit_length() - 1 for fill in fills) <= floor:
+            return True
+
+        # The forced groups not branched yet must still fit, even if they could be split
+        if group_index < forced_count and relaxation_bound(sizes, group_options, capacities, group_index,
+                                                           forced_count) < forced_people[group_index]:
+            return True
+        return placed + relaxation_bound(sizes, group_options, capacities, group_index) <= floor
+
+    best = None
+    capacities = list(remaining)
+    assignment = [-1] * group_count
+    placed = 0
+    nodes = 0
+
+    # Each stack entry holds the group index and the position of the next branch to try
+    stack = [[0, 0]]
+    while stack:
+        nodes += 1
+        if nodes % 1024 == 0 and time.perf_counter() > deadline:
+            return best, False, nodes
+
+        frame = stack[-1]
+        group_index, branch = frame
+
+        # Undo the assignment made by the previous branch of this frame
+        if group_index < group_count and assignment[group_index] >= 0:
+            capacities[assignment[group_index]] += sizes[group_index]
+            placed -= sizes[group_index]
+            assignment[group_index] = -1
+
+        if group_index == group_count:
+            if placed > floor:
+                best, floor = [-1] * len(group_slots), placed
+                for position, index in enumerate(order):
+                    best[index] = assignment[position]
+                if floor >= target:
+                    return best, True, nodes
+            stack.pop()
+            continue
+
+        if branch == 0 and pruned(group_index):
+            stack.pop()
+            continue
+
+        options = group_options[group_index]
+        while branch < len(options) and sizes[group_index] > capacities[options[branch]]:
+            branch += 1
+
+        if branch < len(options):
+            slot_index = options[branch]
+            capacities[slot_index] -= sizes[group_index]
+            placed += sizes[group_index]
+            assignment[group_index] = slot_index
+            frame[1] = branch + 1
+            stack.append([group_index + 1, 0])
+        elif branch == len(options) and forced[group_index] is not True:
+            # Skip branch: leave the group unplaced
+            frame[1] = branch + 1
+            stack.append([group_index + 1, 0])
+        else:
+            stack.pop()
+
+    return best, True, nodes
+
+
+def branch_and_bound(sizes: List[int], group_slots: List[List[int]], remaining: List[int],
+                     incumbent: List[int], target: int, time_budget: float) -> Tuple[List[int], bool, int]:
+    """
+    Search assignments of indivisible groups to slots that maximize the number of placed people.
+
+    Among assignments with the same headcount the one that places the earliest applicant the other
+    leaves out wins (see better_assignment). The search first proves the largest headcount, then
+    walks the groups in priority order and, for every group the best assignment skips, searches for
+    an assignment with the same headcount that places the same earlier groups and this one too.
+
+    Args:
+        sizes (List[int]): Number of members per group.
+        group_slots (List[List[int]]): Allowed slot indexes per group.
+        remaining (List[int]): Remaining capacity per slot index.
+        incumbent (List[int]): Starting assignment, e.g. the better of the greedy and indexed results.
+        target (int): Known upper bound on the headcount, e.g. max_flow_bound at the root.
+        time_budget (float): Wall time limit in seconds.
+
+    Returns:
+        Tuple[List[int], bool, int]: Best assignment, whether both the headcount and the priority
+        search finished and explored node count.
+    """
+    deadline = time.perf_counter() + time_budget
+    best = list(incumbent)
+    best_people = placed_people(sizes, best)
+
+    nodes = 0
+    if best_people < target:
+        found, finished, nodes = search_assignments(sizes, group_slots, remaining, [], best_people, target, deadline)
+        if found is not None:
+            best, best_people = found, placed_people(sizes, found)
+        if not finished:
+            return best, False, nodes
+
+    for group_index, size in enumerate(sizes):
+        if best[group_index] >= 0 or not any(size <= remaining[slot] for slot in group_slots[group_index]):
+            continue
+        if time.perf_counter() > deadline:
+            return best, False, nodes
+        forced = [slot_index >= 0 for slot_index in best[:group_index]] + [True]
+        found, finished, explored = search_assignments(sizes, group_slots, remaining, forced, best_people - 1,
+                                                       best_people, deadline)
+        nodes += explored
+        if found is not None:
+            best = found
+        elif not finished:
+            return best, False, nodes
+
+    return best, True, nodes
+
+
+def exact_placement(groups: List[Group], slots: Dict[int, int], slot_capacity: Dict[int, int],
+                    time_budget: float = 10.0) -> Tuple['pd.DataFrame', Dict[str, object]]:
+    """
+    Place groups with a branch-and-bound search that maximizes the number of placed people.
+
+    Groups are indivisible, may only use their COURSE_SLOTS and are prioritized by their order
+    in the list (APPLY_DATE order), which breaks ties in the headcount. The better of the greedy
+    place_groups and the indexed placements is used as the starting point, so the result never
+    places fewer people than either. When the time budget runs out the best assignment found so
+    far is returned together with the remaining optimality gap.
+
+    Args:
+        groups (List[Group]): List of groups to place, sorted by APPLY_DATE.
+        slots (Dict[int, int]): Dictionary with slot numbers as keys and their current capacities as values.
+        slot_capacity (Dict[int, int]): Dictionary with slot numbers and maximum capacity per slot.
+        time_budget (float): Wall time limit of the search in seconds.
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, object]]: Placement dataframe in the place_groups format and a
+        report with the greedy, indexed and best headcounts, the upper bound, the optimality gap,
+        whether the headcount is proven optimal ('optimal') and whether the search also finished the
+        APPLY_DATE tie-break ('finished').
+    """
+    from placement import indexed_assignment
+
+    start = time.perf_counter()
+    sizes, group_slots, slot_numbers, remaining = build_problem(groups, slots, slot_capacity)
+
+    greedy = greedy_assignment(sizes, group_slots, remaining)
+    indexed = indexed_assignment(sizes, group_slots, remaining)
+    incumbent = indexed if better_assignment(sizes, indexed, greedy) else greedy
+
+    root_bound = max_flow_bound(sizes, group_slots, remaining)
+    best, finished, nodes = branch_and_bound(sizes, group_slots, remaining, incumbent, root_bound, time_budget)
+    best_people = placed_people(sizes, best)
+    optimal = finished or best_people == root_bound
+    upper_bound = best_people if optimal else root_bound
+
+    placements = assignment_to_frame(groups, best, slot_numbers, slots)
+
+    report = {
+        'greedy_people': placed_people(sizes, greedy),
+        'indexed_people': placed_people(sizes, indexed),
+        'placed_people': best_people,
+        'upper_bound': upper_bound,
+        'gap': (upper_bound - best_people) / upper_bound if upper_bound else 0.0,
+        'optimal': optimal,
+        'finished': finished,
+        'nodes': nodes,
+        'seconds': time.perf_counter() - start
+    }
+
+    return placements, report
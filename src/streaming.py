@@ -0,0 +1,183 @@
+import glob
+import os
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+import pandas as pd
+
+from elimination import (person_background_check, check_eligibility, rejection_reasons, apply_eligibility,
+                         ELIGIBILITY_RULES)
+from identification import human_identification, FRIEND_COLUMNS
+from loading import kept_submissions
+from schemas import Human
+
+# Only the columns human_identification and the eligibility rules read are loaded from the archives
+IDENTIFICATION_COLUMNS = ['Zaman damgası', 'Ad Soyad', 'Öğrenci Numarası', 'Telefon Numarası',
+                          'Başvurduğunuz Eğitim', 'Eğitime Katılabileceğiniz Slotlar'] + FRIEND_COLUMNS
+RULE_COLUMNS = [column for rule in ELIGIBILITY_RULES for column in rule['columns']]
+
+
+def is_loaded_column(column: str) -> bool:
+    """
+    Check whether an archive column is read, matching the rule columns as elimination.find_column does.
+
+    Args:
+        column (str): Column name of the archive.
+
+    Returns:
+        bool: True for identification columns and columns of an eligibility rule.
+    """
+    return column in IDENTIFICATION_COLUMNS or any(column.startswith(rule_column) for rule_column in RULE_COLUMNS)
+
+
+def expand_paths(file_paths: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Expand a CSV path, a directory or a glob pattern into a sorted list of CSV files.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+
+    Returns:
+        List[str]: Paths of the CSV files to be read.
+    """
+    if isinstance(file_paths, str):
+        file_paths = [file_paths]
+
+    expanded = []
+    for file_path in file_paths:
+        if os.path.isdir(file_path):
+            expanded.extend(sorted(glob.glob(os.path.join(file_path, '*.csv'))))
+        elif any(char in file_path for char in '*?['):
+            expanded.extend(sorted(glob.glob(file_path)))
+        else:
+            expanded.append(file_path)
+    return expanded
+
+
+def iter_response_chunks(file_paths: Union[str, Iterable[str]], chunksize: int = 10_000) -> Iterator[pd.DataFrame]:
+    """
+    Read one or many response CSVs chunk by chunk.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+        chunksize (int): Number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: Chunks holding only the columns needed for identification and eligibility.
+    """
+    for file_path in expand_paths(file_paths):
+        with pd.read_csv(file_path, usecols=is_loaded_column,
+                         chunksize=chunksize) as reader:
+            yield from reader
+
+
+def iter_checked_applicants(file_paths: Union[str, Iterable[str]], chunksize: int = 10_000,
+                            keep: str = 'latest') -> Iterator[Tuple[Dict[int, Human], Dict[int, str]]]:
+    """
+    Identify applicants and evaluate the eligibility rules chunk by chunk.
+
+    Duplicate submissions inside a chunk are resolved with loading.kept_submissions before identification.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+        chunksize (int): Number of rows per chunk.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Yields:
+        Tuple[Dict[int, Human], Dict[int, str]]: Applicants of one chunk keyed by student number and
+        the rejection reasons of the ineligible ones.
+    """
+    if keep not in ('latest', 'earliest'):
+        raise ValueError(f"keep must be 'latest' or 'earliest', not {keep!r}")
+
+    for chunk in iter_response_chunks(file_paths, chunksize):
+        chunk = chunk[kept_submissions(chunk, keep)]
+        yield human_identification(chunk), rejection_reasons(check_eligibility(chunk))
+
+
+def iter_applicants(file_paths: Union[str, Iterable[str]], chunksize: int = 10_000,
+                    keep: str = 'latest') -> Iterator[Dict[int, Human]]:
+    """
+    Identify applicants chunk by chunk.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+        chunksize (int): Number of rows per chunk.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Yields:
+        Dict[int, Human]: Applicants of one chunk keyed by student number.
+    """
+    for chunk_people, _ in iter_checked_applicants(file_paths, chunksize, keep):
+        yield chunk_people
+
+
+def is_preferred(candidate: Human, existing: Human, keep: str) -> bool:
+    """
+    Decide whether a submission replaces an earlier seen one of the same student number.
+
+    Args:
+        candidate (Human): Newly read submission.
+        existing (Human): Submission kept so far.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Returns:
+        bool: True if the candidate should be kept instead.
+    """
+    if candidate.APPLY_DATE is None:
+        return False
+    if existing.APPLY_DATE is None:
+        return True
+    if keep == 'latest':
+        return candidate.APPLY_DATE >= existing.APPLY_DATE
+    return candidate.APPLY_DATE < existing.APPLY_DATE
+
+
+def stream_applicants(file_paths: Union[str, Iterable[str]], chunksize: int = 10_000,
+                      keep: str = 'latest') -> Tuple[Dict[int, Human], Dict[int, str]]:
+    """
+    Load applicants and their rejection reasons from one or many response archives chunk by chunk.
+
+    Only one chunk of raw rows is alive at a time; the memory kept across chunks is one Human per
+    distinct student number. Submissions of the same student number in different files are
+    deduplicated by their timestamp, keeping the latest or the earliest one.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+        chunksize (int): Number of rows per chunk.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Returns:
+        Tuple[Dict[int, Human], Dict[int, str]]: Kept applicants keyed by student number and the rejection
+        reasons of their kept submissions, the format of PipelineCache.load_people and load_rejections.
+    """
+    people: Dict[int, Human] = {}
+    rejections: Dict[int, str] = {}
+
+    for chunk_people, chunk_rejections in iter_checked_applicants(file_paths, chunksize, keep):
+        for std_number, person in chunk_people.items():
+            existing = people.get(std_number)
+            if existing is None or is_preferred(person, existing, keep):
+                people[std_number] = person
+                if std_number in chunk_rejections:
+                    rejections[std_number] = chunk_rejections[std_number]
+                else:
+                    rejections.pop(std_number, None)
+
+    return people, rejections
+
+
+def stream_people(file_paths: Union[str, Iterable[str]], chunksize: int = 10_000,
+                  keep: str = 'latest') -> Dict[int, Human]:
+    """
+    Load eligible applicants from one or many response archives without holding a whole file in memory.
+
+    Args:
+        file_paths (Union[str, Iterable[str]]): One or many paths, directories or glob patterns.
+        chunksize (int): Number of rows per chunk.
+        keep (str): 'latest' or 'earliest' submission of a student number.
+
+    Returns:
+        Dict[int, Human]: Eligible applicants keyed by student number.
+    """
+    # Eligibility is checked on the kept submission only
+    return person_background_check(apply_eligibility(*stream_applicants(file_paths, chunksize, keep)))
@@ -0,0 +1,160 @@
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from elimination import DEPOSIT_COLUMN, THEORY_COLUMN, PRACTICE_COLUMN
+from identification import FRIEND_COLUMNS
+from schemas import Human, slots
+
+# Same column order as the Google Forms export in data/
+RESPONSE_COLUMNS: List[str] = (['Zaman damgası', 'Ad Soyad', 'Öğrenci Numarası', 'E-posta', 'Telefon Numarası',
+                                'Doğum Tarihi', 'Sınıfınız', 'Yüzme biliyor musunuz?', 'Başvurduğunuz Eğitim',
+                                'IBAN', 'Eğitime Katılabileceğiniz Slotlar'] + FRIEND_COLUMNS +
+                               [DEPOSIT_COLUMN, THEORY_COLUMN, PRACTICE_COLUMN])
+
+COURSE_LEVELS = ['1* Temel Yelken Eğitimi', '2* İleri Yelken Eğitimi']
+FIRST_STD_NUMBER = 2019000000
+
+
+def generate_responses(count: int, seed: int = 0, friend_probability: float = 0.35, friend_window: int = 50,
+                       advanced_share: float = 0.16, slot_skew: float = 1.0, max_slots: int = 8,
+                       start_date: datetime = datetime(2024, 9, 27, 17, 0, 0)) -> pd.DataFrame:
+    """
+    Generate a synthetic responses sheet with the same columns as the application form export.
+
+    Friends are drawn from applicants who applied shortly before or after, so friendships form
+    local clusters like in the real data. Slot preferences follow a power law over the slots
+    table; slots near the end of the table (the weekend) are the most popular.
+
+    Args:
+        count (int): Number of responses.
+        seed (int): Seed of the random generator.
+        friend_probability (float): Probability of naming a first friend, halved for each further friend.
+        friend_window (int): How many applications away a friend can be.
+        advanced_share (float): Share of applicants applying to the 2* course.
+        slot_skew (float): Power law exponent of slot popularity, 0 means uniform.
+        max_slots (int): Maximum number of slots an applicant selects.
+        start_date (datetime): Timestamp of the first response.
+
+    Returns:
+        pd.DataFrame: Synthetic responses accepted by human_identification.
+    """
+    rng = np.random.default_rng(seed)
+    index = np.arange(count)
+    std_numbers = FIRST_STD_NUMBER + index
+
+    # Responses arrive a few seconds to a few minutes apart
+    offsets = np.cumsum(rng.exponential(30.0, count)).astype('int64')
+    timestamps = (pd.Timestamp(start_date) + pd.to_timedelta(offsets, unit='s')).strftime("%d.%m.%Y %H:%M:%S")
+
+    levels = np.where(rng.random(count) < advanced_share, COURSE_LEVELS[1], COURSE_LEVELS[0])
+
+    # Pick slots without replacement with power law weights using the Gumbel top-k trick
+    slot_names = np.array(list(slots))
+    popularity = 1.0 / np.arange(len(slot_names), 0, -1) ** slot_skew
+    keys = np.log(popularity) + rng.gumbel(size=(count, len(slot_names)))
+    ranked = np.argsort(-keys, axis=1)
+    slot_counts = rng.integers(1, max_slots + 1, count)
+    slot_strings = [', '.join(slot_names[np.sort(row[:slot_count])])
+                    for row, slot_count in zip(ranked, slot_counts)]
+
+    data = {
+        'Zaman damgası': timestamps,
+        'Ad Soyad': [f"Applicant {number}" for number in index],
+        'Öğrenci Numarası': std_numbers,
+        'E-posta': [f"applicant{number}@example.com" for number in index],
+        'Telefon Numarası': [f"90 5{number % 100:02d} {number // 100 % 1000:03d} {number % 10000:04d}"
+                             for number in index],
+        'Doğum Tarihi': (pd.Timestamp(2000, 1, 1) + pd.to_timedelta(rng.integers(0, 2500, count), unit='D'))
+        .strftime("%d.%m.%Y"),
+        'Sınıfınız': rng.integers(1, 5, count).astype(str),
+        'Yüzme biliyor musunuz?': np.where(rng.random(count) < 0.97, 'Evet', 'Hayır'),
+        'Başvurduğunuz Eğitim': levels,
+        'IBAN': [f"TR{number % 100:02d} 0000 0000 0000 0000 {number % 10000:04d} 00" for number in index],
+        'Eğitime Katılabileceğiniz Slotlar': slot_strings,
+    }
+
+    for position, column in enumerate(FRIEND_COLUMNS):
+        has_friend = rng.random(count) < friend_probability * 0.5 ** position
+        distance = rng.integers(1, friend_window + 1, count) * rng.choice([-1, 1], count)
+        friends = np.clip(index + distance, 0, count - 1) + FIRST_STD_NUMBER
+        data[column] = pd.Series(np.where(has_friend, friends, np.nan))
+
+    data[DEPOSIT_COLUMN] = np.where(rng.random(count) < 0.95,
+                                    [f"https://drive.google.com/open?id=synthetic{number}" for number in index], None)
+    is_advanced = levels == COURSE_LEVELS[1]
+    data[THEORY_COLUMN] = np.where(is_advanced, 'bahar dönemi', None)
+    data[PRACTICE_COLUMN] = np.where(is_advanced, 'bahar dönemi', None)
+
+    return pd.DataFrame(data, columns=RESPONSE_COLUMNS)
+
+
+def synthetic_capacity(count: int, fill_ratio: float = 0.7) -> dict:
+    """
+    Spread a capacity proportional to the number of applicants over all slots.
+
+    Args:
+        count (int): Number of applicants.
+        fill_ratio (float): Share of applicants the total capacity can hold.
+
+    Returns:
+        dict: Dictionary with slot numbers and maximum capacity per slot.
+    """
+    per_slot = max(1, int(count * fill_ratio / len(slots)))
+    return {slot: per_slot for slot in slots.values()}
+
+
+def synthetic_people(count: int, seed: int = 0) -> Dict[int, Human]:
+    """
+    Create random applicants directly as Human objects.
+
+    Args:
+        count (int): Number of applicants.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        Dict[int, Human]: Dictionary where keys are student numbers and values are Human objects.
+    """
+    rng = random.Random(seed)
+    slot_codes = list(slots.values())
+    start_date = datetime(2024, 9, 27)
+    people = {}
+
+    for index in range(count):
+        person = Human()
+        person.STD_NUMBER = 2020000000 + index
+        person.FULLNAME = f"Applicant {index}"
+        person.PHONE_NUMBER = f"90 5{index:09d}"
+        person.isMember = True
+        person.COURSE_LEVEL = '1* Temel Yelken Eğitimi' if rng.random() < 0.7 else '2* İleri Yelken Eğitimi'
+        person.APPLY_DATE = start_date + timedelta(seconds=index * 7)
+        person.COURSE_SLOTS = rng.sample(slot_codes, rng.randint(1, 8))
+        person.FRIENDS = [2020000000 + rng.randrange(count) for _ in range(rng.choice((0, 0, 1, 2)))]
+        person.LAST_COMPLETED_COURSE = '1* Temel Yelken Eğitimi'
+        people[person.STD_NUMBER] = person
+
+    return people
+
+
+def synthetic_placement(group_count: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Create a placement dataframe in the place_groups format with groups of one to four members.
+
+    Args:
+        group_count (int): Number of placed groups.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        pd.DataFrame: One row per group with member names, slot and apply date.
+    """
+    rng = random.Random(seed)
+    slot_numbers = list(slots.values())
+    start = datetime(2024, 9, 27, 17, 0, 0)
+    return pd.DataFrame({
+        'group': [[f"Applicant {index}-{member}" for member in range(rng.randint(1, 4))] for index in range(group_count)],
+        'slot': [rng.choice(slot_numbers) for _ in range(group_count)],
+        'apply_date': [start + timedelta(seconds=30 * index) for index in range(group_count)]
+    })
@@ -0,0 +1,75 @@
+import os
+import sys
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+# The modules in src import each other by their flat names, as when they are run from src
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+# Small form export with duplicates, rejected applicants and friendships across course levels
+RESPONSES_PATH = os.path.join(DATA_DIR, 'responses.csv')
+# 200 responses of synthetic.generate_responses(200, seed=0), enough to fill the popular slots
+SYNTHETIC_RESPONSES_PATH = os.path.join(DATA_DIR, 'synthetic_responses.csv')
+
+from schemas import Human  # noqa: E402
+
+
+@pytest.fixture
+def responses_path() -> str:
+    return RESPONSES_PATH
+
+
+@pytest.fixture
+def responses(responses_path):
+    import pandas as pd
+
+    return pd.read_csv(responses_path)
+
+
+@pytest.fixture
+def synthetic_responses_path() -> str:
+    return SYNTHETIC_RESPONSES_PATH
+
+
+@pytest.fixture
+def synthetic_responses(synthetic_responses_path):
+    import pandas as pd
+
+    return pd.read_csv(synthetic_responses_path)
+
+
+@pytest.fixture
+def synthetic_groups(synthetic_responses):
+    """
+    Groups of the eligible synthetic applicants, sorted by APPLY_DATE.
+    """
+    from elimination import apply_eligibility, check_eligibility, person_background_check, rejection_reasons
+    from group_manager import cluster_friendship_groups
+    from identification import human_identification
+
+    people = apply_eligibility(human_identification(synthetic_responses),
+                               rejection_reasons(check_eligibility(synthetic_responses)))
+    return cluster_friendship_groups(person_background_check(people))
+
+
+@pytest.fixture
+def make_person():
+    """
+    Factory of applicants with the fields the pipeline reads.
+    """
+    def make(std_number: int, apply_date: datetime, course_slots: List[int], friends: Optional[List[int]] = None,
+             course_level: str = '1*') -> Human:
+        person = Human()
+        person.STD_NUMBER = std_number
+        person.FULLNAME = f"Applicant {std_number}"
+        person.APPLY_DATE = apply_date
+        person.isMember = True
+        person.COURSE_LEVEL = course_level
+        person.COURSE_SLOTS = course_slots
+        person.FRIENDS = friends or []
+        return person
+
+    return make
@@ -0,0 +1,30 @@
+import pickle
+
+import cache
+from cache import PipelineCache
+
+
+def test_unreadable_entry_is_recomputed(responses_path, tmp_path):
+    pipeline_cache = PipelineCache(str(tmp_path))
+    people = pipeline_cache.load_people(responses_path)
+    key = pipeline_cache.people_key(responses_path)
+    # An entry pickled by code that no longer exists fails with ModuleNotFoundError while loading
+    with open(pipeline_cache._path('people', key), 'wb') as file:
+        file.write(b'\x80\x04cremoved_module\nHuman\n.')
+
+    assert pipeline_cache.load_people(responses_path).keys() == people.keys()
+    assert pipeline_cache.stats['people'] == {'hits': 0, 'misses': 2}
+    with open(pipeline_cache._path('people', key), 'rb') as file:
+        assert pickle.load(file)['key'] == key
+
+
+def test_parsing_sources_are_part_of_every_key(responses_path, tmp_path, monkeypatch):
+    before = PipelineCache(str(tmp_path))
+    file_hash = cache.file_hash
+    for file_name in ('identification.py', 'schemas.py', 'loading.py'):
+        monkeypatch.setattr(cache, 'file_hash', lambda path, changed=file_name: (
+            'changed' if path.endswith(changed) else file_hash(path)))
+        after = PipelineCache(str(tmp_path))
+
+        assert after.people_key(responses_path) != before.people_key(responses_path)
+        assert after.rejections_key(responses_path) != before.rejections_key(responses_path)
@@ -0,0 +1,57 @@
+import pytest
+
+from elimination import DEPOSIT_COLUMN, check_eligibility, rejection_reasons
+from identification import human_identification
+from loading import kept_submissions
+from streaming import stream_applicants
+
+
+def test_latest_timestamp_wins_over_export_order(responses):
+    kept = responses[kept_submissions(responses)]
+
+    assert kept['Öğrenci Numarası'].is_unique
+    assert kept.loc[kept['Öğrenci Numarası'] == 1004, 'Zaman damgası'].item() == '28.09.2024 09:00:00'
+    assert responses[kept_submissions(responses, keep='earliest')].loc[
+        lambda data: data['Öğrenci Numarası'] == 1004, 'Zaman damgası'].item() == '27.09.2024 12:00:00'
+
+
+def test_default_and_streaming_paths_keep_the_same_submission(responses, responses_path):
+    people = human_identification(responses)
+    rejections = rejection_reasons(check_eligibility(responses))
+
+    # Three rows per chunk put the two submissions of 1004 into different chunks
+    streamed_people, streamed_rejections = stream_applicants(responses_path, chunksize=3)
+
+    assert people[1004].COURSE_SLOTS == [73]
+    assert {std_number: (person.APPLY_DATE, person.COURSE_SLOTS) for std_number, person in people.items()} == \
+        {std_number: (person.APPLY_DATE, person.COURSE_SLOTS) for std_number, person in streamed_people.items()}
+    assert rejections == streamed_rejections
+
+
+def test_rules_reject_with_the_first_failing_reason(responses):
+    eligibility = check_eligibility(responses)
+
+    assert rejection_reasons(eligibility) == {
+        1005: 'The 2* course requires completed 1* theory and practice courses',
+        1007: 'Cannot swim',
+        1008: 'No deposit receipt uploaded',
+    }
+    assert eligibility.loc[responses['Öğrenci Numarası'] == 1004, 'duplicate'].tolist() == [True, False]
+
+
+def test_deposit_column_is_matched_by_its_prefix(responses):
+    assert DEPOSIT_COLUMN not in responses.columns
+
+    eligibility = check_eligibility(responses)
+
+    assert 'deposit' in eligibility.columns
+
+
+def test_rule_without_column_is_skipped_with_a_warning(responses):
+    data = responses.drop(columns=[column for column in responses.columns if column.startswith(DEPOSIT_COLUMN)])
+
+    with pytest.warns(UserWarning, match="'deposit'"):
+        eligibility = check_eligibility(data)
+
+    assert 'deposit' not in eligibility.columns
+    assert 1008 not in rejection_reasons(eligibility)
@@ -0,0 +1,26 @@
+import pytest
+
+from benchmark_placement import legacy_grouping
+from elimination import person_background_check
+from group_manager import cluster_friendship_groups
+from identification import human_identification
+from synthetic import synthetic_people
+
+
+def group_signatures(groups):
+    return {(frozenset(group.get_member_std_numbers()), group.COURSE_LEVEL) for group in groups}
+
+
+@pytest.mark.parametrize('export', ['responses', 'synthetic_responses'])
+def test_clustering_matches_legacy_grouping(export, request):
+    people = person_background_check(human_identification(request.getfixturevalue(export)))
+
+    assert group_signatures(cluster_friendship_groups(people)) == group_signatures(legacy_grouping(people))
+
+
+def test_clustering_matches_legacy_grouping_with_unknown_friends():
+    # Friends are drawn from all applicants, so chains cross course levels and some friends are unknown
+    people = synthetic_people(500, seed=1)
+    del people[2020000007]
+
+    assert group_signatures(cluster_friendship_groups(people)) == group_signatures(legacy_grouping(people))
@@ -0,0 +1,40 @@
+import pytest
+
+from identification import FRIEND_COLUMNS, human_identification, human_identification_rowwise
+
+HUMAN_ATTRIBUTES = ['STD_NUMBER', 'FULLNAME', 'PHONE_NUMBER', 'APPLY_DATE', 'isMember', 'COURSE_LEVEL',
+                    'COURSE_SLOTS', 'SLOT_MASK', 'FRIENDS', 'isPlaced', 'LAST_COMPLETED_COURSE']
+
+
+def human_attributes(person):
+    return {attr: getattr(person, attr) for attr in HUMAN_ATTRIBUTES}
+
+
+@pytest.mark.parametrize('export', ['responses', 'synthetic_responses'])
+def test_vectorized_identification_matches_rowwise(export, request):
+    data = request.getfixturevalue(export)
+    expected = human_identification_rowwise(data)
+    actual = human_identification(data)
+
+    assert actual.keys() == expected.keys()
+    for std_number in expected:
+        assert human_attributes(actual[std_number]) == human_attributes(expected[std_number])
+
+
+def test_friend_number_zero_is_kept(responses):
+    data = responses.head(5).copy()
+    data[FRIEND_COLUMNS[0]] = 0
+
+    friends = [person.FRIENDS for person in human_identification(data).values()]
+    assert friends == [person.FRIENDS for person in human_identification_rowwise(data).values()]
+    assert all(0 in person_friends for person_friends in friends)
+
+
+@pytest.mark.parametrize('identify', [human_identification, human_identification_rowwise])
+def test_text_friend_entry_raises(responses, identify):
+    data = responses.head(5).copy()
+    data[FRIEND_COLUMNS[0]] = data[FRIEND_COLUMNS[0]].astype(object)
+    data.loc[data.index[2], FRIEND_COLUMNS[0]] = 'abc'
+
+    with pytest.raises(ValueError):
+        identify(data)
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from local_search import multi_start_assignment
+from placement import solve_assignment
+
+
+def placed(sizes, assignment):
+    return sum(size for size, slot in zip(sizes, assignment) if slot is not None)
+
+
+def random_problem(seed: int):
+    rng = random.Random(seed)
+    slot_capacity = {slot: rng.randint(2, 8) for slot in (12, 13, 32, 33, 42, 43)}
+    sizes = [rng.randint(1, 4) for _ in range(30)]
+    group_slots = [rng.sample(list(slot_capacity), rng.randint(1, 3)) for _ in sizes]
+    return sizes, group_slots, slot_capacity
+
+
+def test_multistart_starts_from_the_indexed_placement():
+    # First-fit puts the first group into slot 12 and leaves no room for the second one
+    sizes, group_slots, slot_capacity = [2, 3], [[12, 13], [12]], {12: 3, 13: 2}
+    assert placed(sizes, solve_assignment(sizes, group_slots, slot_capacity, engine='greedy')) == 2
+
+    assignment, report = multi_start_assignment(sizes, group_slots, slot_capacity, workers=1, time_budget=0.0)
+
+    assert assignment == [13, 12]
+    assert report['placed_people'] == report['indexed_people'] == 5
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_multistart_places_at_least_as_many_people_as_indexed(seed):
+    sizes, group_slots, slot_capacity = random_problem(seed)
+    indexed = solve_assignment(sizes, group_slots, slot_capacity, engine='indexed')
+
+    assignment, report = multi_start_assignment(sizes, group_slots, slot_capacity, workers=1, time_budget=0.05,
+                                                seed=seed)
+
+    assert placed(sizes, assignment) >= placed(sizes, indexed)
+    assert placed(sizes, assignment) == report['placed_people']
+    occupancy = {}
+    for size, slots, slot in zip(sizes, group_slots, assignment):
+        if slot is not None:
+            assert slot in slots
+            occupancy[slot] = occupancy.get(slot, 0) + size
+    assert all(occupancy[slot] <= slot_capacity[slot] for slot in occupancy)
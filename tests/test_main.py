@@ -0,0 +1,69 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from slot_config import DEFAULT_CONFIG_PATH
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'main.py')
+ENGINES = ['greedy', 'indexed', 'exact']
+# The exact search must finish so that every run ends at the same placement
+BUDGET = ['--time-budget', '60']
+
+
+def run_main(*arguments: str, slot_config=None) -> str:
+    environment = dict(os.environ)
+    environment.pop('BOUNSAILING_SLOT_CONFIG', None)
+    if slot_config is not None:
+        environment['BOUNSAILING_SLOT_CONFIG'] = slot_config
+    return subprocess.run([sys.executable, MAIN_PATH, *arguments], env=environment, capture_output=True, text=True,
+                          check=True).stdout
+
+
+def placed_people(output: str) -> int:
+    # The last line reads '<placed> of <eligible> people placed with the <engine> engine'
+    return int(output.strip().splitlines()[-1].split()[0])
+
+
+def large_catalogue_config(locations: int) -> dict:
+    """
+    Extend the configured catalogue with located copies of every slot, listed before the configured slots.
+
+    The located slots take the low bit positions, so the slots named in the responses end up above
+    bit 63 once there are three or more locations.
+    """
+    with open(DEFAULT_CONFIG_PATH, encoding='utf-8') as file:
+        config = json.load(file)
+    configured = config['slots']
+    config['locations'] = [{'name': f"Iskele{location}"} for location in range(locations)]
+    config['slots'] = [{'code': (location + 1) * 100 + slot['code'], 'day': slot['day'], 'period': slot['period'],
+                        'location': f"Iskele{location}", 'capacity': 10}
+                       for location in range(locations) for slot in configured] + configured
+    return config
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_large_catalogue_keeps_the_placed_headcount(synthetic_responses_path, tmp_path, engine):
+    # Nobody names a located slot, so the catalogue only widens the eligibility matrix past 64 and 128 slots
+    config_path = tmp_path / 'slots.json'
+    config_path.write_text(json.dumps(large_catalogue_config(8), ensure_ascii=False), encoding='utf-8')
+    place = ['place', '--engine', engine, *BUDGET, '--data', synthetic_responses_path]
+
+    configured = run_main(*place, '--cache-dir', str(tmp_path / 'configured'))
+    large = run_main(*place, '--cache-dir', str(tmp_path / 'large'), slot_config=str(config_path))
+
+    assert placed_people(large) == placed_people(configured) > 0
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_scenario_baseline_matches_place(synthetic_responses_path, tmp_path, engine):
+    common = ['--engine', engine, *BUDGET, '--data', synthetic_responses_path, '--cache-dir', str(tmp_path)]
+    table_path = tmp_path / 'scenarios.csv'
+    run_main('scenarios', *common, '--terms', '3', '--workers', '1', '--output', str(table_path))
+    table = pd.read_csv(table_path)
+
+    assert [placed_people(run_main('place', *common)), placed_people(run_main('place', *common, '--terms', '3'))] == \
+        table['placed_people'].iloc[:2].tolist()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from benchmark_placement import dict_evaluate, dict_first_fit
+from occupancy import (capacity_vector, columns_to_slots, eligibility_matrix, evaluate_assignments, first_fit,
+                       size_vector)
+from slot_config import SLOT_CONFIG
+
+
+@pytest.mark.parametrize('slot_count', [21, 200, 300])
+def test_first_fit_matches_sequential_loop_on_wide_matrices(slot_count):
+    # More than 127 and 255 slots exceed the int8 and uint8 ranges
+    rng = np.random.default_rng(slot_count)
+    eligibility = rng.random((2_000, slot_count)) < 0.05
+    sizes = rng.integers(1, 5, 2_000)
+    remaining = rng.integers(0, 40, slot_count)
+
+    expected, left = [], remaining.copy()
+    for row, size in zip(eligibility, sizes):
+        fitting = np.flatnonzero(row & (size <= left))
+        expected.append(int(fitting[0]) if fitting.size else -1)
+        if fitting.size:
+            left[fitting[0]] -= size
+
+    assert first_fit(eligibility, sizes, remaining).tolist() == expected
+
+
+def test_batched_placement_matches_dictionary_loops(synthetic_groups):
+    # Three seats per slot fill up long before the last group
+    slot_capacity = {slot: 3 for slot in SLOT_CONFIG.capacity()}
+    eligibility, sizes, remaining = (eligibility_matrix(synthetic_groups), size_vector(synthetic_groups),
+                                     capacity_vector(slot_capacity))
+    assignment = first_fit(eligibility, sizes, remaining)
+
+    assert columns_to_slots(assignment) == dict_first_fit(synthetic_groups, {slot: 0 for slot in slot_capacity},
+                                                          slot_capacity)
+
+    # Candidates drop random groups from the first-fit assignment, one also moves a group to a slot it cannot attend
+    rng = np.random.default_rng(0)
+    batch = np.where(rng.random((16, len(synthetic_groups))) < 0.1, -1, assignment[None, :])
+    batch[0, int(np.argmax(~eligibility[:, 0]))] = 0
+    evaluation = evaluate_assignments(batch, sizes, eligibility, remaining)
+
+    assert np.where(evaluation['feasible'], evaluation['placed_people'], -1).tolist() == \
+        dict_evaluate([columns_to_slots(row) for row in batch], synthetic_groups, slot_capacity)
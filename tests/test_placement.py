@@ -0,0 +1,59 @@
+import pytest
+
+from placement import course_slots_creating, place_by_course_level, schedule_terms, solve_assignment
+from slot_config import SLOT_CONFIG
+
+# Large enough for the exact search to finish, so the result does not depend on timing
+TIME_BUDGET = 60.0
+
+
+@pytest.mark.parametrize('engine', ['greedy', 'indexed', 'exact'])
+@pytest.mark.parametrize('use_processes', [True, False])
+def test_place_by_course_level_matches_solving_levels_one_by_one(synthetic_groups, engine, use_processes):
+    groups = synthetic_groups
+    level_capacity = SLOT_CONFIG.level_capacity()
+    expected = [None] * len(groups)
+    for level, capacity in level_capacity.items():
+        level_indexes = [index for index, group in enumerate(groups) if group.COURSE_LEVEL == level]
+        level_assignment = solve_assignment([len(groups[index].MEMBERS) for index in level_indexes],
+                                            [groups[index].COURSE_SLOTS for index in level_indexes], capacity,
+                                            TIME_BUDGET, engine)
+        for index, slot in zip(level_indexes, level_assignment):
+            expected[index] = slot
+
+    level_slots = {}
+    assignment = place_by_course_level(groups, level_slots, level_capacity, engine, TIME_BUDGET,
+                                       use_processes=use_processes)
+
+    assert assignment == expected
+    assert all(people <= level_capacity[level][slot]
+               for level, occupancy in level_slots.items() for slot, people in occupancy.items())
+
+
+@pytest.mark.parametrize('engine', ['greedy', 'indexed', 'exact'])
+def test_schedule_terms_offers_each_term_the_groups_left_before(synthetic_groups, engine):
+    groups = synthetic_groups
+    slot_capacity = SLOT_CONFIG.capacity()
+    term_count = 3
+    # A third of the seats per term leaves groups over for the later terms
+    term_capacity = {key: capacity // 3
+                     for key, capacity in course_slots_creating(list(slot_capacity), term_count).items()}
+
+    expected_terms, expected = [None] * len(groups), [None] * len(groups)
+    waiting = list(range(len(groups)))
+    for term in range(1, term_count + 1):
+        term_assignment = solve_assignment([len(groups[index].MEMBERS) for index in waiting],
+                                           [groups[index].COURSE_SLOTS for index in waiting],
+                                           {slot: term_capacity[(term, slot)] for slot in slot_capacity},
+                                           TIME_BUDGET, engine)
+        for index, slot in zip(waiting, term_assignment):
+            if slot is not None:
+                expected_terms[index], expected[index] = term, slot
+        waiting = [index for index, slot in zip(waiting, term_assignment) if slot is None]
+
+    term_slots = {}
+    group_terms, assignment = schedule_terms(groups, term_slots, term_capacity, engine, TIME_BUDGET)
+
+    assert set(expected_terms) == {1, 2, 3, None}
+    assert (group_terms, assignment) == (expected_terms, expected)
+    assert all(people <= term_capacity[key] for key, people in term_slots.items())
@@ -0,0 +1,26 @@
+import main
+from profiler import PipelineProfiler
+
+
+def test_total_counts_nested_stages_once():
+    profiler = PipelineProfiler()
+    with profiler.stage('outer'):
+        with profiler.stage('inner'):
+            pass
+        with profiler.stage('inner'):
+            pass
+    report = profiler.report()
+
+    assert [record['depth'] for record in report['stages']] == [1, 1, 0]
+    assert report['total_seconds'] == report['stages'][-1]['seconds']
+
+
+def test_report_counts_the_groups_repair_split(responses, monkeypatch):
+    # With one seat per slot every group of friends has to be split
+    monkeypatch.setattr(main, 'SLOT_CAPACITY', {slot: 1 for slot in main.SLOT_CAPACITY})
+    profiler = PipelineProfiler()
+    main.execution(responses, profiler)
+    records = {record['stage']: record for record in profiler.report()['stages']}
+
+    assert records['repair_groups']['outputs']['split_groups'] == 2
+    assert records['repair_groups']['outputs']['groups'] == records['grouping']['outputs']['grouped_people']
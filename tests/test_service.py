@@ -0,0 +1,102 @@
+import asyncio
+import json
+from datetime import datetime
+from http import HTTPStatus
+
+import pytest
+
+from service import PlacementService, ServiceError, human_from_json
+from session import PlacementSession
+
+SLOT_CAPACITY = {12: 4, 13: 4}
+
+
+def session_state(session: PlacementSession):
+    groups = {group_id: [member.STD_NUMBER for member in group.MEMBERS] for group_id, group in session.groups.items()}
+    return (dict(session.people), dict(session.group_of), groups, dict(session.placement), dict(session.slots),
+            {std_number: set(others) for std_number, others in session.adjacency.items() if others})
+
+
+@pytest.fixture
+def session(make_person):
+    people = {
+        1: make_person(1, datetime(2024, 9, 1, 10), [12, 13], friends=[2]),
+        2: make_person(2, datetime(2024, 9, 2, 10), [12]),
+        3: make_person(3, datetime(2024, 9, 3, 10), [13]),
+    }
+    return PlacementSession(people, SLOT_CAPACITY)
+
+
+def test_human_from_json_converts_offsets_to_local_time():
+    person = human_from_json({'std_number': 4, 'fullname': 'Applicant 4', 'course_level': '1*',
+                              'apply_date': '2024-10-01T10:00:00+03:00', 'course_slots': [12], 'friends': [2]})
+
+    assert person.APPLY_DATE.tzinfo is None
+    assert person.APPLY_DATE == datetime.fromisoformat('2024-10-01T10:00:00+03:00').astimezone().replace(tzinfo=None)
+
+
+def test_human_from_json_rejects_invalid_dates():
+    with pytest.raises(ServiceError) as error:
+        human_from_json({'std_number': 4, 'fullname': 'Applicant 4', 'course_level': '1*', 'apply_date': 'tomorrow'})
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_failed_update_leaves_session_unchanged(session, make_person):
+    before = session_state(session)
+    aware = datetime.fromisoformat('2024-10-01T10:00:00+03:00')
+
+    with pytest.raises(TypeError):
+        session.add_applicant(make_person(4, aware, [12], friends=[2]))
+
+    assert session_state(session) == before
+    session.add_applicant(make_person(4, datetime(2024, 10, 1, 10), [12], friends=[2]))
+    assert session.groups[session.group_of[4]].MEMBERS == [session.people[1], session.people[2], session.people[4]]
+    assert session.placed_people() == 4
+
+
+async def request(port: int, method: str, path: str, body: dict) -> bytes:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    payload = json.dumps(body).encode('utf-8')
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode('latin-1') + payload)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+def test_post_application_with_offset_and_friend(session):
+    async def run():
+        service = PlacementService(session)
+        _, port = await service.start(port=0)
+        try:
+            return await request(port, 'POST', '/applications', {
+                'std_number': 4, 'fullname': 'Applicant 4', 'course_level': '1*',
+                'apply_date': '2024-10-01T10:00:00+03:00', 'course_slots': [12], 'friends': [2]})
+        finally:
+            await service.stop()
+
+    response = asyncio.run(run())
+
+    assert response.startswith(b'HTTP/1.1 201 ')
+    assert json.loads(response.split(b'\r\n\r\n', 1)[1])['group'] == [1, 2, 4]
+
+
+def test_unexpected_error_is_reported_as_500(session, monkeypatch):
+    def fail(person):
+        raise RuntimeError("broken session")
+
+    monkeypatch.setattr(session, 'add_applicant', fail)
+
+    async def run():
+        service = PlacementService(session)
+        _, port = await service.start(port=0)
+        try:
+            return await request(port, 'POST', '/applications', {
+                'std_number': 4, 'fullname': 'Applicant 4', 'course_level': '1*', 'course_slots': [12]})
+        finally:
+            await service.stop()
+
+    response = asyncio.run(run())
+
+    assert response.startswith(b'HTTP/1.1 500 ')
+    assert 'broken session' in json.loads(response.split(b'\r\n\r\n', 1)[1])['error']